@@ -2,9 +2,88 @@
 from __future__ import annotations
 from typing import List, Optional
 from game import Property, Railroad, Utility, Player, Game
+from markov import roll_landings
+
+MAX_DICE_SUM = 12
+
+
+class RentTable:
+    """What every owned title would charge right now, and who collects it.
+
+    Built from one pass over the board and reused until Board.version moves
+    (a title changes hands, a house/hotel is built or sold, or a title is
+    mortgaged or unmortgaged). Use rent_table(game) to get the current one."""
+
+    def __init__(self, board):
+        self.board = board
+        self.version = None
+
+    def refresh(self) -> "RentTable":
+        board = self.board
+        if self.version == board.version:
+            return self
+        spaces = board.spaces
+        self.owner = [None] * len(spaces)
+        self.rent = [0] * len(spaces)          # utilities: dice multiplier
+        self.worst = {}                        # owner -> worst single rent
+        for i in board.property_indices:
+            sp = spaces[i]
+            o = sp.owner
+            if o is None:
+                continue
+            r = sp.calculate_rent(o.has_monopoly(sp.color_group, board))
+            self._add(o, i, r, r)
+        for i in board.railroad_indices:
+            sp = spaces[i]
+            o = sp.owner
+            if o is not None:
+                r = sp.calculate_rent(o.count_railroads())
+                self._add(o, i, r, r)
+        for i in board.utility_indices:
+            sp = spaces[i]
+            o = sp.owner
+            if o is not None:
+                n = o.count_utilities()
+                mult = 10 if n == 2 else 4 if n == 1 else 0
+                # worst case ignores the mortgage, as the buffer always has
+                self._add(o, i, 0 if sp.is_mortgaged else mult, MAX_DICE_SUM * mult)
+        self.owned_ratio = board.owned_ratio()
+        self.version = board.version
+        return self
+
+    def _add(self, owner, index, rent, worst):
+        self.owner[index] = owner
+        self.rent[index] = rent
+        if worst > self.worst.get(owner, 0):
+            self.worst[owner] = worst
+
+    def threat(self, me: Player) -> int:
+        """Single worst rent anyone else could charge `me`."""
+        return max((r for o, r in self.worst.items() if o is not me), default=0)
+
+    def expected_next_roll(self, me: Player) -> float:
+        """Probability-weighted rent `me` pays on the next roll."""
+        total = 0.0
+        for p, i, roll in roll_landings(me.position):
+            o = self.owner[i]
+            if o is not None and o is not me:
+                r = self.rent[i]
+                total += p * (r * roll if self.board.spaces[i].type == "Utility" else r)
+        return total
+
+
+def rent_table(game: Game) -> RentTable:
+    """The game's RentTable, rebuilt only if the board changed since last use.
+    Kept on the board, so a Game.clone() never reuses its parent's table."""
+    board = game.board
+    table = board.__dict__.get("rent_table")
+    if table is None or table.board is not board:
+        table = board.rent_table = RentTable(board)
+    return table.refresh()
+
 
 class AIMonopolyPropertyManager:
-    MAX_DICE_SUM = 12
+    MAX_DICE_SUM = MAX_DICE_SUM
     EARLY_GAME_MIN_BUFFER = 180
     LATE_GAME_MIN_BUFFER  = 350
 
@@ -35,10 +114,7 @@ class AIMonopolyPropertyManager:
     def consider_management(self, game: Game, player: Player) -> None:
         if not player or player not in game.players:
             return
-        if (game.pending_debt or game.pending_rent or game.pending_purchase or
-            game.pending_tax or game.pending_build or game.pending_jail or
-            game.pending_jail_turn or game.pending_bankrupt_notice or
-            game.last_drawn_card or game.pending_trade):
+        if game.decision_pending():
             return
 
         buffer_needed = self._cash_buffer_needed(game, player)
@@ -89,93 +165,22 @@ class AIMonopolyPropertyManager:
         Estimate the single worst rent I could be forced to pay right now,
         then choose a buffer = max(threat, floor_min) where floor depends on game saturation.
         """
-        threat = 0
-        board = game.board
-
-        for sp in board.spaces:
-            # Owned by someone else?
-            owner = getattr(sp, "owner", None)
-            if owner is None or owner is me:
-                continue
-
-            if isinstance(sp, Property):
-                # Monopoly doubles base rent when unimproved
-                owner_has_monopoly = owner.has_monopoly(sp.color_group, board)
-                rent = sp.calculate_rent(owner_has_monopoly)
-                threat = max(threat, rent)
-
-            elif isinstance(sp, Railroad):
-                count = owner.count_railroads()
-                rent = sp.calculate_rent(count)
-                threat = max(threat, rent)
-
-            elif isinstance(sp, Utility):
-                # Worst-case utility: dice 12 * 10 if owner has 2 utilities
-                num_utils = owner.count_utilities()
-                if num_utils == 2:
-                    rent = self.MAX_DICE_SUM * 10
-                elif num_utils == 1:
-                    rent = self.MAX_DICE_SUM * 4
-                else:
-                    rent = 0
-                threat = max(threat, rent)
-
+        table = rent_table(game)
         # Rough saturation → raise the floor late game
-        props = [s for s in board.spaces if isinstance(s, Property)]
-        owned = sum(1 for s in props if getattr(s, "owner", None) is not None)
-        ratio = owned / (len(props) or 1)
-
-        floor = self.EARLY_GAME_MIN_BUFFER if ratio < 0.6 else self.LATE_GAME_MIN_BUFFER
-        return max(threat, floor)
+        floor = self.EARLY_GAME_MIN_BUFFER if table.owned_ratio < 0.6 else self.LATE_GAME_MIN_BUFFER
+        return max(table.threat(me), floor)
 
     def _owned_monopolies(self, game: Game, me: Player):
         """Return list of lists: each is the properties in a monopoly set that 'me' owns."""
-        monopolies = []
-        seen_colors = set()
-        for sp in game.board.spaces:
-            if isinstance(sp, Property) and sp.owner is me:
-                cg = sp.color_group
-                if cg in seen_colors:
-                    continue
-                seen_colors.add(cg)
-                group = [p for p in game.board.spaces
-                         if isinstance(p, Property) and p.color_group == cg]
-                # Own them all?
-                if all(p.owner is me for p in group):
-                    monopolies.append(sorted(group, key=lambda p: p.index))
-        return monopolies
+        spaces = game.board.spaces
+        return [[spaces[i] for i in idx]
+                for cg, idx in game.board.color_groups.items()
+                if cg in me.monopolies]
 
     def _max_rent_in_play(self, game: Game, me: Player) -> int:
         """Highest single rent I could be forced to pay right now, based on
         current improvements/ownership (no floor)."""
-        threat = 0
-        board = game.board
-        for sp in board.spaces:
-            owner = getattr(sp, "owner", None)
-            if owner is None or owner is me:
-                continue
-
-            if isinstance(sp, Property):
-                owner_has_monopoly = owner.has_monopoly(sp.color_group, board)
-                rent = sp.calculate_rent(owner_has_monopoly)
-                threat = max(threat, rent)
-
-            elif isinstance(sp, Railroad):
-                count = owner.count_railroads()
-                rent = sp.calculate_rent(count)
-                threat = max(threat, rent)
-
-            elif isinstance(sp, Utility):
-                # worst-case: 12 rolled
-                num_utils = owner.count_utilities()
-                if num_utils == 2:
-                    rent = self.MAX_DICE_SUM * 10
-                elif num_utils == 1:
-                    rent = self.MAX_DICE_SUM * 4
-                else:
-                    rent = 0
-                threat = max(threat, rent)
-        return threat
+        return rent_table(game).threat(me)
 
     def _try_unmortgage_titles(self, game: Game, me: Player) -> None:
         """
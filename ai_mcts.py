@@ -13,25 +13,28 @@ Usage (integration notes at bottom of file).
 """
 from __future__ import annotations
 from dataclasses import dataclass, field
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
+import atexit
 import math
 import random
+import time
+
+from game import LOG_QUIET, TurnPolicy, Action, Space, Player, Card
+from markov import color_weights
+from packed_state import PENDING_ATTRS
+from playout import Playout
 
 # --- Lightweight feature extraction & heuristics ----------------------------
 
-# Color weights approximate ROI/landing frequency (relative biases)
-COLOR_WEIGHTS = {
-    (255, 165, 0): 1.32,  # Orange
-    (255, 0, 0): 1.22,    # Red
-    (173, 216, 230): 1.18,# Light Blue
-    (255, 255, 0): 1.00,  # Yellow
-    (0, 255, 0): 0.95,    # Green
-    (255, 0, 255): 0.90,  # Pink
-    (150, 75, 0): 0.85,   # Brown
-    (0, 0, 139): 0.75,    # Dark Blue (swingy, expensive)
+# Color weights: payback speed of each group at three houses, read from the
+# exact landing table (see markov.py); rails/utilities stay hand-set
+COLOR_WEIGHTS = dict(color_weights())
+COLOR_WEIGHTS.update({
     "RAIL": 1.15,
     "UTIL": 0.25,
-}
+})
 
 # Rent escalation emphasis for houses up to 3
 HOUSE_STEP_WEIGHT = [0.0, 1.0, 1.8, 2.6, 1.0, 0.5]  # [base,1,2,3,4,hotel]
@@ -39,21 +42,130 @@ HOUSE_STEP_WEIGHT = [0.0, 1.0, 1.8, 2.6, 1.0, 0.5]  # [base,1,2,3,4,hotel]
 # Safety cash buffer (prefer to keep at least this much liquid)
 MIN_CASH_BUFFER = 150
 
+# Rollout value of a line that ends in our own bankruptcy
+BANKRUPT_VALUE = -1000.0
+
 try:
     from ai_manage import decide_and_apply_management
 except ImportError:
     decide_and_apply_management = None
 
-# --- Action representation --------------------------------------------------
-@dataclass(frozen=True)
-class Action:
-    kind: str
-    data: Tuple[Any, ...] = field(default_factory=tuple)
+# build/manage action -> (Game.confirm_build choice, title method)
+_MANAGE = {
+    "BUILD_HOUSE": ("house", "build_house"),
+    "BUILD_HOTEL": ("hotel", "build_hotel"),
+    "SELL_HOUSE": ("sell_house", "sell_house"),
+    "SELL_HOTEL": ("sell_hotel", "sell_hotel"),
+    "MORTGAGE": ("mortgage", "mortgage"),
+    "UNMORTGAGE": ("unmortgage", "unmortgage"),
+}
+
+# Compound management moves, see management_actions()
+MAX_MANAGE_ACTIONS = 10   # branching cap for one management decision
+BUILD_TARGETS = (3,)      # even-build levels always offered when affordable
+
+
+def _payoff(sp: Any) -> int:
+    return int(math.ceil(sp.mortgage_value * 1.10))
+
 
-    def __repr__(self) -> str:
-        if not self.data:
-            return self.kind
-        return f"{self.kind}{self.data!r}"
+def _level(sp: Any) -> int:
+    """Development of a title: houses, or 5 for a hotel."""
+    return 5 if sp.has_hotel else sp.num_houses
+
+
+def _build_cost(group: List[Any], level: int) -> Tuple[int, int, int]:
+    """(cash, houses, hotels) to even-build `group` up to `level`. Houses a
+    hotel hands back are not counted: they are needed on the way up."""
+    steps = houses = hotels = 0
+    for sp in group:
+        lv = _level(sp)
+        if lv < level:
+            steps += level - lv
+            houses += max(0, min(level, 4) - lv)
+            hotels += level == 5
+    return steps * group[0].house_cost, houses, hotels
+
+
+def _mortgage_set(titles: List[Any], need: int) -> Optional[Tuple[Any, ...]]:
+    """Fewest-dollars-over subset of `titles` whose mortgage values reach
+    `need` (ties: fewer titles), or None if they can't. Values are
+    multiples of $5, so this is a small subset-sum table."""
+    if need <= 0 or sum(sp.mortgage_value for sp in titles) < need:
+        return None
+    # best[v] = titles reaching exactly 5*v dollars
+    best: Dict[int, Tuple[Any, ...]] = {0: ()}
+    for sp in titles:
+        w = sp.mortgage_value // 5
+        for v, picked in list(best.items()):
+            u = v + w
+            if u not in best or len(best[u]) > len(picked) + 1:
+                best[u] = picked + (sp,)
+    target = -(-need // 5)
+    return best[min(v for v in best if v >= target)]
+
+
+def management_actions(game: Any, me: Any, need: int = 0,
+                       limit: int = MAX_MANAGE_ACTIONS) -> List[Action]:
+    """Compound build/sell/mortgage moves for search, pruned to `limit`.
+
+    need <= 0 (free to develop): BUILD_SET (group, level) even-builds a clean
+    monopoly to the next level, to each of BUILD_TARGETS and to the highest
+    level cash allows; MORTGAGE_SET (titles...) raises exactly what the next
+    unaffordable build is short, from titles outside that set; UNMORTGAGE
+    pays off a title when MIN_CASH_BUFFER survives.
+    need > 0 (raising cash): MORTGAGE_SET reaching `need` with the fewest
+    dollars over, mortgaging loose titles before monopoly members, and per
+    built-up set the smallest SELL_SET (group, level) that covers it."""
+    board = game.board
+    spaces = board.spaces
+    cash = me.money
+    groups = {cg: [spaces[i] for i in board.color_groups[cg]] for cg in me.monopolies}
+    mortgageable = [sp for sp in me.properties_owned if sp.can_mortgage(me, board)[0]]
+    acts: List[Action] = []
+
+    if need > 0:
+        loose = [sp for sp in mortgageable if getattr(sp, "color_group", None) not in groups]
+        for pool in (loose, mortgageable):
+            picked = _mortgage_set(pool, need)
+            if picked:
+                acts.append(Action("MORTGAGE_SET", picked))
+                break
+        for cg, group in groups.items():
+            top = max(_level(sp) for sp in group)
+            if not top:
+                continue
+            half = group[0].house_cost // 2
+            for level in range(top - 1, -1, -1):
+                if level == 0 or sum(max(0, _level(sp) - level) for sp in group) * half >= need:
+                    acts.append(Action("SELL_SET", (cg, level)))
+                    break
+        return acts[:limit]
+
+    for cg, group in groups.items():
+        if any(sp.is_mortgaged for sp in group):
+            continue
+        low = min(_level(sp) for sp in group)
+        reachable = []
+        for level in range(low + 1, 6):
+            cost, houses, hotels = _build_cost(group, level)
+            if houses > game.houses_remaining or hotels > game.hotels_remaining:
+                break
+            if cost > cash:
+                if not reachable:
+                    outside = [sp for sp in mortgageable if sp not in group]
+                    picked = _mortgage_set(outside, cost - cash)
+                    if picked:
+                        acts.append(Action("MORTGAGE_SET", picked))
+                break
+            reachable.append(level)
+        if reachable:
+            keep = {reachable[0], reachable[-1]}.union(t for t in BUILD_TARGETS if t in reachable)
+            acts.extend(Action("BUILD_SET", (cg, level)) for level in sorted(keep))
+    for sp in me.properties_owned:
+        if getattr(sp, "is_mortgaged", False) and cash - _payoff(sp) >= MIN_CASH_BUFFER:
+            acts.append(Action("UNMORTGAGE", (sp,)))
+    return acts[:limit]
 
 
 # --- Game adapter: read-only view of what matters to the AI -----------------
@@ -71,9 +183,11 @@ class Snapshot:
         house_val = 0
         for sp in self.me.properties_owned:
             cost = getattr(sp, "cost", 0) or 0
-            if getattr(sp, "type", "") == "Railroad":
+            if getattr(sp, "is_mortgaged", False):
+                prop_val -= _payoff(sp)  # owed back before it earns again
+            if sp.type == "Railroad":
                 prop_val += cost * COLOR_WEIGHTS["RAIL"]
-            elif getattr(sp, "type", "") == "Utility":
+            elif sp.type == "Utility":
                 prop_val += cost * COLOR_WEIGHTS["UTIL"]
             else:
                 w = COLOR_WEIGHTS.get(getattr(sp, "color_group", None), 0.8)
@@ -85,18 +199,31 @@ class Snapshot:
                     n = getattr(sp, "num_houses", 0)
                     for i in range(1, n + 1):
                         house_val += sp.house_cost * HOUSE_STEP_WEIGHT[i]
-        # Slight bonus for monopolies
+        # Slight bonus for monopolies (per title in a completed set)
         mono_bonus = 0
-        for sp in self.game.board.spaces:
-            if getattr(sp, "type", "") == "Property" and getattr(sp, "owner", None) is self.me:
-                mates = [q for q in self.game.board.spaces
-                         if getattr(q, "type", "") == "Property" and getattr(q, "color_group", None) == sp.color_group]
-                if all(getattr(q, "owner", None) is self.me for q in mates):
-                    mono_bonus += 100  # small shaping reward per set
+        for cg in self.me.monopolies:
+            mono_bonus += 100 * len(self.game.board.color_groups[cg])  # small shaping reward per set
         return int(cash + prop_val + house_val + mono_bonus)
 
 
 # --- MCTS core --------------------------------------------------------------
+# Actions whose result the dice decide. Their child is a chance node whose
+# children are the outcomes seen so far, one per dice sum (doubles apart)
+# and card drawn, each weighted by its probability. Rolls that leave the
+# player where they were (a missed jail roll) are one outcome.
+CHANCE_KINDS = frozenset({"JAIL_ROLL"})
+
+
+class NodeStats:
+    """Visit count and value total; nodes standing for the same position
+    share one through a TranspositionTable."""
+    __slots__ = ("visits", "total_value")
+
+    def __init__(self):
+        self.visits = 0
+        self.total_value = 0.0
+
+
 @dataclass
 class Node:
     state: Snapshot
@@ -104,123 +231,187 @@ class Node:
     action_from_parent: Optional[Action]
     untried_actions: List[Action]
     children: List['Node'] = field(default_factory=list)
-    visits: int = 0
-    total_value: float = 0.0
+    stats: NodeStats = field(default_factory=NodeStats)
+    key: int = 0   # Game.fingerprint() of the position this node stands for
+    chance: bool = False      # children are outcomes of action_from_parent
+    outcome: Any = None       # (dice sum, doubles, card index or -1), or STAY, under a chance node
+    prob: float = 1.0         # probability of `outcome`
+
+    @property
+    def visits(self) -> int:
+        return self.stats.visits
+
+    @property
+    def total_value(self) -> float:
+        return self.stats.total_value
+
+    def mean(self) -> float:
+        """Average value; for a chance node, the probability-weighted average
+        over the outcomes seen so far."""
+        if self.chance and self.children:
+            w = v = 0.0
+            for ch in self.children:
+                st = ch.stats
+                if st.visits:
+                    w += ch.prob
+                    v += ch.prob * st.total_value / st.visits
+            if w:
+                return v / w
+        st = self.stats
+        return st.total_value / st.visits
 
     def uct_select_child(self, c: float = 1.35) -> "Node":
         best, best_score = None, -1e9
+        log_n = math.log(self.stats.visits + 1)
         for ch in self.children:
-            if ch.visits == 0:
+            n = ch.stats.visits
+            if n == 0:
                 score = float("inf")
             else:
-                exploit = ch.total_value / ch.visits
-                explore = c * math.sqrt(math.log(self.visits + 1) / ch.visits)
-                score = exploit + explore
+                score = ch.mean() + c * math.sqrt(log_n / n)
             if score > best_score:
                 best, best_score = ch, score
         return best
 
-    def add_child(self, action: Action, state: Snapshot, actions: List[Action]) -> "Node":
-        child = Node(state=state, parent=self, action_from_parent=action, untried_actions=actions)
+    def add_child(self, action: Action, state: Snapshot, actions: List[Action], key: int = 0,
+                  stats: Optional[NodeStats] = None, chance: bool = False) -> "Node":
+        child = Node(state=state, parent=self, action_from_parent=action, untried_actions=actions,
+                     stats=stats or NodeStats(), key=key, chance=chance)
         self.children.append(child)
         self.untried_actions.remove(action)
         return child
 
     def update(self, value: float) -> None:
-        self.visits += 1
-        self.total_value += value
+        st = self.stats
+        st.visits += 1
+        st.total_value += value
+
+
+class TranspositionTable:
+    """Bounded map from a position to the NodeStats every node standing for
+    it shares, within one search and across searches. The same position
+    reached by different move orders (mortgage A then B, or B then A) pools
+    its statistics. Keys identify the state exactly (see _state_key);
+    past `capacity` the least recently used entry is evicted (nodes still
+    holding it keep it, unshared), so memory stays flat however long the
+    session runs."""
+
+    def __init__(self, capacity: int = 20000):
+        self.capacity = capacity
+        self.entries: "OrderedDict[Tuple[Any, ...], NodeStats]" = OrderedDict()
+        self.hits = 0
+        self.evictions = 0
+
+    def lookup(self, key: Tuple[Any, ...]) -> NodeStats:
+        entries = self.entries
+        st = entries.get(key)
+        if st is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return st
+        st = entries[key] = NodeStats()
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return st
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+@dataclass
+class SearchStats:
+    """What one mcts_decide call did (pass one in to have it filled)."""
+    iterations: int = 0
+    nodes: int = 0            # tree size including the root (summed over workers)
+    max_depth: int = 0        # deepest node reached
+    elapsed_ms: float = 0.0
+    workers: int = 1
+    timed_out: bool = False   # the budget stopped it before `iterations`
+    reused: int = 0           # nodes carried over from the previous decision
+    shared: int = 0           # new nodes that found their stats in the table
+
+
+class SearchTree:
+    """What one search leaves for the next: per seat, the subtree under the
+    action it chose. mcts_decide(tree=...) re-roots it when the new position
+    is one that subtree already stands for (same Game.fingerprint() and the
+    same legal actions), so its visits count towards the new decision and
+    only the remainder of `iterations` is searched. A kept subtree that
+    doesn't match is dropped, and with it every node it held."""
+
+    def __init__(self):
+        self.kept: Dict[int, Tuple[bool, Node]] = {}
+
+    def reroot(self, game: Any, me: Any, legal: List[Action], manage: bool) -> Optional[Node]:
+        entry = self.kept.pop(me.seat, None)
+        if entry is None or entry[0] != manage:
+            return None
+        key = game.fingerprint()
+        want = {_action_key(a): a for a in legal}
+        stack = [entry[1]]
+        while stack:
+            node = stack.pop()
+            if node.key == key and _node_keys(node) == want.keys():
+                node.parent = node.action_from_parent = None
+                node.state = Snapshot(game, me)
+                node.untried_actions = [want[_action_key(a)] for a in node.untried_actions]
+                for ch in node.children:
+                    ch.action_from_parent = want[_action_key(ch.action_from_parent)]
+                return node
+            stack.extend(node.children)
+        return None
+
+    def keep(self, me: Any, manage: bool, node: Node) -> None:
+        node.parent = None   # let the rest of the old tree go
+        self.kept[me.seat] = (manage, node)
+
+
+def _node_keys(node: Node):
+    keys = {_action_key(a) for a in node.untried_actions}
+    keys.update(_action_key(ch.action_from_parent) for ch in node.children)
+    return keys
+
+
+def _tree_size(node: Node) -> int:
+    n, stack = 0, [node]
+    while stack:
+        node = stack.pop()
+        n += 1
+        stack.extend(node.children)
+    return n
 
 
 # --- Action generators tied to the real Game APIs --------------------------
 class ActionModel:
-    def __init__(self, game: Any, me: Any):
+    def __init__(self, game: Any, me: Any, manage: bool = False):
         self.game = game
         self.me = me
+        # also offer management_actions(): on my turn with nothing open, and
+        # in place of the fixed RAISE_CASH rule when I owe a debt
+        self.manage = manage
 
-    # Generate legal actions constrained to current pending modal/state
+    # Legal actions for the decision `me` owes (Game.legal_actions), with the
+    # jail strategy applied on top
     def legal_actions(self) -> List[Action]:
         g = self.game
         me = self.me
-        acts: List[Action] = []
-
-        # Debt handling
-        if g.pending_debt and g.pending_debt.get("player") is me:
-            amt = g.pending_debt["amount"]
-            if me.money >= amt:
-                acts.append(Action("PAY_DEBT"))
-            acts.append(Action("RAISE_CASH"))
-            acts.append(Action("BANKRUPT"))
-            return acts
-
-        # Jail-turn option modal
-        if g.pending_jail_turn and g.pending_jail_turn.get("player") is me:
-            props = [s for s in g.board.spaces if getattr(s, "type", "") == "Property"]
-            total_props = len(props) or 1
-            owned_props = sum(1 for s in props if getattr(s, "owner", None) is not None)
-            owned_ratio = owned_props / total_props
-            EARLY = owned_ratio < 0.50
-            forced_third = (me.jail_turns >= 2)
-
-            acts: List[Action] = []
-            if EARLY:
-                if me.get_out_of_jail_free_cards > 0:
-                    acts.append(Action("JAIL_USE_GOJF"))
-                if me.money >= 50:
-                    acts.append(Action("JAIL_PAY"))
-                acts.append(Action("JAIL_ROLL"))
-            else:
-                if not forced_third:
-                    acts.append(Action("JAIL_ROLL"))
-                if me.get_out_of_jail_free_cards > 0:
-                    acts.append(Action("JAIL_USE_GOJF"))
-                if me.money >= 50:
-                    acts.append(Action("JAIL_PAY"))
-                if not acts:
-                    acts.append(Action("JAIL_ROLL"))
-            return acts
-
-        # Immediate send-to-jail notice (ack only)
-        if g.pending_jail and g.pending_jail.get("player") is me:
-            acts.append(Action("ACK_GO_TO_JAIL"))
-            return acts
-
-        # Purchase decision
-        if g.pending_purchase and g.pending_purchase.get("player") is me:
-            prop = g.pending_purchase["property"]
-            affordable = g.pending_purchase.get("affordable", True)
-            if affordable:
-                acts.append(Action("BUY", (prop,)))
-            acts.append(Action("SKIP_PURCHASE", (prop,)))
-            return acts
-
-        # Rent & Tax
-        if g.pending_rent and g.pending_rent.get("player") is me:
-            acts.append(Action("PAY_RENT"))
-            return acts
-        if g.pending_tax and g.pending_tax.get("player") is me:
-            acts.append(Action("PAY_TAX"))
-            return acts
-
-        # Build/manage popup (opened when landing on own property or from Manage UI)
-        if g.pending_build and g.pending_build.get("player") is me:
-            info = g.pending_build
-            if info.get("can_house"):
-                acts.append(Action("BUILD_HOUSE", (info["property"],)))
-            if info.get("can_hotel"):
-                acts.append(Action("BUILD_HOTEL", (info["property"],)))
-            if info.get("can_sell_house"):
-                acts.append(Action("SELL_HOUSE", (info["property"],)))
-            if info.get("can_sell_hotel"):
-                acts.append(Action("SELL_HOTEL", (info["property"],)))
-            if info.get("can_mortgage"):
-                acts.append(Action("MORTGAGE", (info["property"],)))
-            if info.get("can_unmortgage"):
-                acts.append(Action("UNMORTGAGE", (info["property"],)))
-            acts.append(Action("SKIP_BUILD"))
-            return acts
-
-        # If none of the above, default to NOOP (driver will decide to roll/end)
-        acts.append(Action("NOOP"))
+        acts = list(g.legal_actions(me, manage=False))
+
+        if self.manage:
+            if acts[-1].kind == "BANKRUPT":
+                need = g.pending_debt["amount"] - me.money
+                return [a for a in acts if a.kind != "RAISE_CASH"][:-1] + \
+                    management_actions(g, me, need) + acts[-1:]
+            if len(g.legal_actions(me)) > 1:   # my turn, nothing open
+                return management_actions(g, me) + acts
+
+        # Jail turn: get out early game; linger mid/late and only pay on the
+        # forced third attempt
+        if acts[-1].kind == "JAIL_ROLL" and g.board.owned_ratio() >= 0.50:
+            roll = acts.pop()
+            if me.jail_turns < 2 or not acts:
+                acts.insert(0, roll)
         return acts
 
     # Apply an action to the real Game (one step); return a new Snapshot
@@ -292,7 +483,7 @@ class ActionModel:
             g.roll_for_doubles_from_jail(me); return Snapshot(g, me)
         
         if kind == "ACK_GO_TO_JAIL":
-            g.pending_jail = None
+            g.pending_jail = [j for j in (g.pending_jail or []) if j.get("player") is not me]
             me.in_jail = True
             me.position = g.board.jail_space_index
             me.jail_turns = 0
@@ -310,37 +501,87 @@ class ActionModel:
         if kind == "PAY_TAX":
             g.confirm_tax(); return Snapshot(g, me)
 
-        if kind == "BUILD_HOUSE":
-            g.confirm_build("house"); return Snapshot(g, me)
-        
-        if kind == "BUILD_HOTEL":
-            g.confirm_build("hotel"); return Snapshot(g, me)
-        
-        if kind == "SELL_HOUSE":
-            g.confirm_build("sell_house"); return Snapshot(g, me)
-        
-        if kind == "SELL_HOTEL":
-            g.confirm_build("sell_hotel"); return Snapshot(g, me)
-        
-        if kind == "MORTGAGE":
-            g.confirm_build("mortgage"); return Snapshot(g, me)
-        
-        if kind == "UNMORTGAGE":
-            g.confirm_build("unmortgage"); return Snapshot(g, me)
+        if kind == "BUILD_SET" or kind == "SELL_SET":
+            cg, level = a.data
+            group = [g.board.spaces[i] for i in g.board.color_groups[cg]]
+            (_build_to if kind == "BUILD_SET" else _sell_to)(g, me, group, level)
+            return Snapshot(g, me)
+
+        if kind == "MORTGAGE_SET":
+            for sp in a.data:
+                sp = g.board.spaces[sp.index]
+                if sp.can_mortgage(me, g.board)[0]:
+                    sp.mortgage(me)
+            return Snapshot(g, me)
+
+        if kind in _MANAGE:
+            info = g.pending_build
+            confirm, method = _MANAGE[kind]
+            if info and info.get("player") is me:
+                g.confirm_build(confirm)
+            else:
+                getattr(g.board.spaces[a.data[0].index], method)(me)
+            return Snapshot(g, me)
+
+        if kind == "ACCEPT_TRADE":
+            g.accept_trade(); return Snapshot(g, me)
+
+        if kind == "REJECT_TRADE":
+            g.reject_trade(); return Snapshot(g, me)
 
         return Snapshot(g, me)
 
 
+def _build_to(g: Any, me: Any, group: List[Any], level: int) -> None:
+    """Build evenly (least-developed title first) until every title in
+    `group` reaches `level`, stopping at the first move the rules refuse."""
+    while True:
+        sp = min(group, key=_level)
+        lv = _level(sp)
+        if lv >= level:
+            return
+        if lv < 4 and sp.can_build_house(me, g.board)[0]:
+            sp.build_house(me)
+        elif lv == 4 and sp.can_build_hotel(me, g.board)[0]:
+            sp.build_hotel(me)
+        else:
+            return
+
+
+def _sell_to(g: Any, me: Any, group: List[Any], level: int) -> None:
+    """Sell evenly (most-developed title first) down to `level`."""
+    while True:
+        sp = max(group, key=_level)
+        lv = _level(sp)
+        if lv <= level:
+            return
+        if lv == 5 and sp.can_sell_hotel(me, g.board)[0]:
+            sp.sell_hotel(me)
+        elif lv < 5 and sp.can_sell_house(me, g.board)[0]:
+            sp.sell_house(me)
+        else:
+            return
+
+
 # --- Rollout policy ---------------------------------------------------------
-def rollout_value(s: Snapshot) -> float:
-    """Stochastic rollout: we don’t simulate future dice; instead, evaluate
-    with a shaped heuristic and a small random jitter to break ties.
+def rollout_value(s: Snapshot, rng: random.Random, turns: int = 0, playouts: int = 1,
+                  po: Optional[Playout] = None) -> float:
+    """Evaluate with a shaped heuristic and a small random jitter (from the
+    searching bot's own `rng`) to break ties. With turns > 0, `playouts`
+    truncated playouts of that many turns are run on playout.Playout and
+    the average change in my worth over them is added; pass `po` to load
+    the position into an existing Playout instead of making one.
     """
+    if s.me not in s.game.players:
+        return BANKRUPT_VALUE
     base = s.net_worth()
+    debt = s.game.pending_debt
+    if debt and debt.get("player") is s.me:
+        base -= debt["amount"]  # still owed, however the cash was raised
     # Encourage house count reaching 3 across strong colors
     three_house_push = 0
     for sp in s.me.properties_owned:
-        if getattr(sp, "type", "") == "Property":
+        if sp.type == "Property":
             n = getattr(sp, "num_houses", 0)
             if n == 3:
                 w = COLOR_WEIGHTS.get(getattr(sp, "color_group", None), 1.0)
@@ -349,54 +590,411 @@ def rollout_value(s: Snapshot) -> float:
     cash_pen = 0
     if s.me.money < MIN_CASH_BUFFER:
         cash_pen = (MIN_CASH_BUFFER - s.me.money) * 0.20
-    return base + three_house_push - cash_pen + random.uniform(-5, 5)
+    value = base + three_house_push - cash_pen + rng.uniform(-5, 5)
+    if turns:
+        po = po.load(s.game) if po is not None else Playout(s.game)
+        seat = s.game.players.index(s.me)
+        start = po.worth(seat)
+        swing = 0
+        for _ in range(playouts):
+            po.reset()
+            swing += po.run(rng, turns).worth(seat) - start
+        value += swing / playouts
+    return value
 
 
 # --- Search driver ----------------------------------------------------------
-def mcts_decide(game: Any, me: Any, iterations: int = 400) -> Action:
-    def _shadow_apply(model: ActionModel, action: Action) -> Snapshot:
-        # Return a Snapshot without mutating the real game. A proper clone-based
-        # simulator would go here; for safety we just no-op during search.
-        return Snapshot(model.game, model.me)
-
-    model = ActionModel(game, me)
-    root_state = Snapshot(game, me)
-    root = Node(state=root_state, parent=None, action_from_parent=None, untried_actions=model.legal_actions())
-
-    if not root.untried_actions:
-        return Action("NOOP")
-
-    for _ in range(iterations):
+def _shadow_apply(sim: Any, me: Any, action: Action) -> Snapshot:
+    """Apply `action` to a forked game (see Game.clone) and return the result."""
+    return ActionModel(sim, me).apply(action)
+
+
+def _next_actions(sim: Any, me: Any, manage: bool) -> List[Action]:
+    """Actions for the node at the fork's position; none once the decision
+    chain has resolved (or always, in manage mode: one move per search)."""
+    acts = ActionModel(sim, me, manage).legal_actions()
+    if manage or (len(acts) == 1 and acts[0].kind == "NOOP"):
+        return []
+    return acts
+
+
+def _canon(v: Any) -> Any:
+    """Hashable, game-independent form of a modal value: players become
+    seats, spaces board indices and cards catalog indices."""
+    if isinstance(v, Player):
+        return ("P", v.seat)
+    if isinstance(v, Space):
+        return ("S", v.index)
+    if isinstance(v, Card):
+        return ("C", v.catalog_index)
+    if isinstance(v, dict):
+        return tuple((k, _canon(x)) for k, x in v.items())
+    if isinstance(v, (list, tuple)):
+        return tuple(_canon(x) for x in v)
+    return v
+
+
+def _state_key(g: Any, me: Any, manage: bool) -> Tuple[Any, ...]:
+    """Transposition key for `me` searching at g's position: the board
+    (Game.fingerprint()) plus everything the fingerprint buckets or leaves
+    out - exact cash, GOJF cards, jail attempts and doubles per seat, and
+    the contents of every open modal (debt amount, trade offer, ...)."""
+    players = g.players
+    modals = ()
+    if g.decision_pending():
+        modals = tuple((a, _canon(v)) for a in PENDING_ATTRS for v in (getattr(g, a),) if v)
+    return (g.fingerprint(), me.seat, manage,
+            tuple(p.money for p in players),
+            tuple(p.get_out_of_jail_free_cards for p in players),
+            tuple(p.jail_turns for p in players),
+            tuple(p.doubles_rolled_consecutive for p in players),
+            modals)
+
+
+def _table_stats(table: Optional[TranspositionTable], sim: Any, me: Any, manage: bool,
+                 stats: Optional[SearchStats]) -> Optional[NodeStats]:
+    if table is None:
+        return None
+    hits = table.hits
+    st = table.lookup(_state_key(sim, me, manage))
+    if stats is not None and table.hits != hits:
+        stats.shared += 1
+    return st
+
+
+STAY = ("stay",)   # the roll left the player in place: every non-double
+
+
+def _chance_outcome(sim: Any, me: Any, drawn_before: int) -> Tuple[Any, float]:
+    """The outcome the fork's last roll produced and its probability: STAY
+    if `me` is still in jail, else the dice sum (doubles apart) times, if
+    the move drew a card, 1 / cards left in that pile."""
+    d1, d2 = sim.dice.die1_value, sim.dice.die2_value
+    if me.in_jail:
+        return STAY, 30 / 36
+    total = d1 + d2
+    p = 1 / 36 if d1 == d2 else (6 - abs(total - 7) - (total % 2 == 0)) / 36
+    card = -1
+    if len(sim.chance_cards) + len(sim.community_chest_cards) < drawn_before:
+        drawn = sim.last_drawn_card
+        card = drawn.catalog_index
+        pile = sim.chance_cards if drawn.card_type == "Chance" else sim.community_chest_cards
+        p /= len(pile) + 1
+    return (total, d1 == d2, card), p
+
+
+def _roll(node: Node, sim: Any, me: Any, rng: random.Random, manage: bool,
+          table: Optional[TranspositionTable], stats: Optional[SearchStats]
+          ) -> Tuple[Node, Snapshot, int]:
+    """Play chance node `node`'s action on the fork and step to the outcome
+    it produced, adding that outcome on first sight. The fork's piles are
+    reshuffled first, so the search never reads the real card order.
+    Returns (outcome node, position, nodes added)."""
+    sim.chance_cards.shuffle(rng)
+    sim.community_chest_cards.shuffle(rng)
+    before = len(sim.chance_cards) + len(sim.community_chest_cards)
+    state = _shadow_apply(sim, me, node.action_from_parent)
+    outcome, p = _chance_outcome(sim, me, before)
+    for ch in node.children:
+        if ch.outcome == outcome:
+            return ch, state, 0
+    child = Node(state=state, parent=node, action_from_parent=node.action_from_parent,
+                 untried_actions=_next_actions(sim, me, manage),
+                 stats=_table_stats(table, sim, me, manage, stats) or NodeStats(),
+                 key=sim.fingerprint(), outcome=outcome, prob=p)
+    node.children.append(child)
+    return child, state, 1
+
+
+def mcts_decide(game: Any, me: Any, iterations: int = 400,
+                rng: Optional[random.Random] = None, manage: bool = False,
+                workers: int = 1, budget_ms: Optional[float] = None,
+                stats: Optional[SearchStats] = None,
+                tree: Optional[SearchTree] = None,
+                table: Optional[TranspositionTable] = None,
+                rollout_turns: int = 0, rollouts: int = 1) -> Action:
+    """Pick an action for `me` by UCT search. All search randomness comes from
+    `rng` (the bot's own stream), never from the game's dice or decks.
+    manage=True searches the compound management moves too (see
+    ActionModel), one move per call: MCTSPolicy chains them.
+    workers > 1 searches root-parallel: that many processes each grow their
+    own `iterations`-deep tree and the root visit counts are summed.
+    budget_ms makes it anytime: the search stops at whichever comes first,
+    `iterations` or the deadline, and answers with the best action so far.
+    `stats`, if given, is filled in (see SearchStats).
+    With a SearchTree, a serial search starts from the subtree kept by the
+    previous call when it still matches, and keeps the chosen one for the next.
+    With a TranspositionTable, nodes for the same position share statistics
+    (serial search only, like the tree). rollout_turns > 0 scores each leaf
+    with `rollouts` playouts of that many turns (see rollout_value)."""
+    t0 = time.perf_counter()
+    if stats is None:
+        stats = SearchStats()
+    stats.workers = workers
+    deadline = t0 + budget_ms / 1000.0 if budget_ms is not None else None
+    if rng is None:
+        rng = random.Random()
+    legal = ActionModel(game, me, manage).legal_actions()
+    if len(legal) <= 1:
+        stats.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        return legal[0] if legal else Action("NOOP")
+
+    if workers > 1:
+        visits = _root_parallel(game, me, iterations, rng, manage, workers, deadline, stats,
+                                rollout_turns, rollouts)
+        best = max(legal, key=lambda a: visits.get(_action_key(a), (0, 0.0)))
+    else:
+        root = tree.reroot(game, me, legal, manage) if tree is not None else None
+        if root is not None:
+            stats.reused = _tree_size(root)
+            stats.nodes += stats.reused
+            # the inherited visits already count; search only what is missing
+            iterations = max(iterations - root.visits, len(root.untried_actions))
+        root = _grow_tree(game, me, legal, iterations, rng, manage, deadline, stats, root, table,
+                          rollout_turns, rollouts)
+        # Pick the most-visited child
+        if not root.children:
+            best = rng.choice(root.untried_actions)
+        else:
+            child = max(root.children, key=lambda c: c.visits)
+            best = child.action_from_parent or Action("NOOP")
+            if tree is not None:
+                tree.keep(me, manage, child)
+    stats.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    return best
+
+
+def _grow_tree(game: Any, me: Any, legal: List[Action], iterations: int,
+               rng: random.Random, manage: bool, deadline: Optional[float] = None,
+               stats: Optional[SearchStats] = None, root: Optional[Node] = None,
+               table: Optional[TranspositionTable] = None, rollout_turns: int = 0,
+               rollouts: int = 1) -> Node:
+    """Grow a UCT tree for `me` from `legal` (or on from `root`), for
+    `iterations` or until time.perf_counter() passes `deadline`; counts go
+    into `stats`, node statistics are shared through `table`."""
+    fresh = root is None
+    if fresh:
+        root = Node(state=Snapshot(game, me), parent=None, action_from_parent=None,
+                    untried_actions=list(legal), key=game.fingerprint(),
+                    stats=_table_stats(table, game, me, manage, None) or NodeStats())
+    seat = game.players.index(me)
+
+    # Every iteration replays its path on a fork of the live game, so children
+    # are scored on the position the action actually produces. The fork is
+    # built once; each iteration is undone with Game.push/pop. The fork's dice
+    # keep running across iterations, so lines sample different rolls.
+    sim = game.clone()
+    sim.set_logging(LOG_QUIET)
+    sim_me = sim.players[seat]
+    po = Playout() if rollout_turns else None   # reloaded at every leaf
+
+    done = nodes = max_depth = 0
+    clock = time.perf_counter
+    while done < iterations and (deadline is None or clock() < deadline):
+        done += 1
         node = root
-        state = Snapshot(game, me)
-        local_model = ActionModel(game, me)
+        depth = 0
+        sim.push(restore_rng=False)
+        state = Snapshot(sim, sim_me)
 
         # Selection
         while not node.untried_actions and node.children:
             node = node.uct_select_child()
-            state = _shadow_apply(local_model, node.action_from_parent)
-            local_model = ActionModel(game, me)
+            depth += 1
+            if node.chance:
+                node, state, added = _roll(node, sim, sim_me, rng, manage, table, stats)
+                nodes += added
+                depth += 1
+            else:
+                state = _shadow_apply(sim, sim_me, node.action_from_parent)
 
         # Expansion
         if node.untried_actions:
-            a = random.choice(node.untried_actions)
-            state = _shadow_apply(local_model, a)
-            local_model = ActionModel(game, me)
-            node = node.add_child(a, state, local_model.legal_actions())
+            a = rng.choice(node.untried_actions)
+            if a.kind in CHANCE_KINDS:
+                node = node.add_child(a, Snapshot(sim, sim_me), [], chance=True)
+                node, state, added = _roll(node, sim, sim_me, rng, manage, table, stats)
+                nodes += 1 + added
+                depth += 2
+            else:
+                state = _shadow_apply(sim, sim_me, a)
+                acts = _next_actions(sim, sim_me, manage)
+                node = node.add_child(a, state, acts, sim.fingerprint(),
+                                      _table_stats(table, sim, sim_me, manage, stats))
+                nodes += 1
+                depth += 1
+        if depth > max_depth:
+            max_depth = depth
 
         # Rollout (heuristic evaluation)
-        value = rollout_value(state)
+        value = rollout_value(state, rng, rollout_turns, rollouts, po)
 
         # Backprop
         while node is not None:
             node.update(value)
             node = node.parent
+        sim.pop()
+
+    if stats is not None:
+        stats.iterations += done
+        stats.nodes += nodes + fresh
+        stats.max_depth = max(stats.max_depth, max_depth)
+        stats.timed_out = stats.timed_out or done < iterations
+    return root
+
+
+# --- Root-parallel search ---------------------------------------------------
+# Workers get the position as a savegame (no RNG state) plus a seed of their
+# own for the dice, the decks and the tree policy, so their trees are
+# independent samples. Root statistics come back keyed by _action_key and
+# are summed; the pool persists across decisions.
+_POOL = None
+_POOL_SIZE = 0
+_WORKER_GAMES: Dict[int, Any] = {}   # per-process scratch Game per player count
+
+
+def _action_key(a: Action) -> Tuple[Any, ...]:
+    """Process-independent identity of an action: spaces become indices."""
+    return (a.kind,) + tuple(x.index if isinstance(x, Space) else x for x in a.data)
+
+
+def worker_pool(workers: int) -> ProcessPoolExecutor:
+    """The shared search pool, (re)started with `workers` processes."""
+    global _POOL, _POOL_SIZE
+    if _POOL is None or _POOL_SIZE != workers:
+        shutdown_pool()
+        _POOL, _POOL_SIZE = ProcessPoolExecutor(max_workers=workers), workers
+    return _POOL
+
+
+def shutdown_pool() -> None:
+    global _POOL, _POOL_SIZE
+    if _POOL is not None:
+        _POOL.shutdown()
+        _POOL, _POOL_SIZE = None, 0
+
+atexit.register(shutdown_pool)
+
+
+def _root_worker(data: bytes, n: int, auctions: Any, seat: int, iterations: int,
+                 seed: int, manage: bool, budget_s: Optional[float], rollout_turns: int = 0,
+                 rollouts: int = 1) -> Tuple[List[Tuple[Any, int, float]], SearchStats]:
+    from savegame import loads
+    game = _WORKER_GAMES.get(n)
+    game = _WORKER_GAMES[n] = loads(data, into=game, verbosity=LOG_QUIET)
+    game.auctions = auctions
+    game.dice.rng.seed(seed)
+    game.deck_rng.seed(seed + 1)
+    me = game.players[seat]
+    legal = ActionModel(game, me, manage).legal_actions()
+    # clocks differ between processes: the deadline travels as time left
+    deadline = time.perf_counter() + budget_s if budget_s is not None else None
+    stats = SearchStats()
+    root = _grow_tree(game, me, legal, iterations, random.Random(seed), manage, deadline, stats,
+                      rollout_turns=rollout_turns, rollouts=rollouts)
+    return [(_action_key(c.action_from_parent), c.visits, c.total_value) for c in root.children], stats
+
+
+def _root_parallel(game: Any, me: Any, iterations: int, rng: random.Random,
+                   manage: bool, workers: int, deadline: Optional[float] = None,
+                   stats: Optional[SearchStats] = None, rollout_turns: int = 0,
+                   rollouts: int = 1) -> Dict[Tuple[Any, ...], Tuple[int, float]]:
+    """Summed (visits, total value) per root action key over `workers` trees."""
+    from savegame import dumps
+    data = dumps(game, rng=False)
+    seat = game.players.index(me)
+    pool = worker_pool(workers)
+    budget_s = None
+    if deadline is not None:
+        # leave a slice of the budget for the round trip back
+        budget_s = max(0.0, (deadline - time.perf_counter()) * 0.8)
+    jobs = [pool.submit(_root_worker, data, len(game.players), game.auctions, seat,
+                        iterations, rng.getrandbits(62), manage, budget_s, rollout_turns, rollouts)
+            for _ in range(workers)]
+    merged: Dict[Tuple[Any, ...], Tuple[int, float]] = {}
+    for job in jobs:
+        children, worker_stats = job.result()
+        for key, visits, value in children:
+            v, t = merged.get(key, (0, 0.0))
+            merged[key] = (v + visits, t + value)
+        if stats is not None:
+            stats.iterations += worker_stats.iterations
+            stats.nodes += worker_stats.nodes
+            stats.max_depth = max(stats.max_depth, worker_stats.max_depth)
+            stats.timed_out = stats.timed_out or worker_stats.timed_out
+    return merged
+
+
+# --- Headless policy --------------------------------------------------------
+class MCTSPolicy(TurnPolicy):
+    """TurnPolicy for Game.step()/run_turn() that settles purchase, build and
+    jail choices with mcts_decide, and covers debts by raising cash first.
+    With manage=True, building/mortgaging before the roll and raising cash
+    for a debt are searched too, up to `manage_moves` moves per decision.
+    workers > 1 runs every search root-parallel, and budget_ms caps each
+    search's wall-clock time (see mcts_decide). Serial searches reuse the
+    subtree under each decision (see SearchTree) unless reuse=False, and
+    share node statistics through a TranspositionTable of `table_size`
+    entries (0 turns it off). rollout_turns > 0 scores leaves with that many
+    turns of playout (`rollouts` per leaf). The SearchStats of the last
+    `stats_kept` searches are kept in `stats`, newest last."""
+    def __init__(self, iterations: int = 600, rng: Optional[random.Random] = None,
+                 manage: bool = False, manage_moves: int = 3, workers: int = 1,
+                 budget_ms: Optional[float] = None, reuse: bool = True,
+                 table_size: int = 20000, rollout_turns: int = 0, rollouts: int = 1,
+                 stats_kept: int = 1000):
+        self.iterations = iterations
+        self.rng = rng or random.Random()
+        self.manage = manage
+        self.manage_moves = manage_moves
+        self.workers = workers
+        self.budget_ms = budget_ms
+        self.tree = SearchTree() if reuse else None
+        self.table = TranspositionTable(table_size) if table_size else None
+        self.rollout_turns = rollout_turns
+        self.rollouts = rollouts
+        self.stats: "deque[SearchStats]" = deque(maxlen=stats_kept)
+
+    def decide(self, game: Any, player: Any, manage: bool = False) -> Action:
+        """One mcts_decide call with this policy's settings."""
+        stats = SearchStats()
+        a = mcts_decide(game, player, iterations=self.iterations, rng=self.rng, manage=manage,
+                        workers=self.workers, budget_ms=self.budget_ms, stats=stats,
+                        tree=self.tree, table=self.table, rollout_turns=self.rollout_turns,
+                        rollouts=self.rollouts)
+        self.stats.append(stats)
+        return a
+
+    def _manage(self, game: Any, player: Any, done) -> None:
+        model = ActionModel(game, player, manage=True)
+        for _ in range(self.manage_moves):
+            if done() or player not in game.players:
+                return
+            a = self.decide(game, player, manage=True)
+            if a.kind == "NOOP":
+                return
+            model.apply(a)
+
+    def on_turn_start(self, game: Any, player: Any) -> None:
+        if self.manage:
+            self._manage(game, player, game.decision_pending)
+
+    def _search(self, game: Any, player: Any) -> None:
+        model = ActionModel(game, player)
+        legal = model.legal_actions()
+        if len(legal) > 1 or (legal and legal[0].kind != "NOOP"):
+            model.apply(self.decide(game, player))
+
+    on_purchase = on_build = on_jail_turn = _search
 
-    # Pick the most-visited child
-    if not root.children:
-        return random.choice(root.untried_actions)
-    best = max(root.children, key=lambda c: c.visits)
-    return best.action_from_parent or Action("NOOP")
+    def on_debt(self, game: Any, player: Any) -> None:
+        if self.manage:
+            self._manage(game, player, lambda: not game.pending_debt)
+            if not game.pending_debt:
+                return
+        if player.money < game.pending_debt["amount"]:
+            ActionModel(game, player).apply(Action("RAISE_CASH"))
+        TurnPolicy.on_debt(self, game, player)
 
 
 # --- High-level bot ---------------------------------------------------------
@@ -407,13 +1005,18 @@ class MCTSMonopolyBot:
       - request rolls by returning the flag `want_roll`
       - request end-of-turn by returning `want_end`
     """
-    def __init__(self, name_prefix: str = "AI"):
+    def __init__(self, name_prefix: str = "AI", rng: Optional[random.Random] = None):
         self.name_prefix = name_prefix
+        self.rng = rng or random.Random()
+        self.last_stats: Optional[SearchStats] = None  # from the latest search
+        self.tree = SearchTree()
+        self.table = TranspositionTable()
 
     def is_ai(self, player: Any) -> bool:
         return isinstance(player.name, str) and player.name.strip().upper().startswith(self.name_prefix.upper())
 
-    def step(self, game: Any, player: Any, iterations: int = 400) -> Dict[str, bool]:
+    def step(self, game: Any, player: Any, iterations: int = 400,
+             budget_ms: Optional[float] = None) -> Dict[str, bool]:
         if not self.is_ai(player):
             return {"want_roll": False, "want_end": False}
 
@@ -442,7 +1045,10 @@ class MCTSMonopolyBot:
         model = ActionModel(game, player)
         actions = model.legal_actions()
         if actions and (len(actions) > 1 or actions[0].kind != "NOOP"):
-            a = mcts_decide(game, player, iterations=iterations)
+            self.last_stats = SearchStats()
+            a = mcts_decide(game, player, iterations=iterations, rng=self.rng,
+                            budget_ms=budget_ms, stats=self.last_stats, tree=self.tree,
+                            table=self.table)
             model.apply(a)
 
             # After an auto-action resolves, try one more management sweep
@@ -468,7 +1074,7 @@ class MCTSMonopolyBot:
 
     @staticmethod
     def _weighted_title_value(sp) -> float:
-        t = getattr(sp, "type", "")
+        t = sp.type
         if t == "Railroad":
             return getattr(sp, "cost", 0) * COLOR_WEIGHTS["RAIL"]
         if t == "Utility":
@@ -488,20 +1094,18 @@ class MCTSMonopolyBot:
     def _owns_any_in_band(self, game, me):
         # High-value band: indices 11..29 inclusive, exclude utilities
         for sp in game.board.spaces[11:30]:
-            if getattr(sp, "type", "") == "Property" and getattr(sp, "owner", None) is me:
+            if sp.type == "Property" and getattr(sp, "owner", None) is me:
                 return True
         # also count any Orange anywhere
         for sp in me.properties_owned:
-            if getattr(sp, "type", "") == "Property" and getattr(sp, "color_group", None) == (255, 165, 0):
+            if sp.type == "Property" and getattr(sp, "color_group", None) == (255, 165, 0):
                 return True
         return False
 
     def _missing_set_props(self, game, me, color):
-        mine = [sp for sp in me.properties_owned
-                if getattr(sp, "type","")=="Property" and getattr(sp, "color_group", None)==color]
-        group = [sp for sp in game.board.spaces
-                 if getattr(sp, "type","")=="Property" and getattr(sp, "color_group", None)==color]
-        missing = [sp for sp in group if getattr(sp, "owner", None) is not me]
+        group = [game.board.spaces[i] for i in game.board.color_groups.get(color, ())]
+        mine = [sp for sp in group if sp.owner is me]
+        missing = [sp for sp in group if sp.owner is not me]
         return mine, group, missing
 
     def _find_owner(self, sp, players):
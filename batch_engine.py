@@ -0,0 +1,432 @@
+# batch_engine.py
+"""
+NumPy engine that plays thousands of games side by side.
+
+Every game lives in rows of shared arrays (positions, cash, owners, houses,
+decks, ...) and each step() plays one turn of every unfinished game with
+vectorized operations. Board prices, rent tables and cards are read from
+game.py, so the two engines use one ruleset. The policy is the headless
+default (buy when affordable, roll for doubles in jail, go bankrupt over an
+unpayable debt), plus optional buy/build knobs:
+
+    eng = BatchEngine(n_games=10_000, n_players=4, seed=1, build_to=3)
+    eng.run(max_turns=300)
+    eng.summary()         # {"finished": ..., "titles_owned": ..., ...}
+
+    python batch_engine.py --games 20000 --check   # throughput + cross-check
+
+Simplifications against game.py: no mortgages, trades, GOJF use or hotels,
+and a jailed player who can't pay the forced $50 goes bankrupt without
+moving. cross_check() compares landing frequencies with markov.py and game
+outcomes with game.py under the same policy.
+
+Requires numpy (the rest of the project does not).
+"""
+from __future__ import annotations
+import argparse, time
+from typing import Dict, Tuple
+
+import numpy as np
+
+from game import Game, LOG_QUIET
+from playout import N as N_SPACES, GO_SALARY, JAIL_FINE, BANK, RAIL_RENT, \
+    K_OTHER, K_PROP, K_RAIL, K_UTIL, K_TAX, K_CHANCE, K_CHEST, K_GOTOJAIL
+import playout
+
+START_CASH = 1500
+
+# card actions
+C_COLLECT, C_PAY, C_MOVE, C_JAIL, C_GOJF, C_BIRTHDAY, C_REPAIRS = range(7)
+_CARD_CODES = {"collect_money": C_COLLECT, "pay_money": C_PAY, "move_to": C_MOVE,
+               "go_to_jail": C_JAIL, "get_out_of_jail": C_GOJF,
+               "it_is_your_birthday": C_BIRTHDAY, "street_repairs": C_REPAIRS}
+
+
+class _Tables:
+    """playout.tables() as arrays, with railroads and utilities as groups."""
+
+    def __init__(self):
+        t = playout.tables()
+        self.jail = t.jail
+        self.kind = np.array(t.kind, np.int8)
+        self.cost = np.array(t.cost, np.int32)
+        self.house_cost = np.array(t.house_cost, np.int32)
+        self.rent = np.array(t.rent, np.int32)   # props: base, 1-4 houses, hotel
+        self.tax = np.array(t.tax, np.int32)
+        # group ids: color groups in board order, then railroads, then utilities
+        self.rail_group, self.util_group = len(t.members), len(t.members) + 1
+        self.n_groups = len(t.members) + 2
+        self.group = np.array(t.group, np.int8)
+        self.group[self.kind == K_RAIL] = self.rail_group
+        self.group[self.kind == K_UTIL] = self.util_group
+        self.group_size = np.bincount(self.group[self.group >= 0],
+                                      minlength=self.n_groups).astype(np.int8)
+        self.group_members = [np.array(m) for m in t.members]
+        self.rail_rent = np.array(RAIL_RENT, np.int32)
+
+        # cards: one row per card of each deck, in catalog order
+        def deck(cards):
+            action = np.array([_CARD_CODES[a] for a, _, _ in cards], np.int8)
+            value = np.array([v if isinstance(v, int) else 0 for _, v, _ in cards], np.int32)
+            target = np.array([x if x is not None else 0 for _, _, x in cards], np.int32)
+            return action, value, target
+        self.decks = {k: deck(cards) for k, cards in t.decks.items()}
+        repairs = next(v for cards in t.decks.values() for a, v, _ in cards
+                       if a == "street_repairs")
+        self.repair_house, self.repair_hotel = repairs["house"], repairs["hotel"]
+
+
+_TABLES = None
+
+def tables() -> _Tables:
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = _Tables()
+    return _TABLES
+
+
+class BatchEngine:
+    """N games of `n_players` seats, advanced one turn per step().
+
+    Policy knobs: a title is bought when cash - cost >= buy_buffer; at the
+    start of their turn a player with a monopoly builds evenly up to
+    `build_to` houses per title while cash - house cost >= build_buffer."""
+
+    def __init__(self, n_games: int, n_players: int = 4, seed=None,
+                 buy_buffer: int = 0, build_to: int = 0, build_buffer: int = 0):
+        t = self.t = tables()
+        self.n, self.p = n_games, n_players
+        self.rng = np.random.default_rng(seed)
+        self.buy_buffer, self.build_to, self.build_buffer = buy_buffer, min(build_to, 4), build_buffer
+
+        n, p = n_games, n_players
+        self.pos = np.zeros((n, p), np.int32)
+        self.cash = np.full((n, p), START_CASH, np.int64)
+        self.alive = np.ones((n, p), bool)
+        self.jailed = np.zeros((n, p), bool)
+        self.jail_turns = np.zeros((n, p), np.int8)
+        self.gojf = np.zeros((n, p), np.int16)
+        self.owner = np.full((n, N_SPACES), BANK, np.int8)
+        self.houses = np.zeros((n, N_SPACES), np.int8)
+        self.counts = np.zeros((n, p, t.n_groups), np.int8)   # titles per group
+        self.houses_left = np.full(n, 32, np.int32)
+        self.cur = np.zeros(n, np.int32)
+        self.turn = np.zeros(n, np.int32)
+        self.done = np.zeros(n, bool)
+        self.winner = np.full(n, -1, np.int32)
+        self.landings = np.zeros(N_SPACES, np.int64)
+        self.turns_played = 0
+        # decks: a shuffled cycle per game, drawn from the head, as in game.py
+        self.deck_order, self.deck_head = {}, {}
+        for k, (action, _, _) in t.decks.items():
+            size = len(action)
+            self.deck_order[k] = self.rng.permuted(np.tile(np.arange(size), (n, 1)), axis=1)
+            self.deck_head[k] = np.zeros(n, np.int32)
+
+    # ---------- turn ----------
+    def step(self, max_turns=None) -> bool:
+        """Play one turn in every unfinished game. False once all are done."""
+        if max_turns is not None:
+            self.done |= self.turn >= max_turns
+        g = np.flatnonzero(~self.done)
+        if g.size == 0:
+            return False
+        p = self.cur[g]
+        self.turns_played += g.size
+        if self.build_to:
+            self._build(g, p)
+
+        jailed = self.jailed[g, p]
+        self._jail_turn(g[jailed], p[jailed])
+
+        rg, rp = g[~jailed], p[~jailed]
+        for k in range(3):
+            if rg.size == 0:
+                break
+            d1, d2 = self._dice(rg.size)
+            dbl = d1 == d2
+            third = dbl & (k == 2)
+            self._to_jail(rg[third], rp[third])
+            mv = ~third
+            self._move(rg[mv], rp[mv], (d1 + d2)[mv])
+            again = dbl & ~third
+            rg, rp = rg[again], rp[again]
+            ok = self.alive[rg, rp] & ~self.jailed[rg, rp] & ~self.done[rg]
+            rg, rp = rg[ok], rp[ok]
+
+        keep = ~self.done[g]
+        self._end_turn(g[keep], p[keep])
+        return True
+
+    def _end_turn(self, g, p):
+        # a player who went bankrupt on their own turn hands it on without
+        # the turn counter moving, as in Game.declare_bankruptcy
+        self.turn[g] += self.alive[g, p]
+        nxt = (p + 1) % self.p
+        for _ in range(self.p - 1):
+            dead = ~self.alive[g, nxt]
+            if not dead.any():
+                break
+            nxt = np.where(dead, (nxt + 1) % self.p, nxt)
+        self.cur[g] = nxt
+
+    def run(self, max_turns: int = 300) -> "BatchEngine":
+        while self.step(max_turns):
+            pass
+        return self
+
+    # ---------- movement ----------
+    def _dice(self, k) -> Tuple[np.ndarray, np.ndarray]:
+        d = self.rng.integers(1, 7, size=(2, k), dtype=np.int32)
+        return d[0], d[1]
+
+    def _move(self, g, p, steps):
+        old = self.pos[g, p]
+        self.cash[g, p] += GO_SALARY * (old + steps >= N_SPACES)
+        self.pos[g, p] = (old + steps) % N_SPACES
+        self._land(g, p, steps)
+
+    def _to_jail(self, g, p):
+        self.pos[g, p] = self.t.jail
+        self.jailed[g, p] = True
+        self.jail_turns[g, p] = 0
+
+    def _jail_turn(self, g, p):
+        if g.size == 0:
+            return
+        d1, d2 = self._dice(g.size)
+        dbl = d1 == d2
+        forced = ~dbl & (self.jail_turns[g, p] >= 2)
+        stay = ~dbl & ~forced
+        self.jail_turns[g[stay], p[stay]] += 1
+
+        fg, fp = g[forced], p[forced]
+        broke = self.cash[fg, fp] < JAIL_FINE
+        self.cash[fg[~broke], fp[~broke]] -= JAIL_FINE
+        self._bankrupt(fg[broke], fp[broke], np.full(broke.sum(), BANK))
+
+        out = ~stay
+        out[forced] = ~broke
+        og, op = g[out], p[out]
+        self.jailed[og, op] = False
+        self.jail_turns[og, op] = 0
+        self._move(og, op, (d1 + d2)[out])
+
+    # ---------- landing ----------
+    def _land(self, g, p, dice):
+        t = self.t
+        while g.size:
+            sp = self.pos[g, p]
+            self.landings += np.bincount(sp, minlength=N_SPACES)
+            kind = t.kind[sp]
+            title = (kind == K_PROP) | (kind == K_RAIL) | (kind == K_UTIL)
+            owner = self.owner[g, sp]
+
+            buy = title & (owner == BANK) & (self.cash[g, p] - t.cost[sp] >= self.buy_buffer) \
+                & (self.cash[g, p] >= t.cost[sp])
+            self._buy(g[buy], p[buy], sp[buy])
+
+            rent = title & (owner != BANK) & (owner != p)
+            if rent.any():
+                self._pay_rent(g[rent], p[rent], sp[rent], owner[rent], dice[rent])
+
+            tax = kind == K_TAX
+            if tax.any():
+                self._pay_bank(g[tax], p[tax], t.tax[sp[tax]])
+
+            jail = kind == K_GOTOJAIL
+            self._to_jail(g[jail], p[jail])
+
+            again = np.zeros(g.size, bool)
+            for k in (K_CHANCE, K_CHEST):
+                m = kind == k
+                if m.any():
+                    again[m] = self._draw(g[m], p[m], k)
+            g, p, dice = g[again], p[again], dice[again]
+
+    def _buy(self, g, p, sp):
+        self.owner[g, sp] = p
+        self.cash[g, p] -= self.t.cost[sp]
+        self.counts[g, p, self.t.group[sp]] += 1
+
+    def _pay_rent(self, g, p, sp, owner, dice):
+        t = self.t
+        kind = t.kind[sp]
+        grp = t.group[sp]
+        held = self.counts[g, owner, grp]
+        h = self.houses[g, sp]
+        mono = held == t.group_size[grp]
+        amount = np.where(h > 0, t.rent[sp, h], t.rent[sp, 0] * (1 + mono))
+        amount = np.where(kind == K_RAIL, t.rail_rent[held], amount)
+        amount = np.where(kind == K_UTIL, dice * np.where(held == 2, 10, 4), amount)
+        ok = self.cash[g, p] >= amount
+        self.cash[g[ok], p[ok]] -= amount[ok]
+        self.cash[g[ok], owner[ok]] += amount[ok]
+        self._bankrupt(g[~ok], p[~ok], owner[~ok])
+
+    def _pay_bank(self, g, p, amount):
+        ok = self.cash[g, p] >= amount
+        self.cash[g[ok], p[ok]] -= amount[ok]
+        self._bankrupt(g[~ok], p[~ok], np.full((~ok).sum(), BANK))
+
+    def _draw(self, g, p, deck) -> np.ndarray:
+        """Draw and apply one card per row; True where the player moved and
+        must land again."""
+        t = self.t
+        action, value, target = t.decks[deck]
+        order, head = self.deck_order[deck], self.deck_head[deck]
+        card = order[g, head[g]]
+        head[g] = (head[g] + 1) % order.shape[1]
+        a, v, tgt = action[card], value[card], target[card]
+        again = np.zeros(g.size, bool)
+
+        m = a == C_COLLECT
+        self.cash[g[m], p[m]] += v[m]
+        m = a == C_PAY
+        if m.any():
+            self._pay_bank(g[m], p[m], v[m])
+        m = a == C_JAIL
+        self._to_jail(g[m], p[m])
+        m = a == C_GOJF
+        self.gojf[g[m], p[m]] += 1
+
+        m = a == C_MOVE
+        if m.any():
+            mg, mp, mt = g[m], p[m], tgt[m]
+            pos = self.pos[mg, mp]
+            back = mt == -3
+            salary = ~back & ((mt == 0) | (pos > mt))
+            self.cash[mg[salary], mp[salary]] += GO_SALARY
+            self.pos[mg, mp] = np.where(back, (pos - 3) % N_SPACES, mt)
+            again[m] = True
+
+        m = a == C_BIRTHDAY
+        if m.any():
+            bg, bp, bv = g[m], p[m], v[m]
+            others = self.alive[bg].copy()
+            others[np.arange(bg.size), bp] = False
+            self.cash[bg] -= others * bv[:, None]
+            self.cash[bg, bp] += others.sum(1) * bv
+
+        m = a == C_REPAIRS
+        if m.any():
+            rg, rp = g[m], p[m]
+            mine = self.owner[rg] == rp[:, None]
+            h = np.where(mine, self.houses[rg], 0)
+            cost = np.where(h == 5, t.repair_hotel, h * t.repair_house).sum(1)
+            self.cash[rg, rp] -= cost
+        return again & self.alive[g, p] & ~self.jailed[g, p]
+
+    # ---------- building ----------
+    def _build(self, g, p):
+        t = self.t
+        for c, members in enumerate(t.group_members):
+            size = len(members)
+            m = self.counts[g, p, c] == size
+            bg, bp = g[m], p[m]
+            for _ in range(self.build_to * size):
+                if bg.size == 0:
+                    break
+                h = self.houses[bg][:, members]
+                lowest = h.argmin(1)
+                sp = members[lowest]
+                price = t.house_cost[sp]
+                can = (h.min(1) < self.build_to) & (self.houses_left[bg] > 0) \
+                    & (self.cash[bg, bp] - price >= self.build_buffer) & (self.cash[bg, bp] >= price)
+                bg, bp, sp, price = bg[can], bp[can], sp[can], price[can]
+                self.houses[bg, sp] += 1
+                self.houses_left[bg] -= 1
+                self.cash[bg, bp] -= price
+
+    # ---------- bankruptcy ----------
+    def _bankrupt(self, g, p, creditor):
+        """Titles go to `creditor` (or back to the bank, BANK); houses return
+        to the bank."""
+        if g.size == 0:
+            return
+        mine = self.owner[g] == p[:, None]
+        h = self.houses[g]
+        self.houses_left[g] += np.where(mine, h, 0).sum(1)
+        self.houses[g] = np.where(mine, 0, h)
+        self.owner[g] = np.where(mine, creditor[:, None], self.owner[g])
+        to = creditor >= 0
+        self.counts[g[to], creditor[to]] += self.counts[g[to], p[to]]
+        self.counts[g, p] = 0
+        self.alive[g, p] = False
+        self.jailed[g, p] = False
+        left = self.alive[g].sum(1)
+        over = left == 1
+        self.done[g[over]] = True
+        self.winner[g[over]] = self.alive[g[over]].argmax(1)
+
+    # ---------- results ----------
+    def summary(self) -> Dict[str, float]:
+        alive = self.alive
+        return {
+            "games": float(self.n),
+            "finished": float((self.winner >= 0).mean()),
+            "players_left": float(alive.sum(1).mean()),
+            "titles_owned": float((self.owner != BANK).sum(1).mean()),
+            "cash_alive": float(self.cash[alive].mean()),
+            "turns": float(self.turn.mean()),
+        }
+
+    def landing_rates(self) -> np.ndarray:
+        """Landings per space per turn played."""
+        return self.landings / max(self.turns_played, 1)
+
+
+def _reference(games: int, n_players: int, max_turns: int, seed: int) -> Dict[str, float]:
+    """Same summary from game.py, with the default TurnPolicy."""
+    rows = []
+    names = [f"AI {i + 1}" for i in range(n_players)]
+    for k in range(games):
+        game = Game(names, verbosity=LOG_QUIET, seed=seed + k)
+        game.run_game(max_turns=max_turns)
+        titles = sum(len(p.properties_owned) for p in game.players)
+        rows.append((game.winner is not None, len(game.players), titles,
+                     np.mean([p.money for p in game.players]), game.turn_number))
+    a = np.array(rows, float)
+    return {"games": float(games), "finished": a[:, 0].mean(), "players_left": a[:, 1].mean(),
+            "titles_owned": a[:, 2].mean(), "cash_alive": a[:, 3].mean(), "turns": a[:, 4].mean()}
+
+
+def cross_check(games: int = 4000, reference_games: int = 200, n_players: int = 4,
+                max_turns: int = 100, seed: int = 0) -> Dict[str, Tuple[float, float]]:
+    """Play the default policy in both engines and return
+    {metric: (batch, game.py)}, plus "landing_max_err": the largest gap
+    between batch landing rates and markov.landing_table("long")."""
+    from markov import landing_table
+    eng = BatchEngine(games, n_players, seed=seed).run(max_turns)
+    ref = _reference(reference_games, n_players, max_turns, seed)
+    out = {k: (v, ref[k]) for k, v in eng.summary().items() if k != "games"}
+    exact = np.array(landing_table("long"))
+    out["landing_max_err"] = (float(np.abs(eng.landing_rates() - exact).max()), 0.0)
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--games", type=int, default=10000)
+    ap.add_argument("--players", type=int, default=4)
+    ap.add_argument("--max-turns", type=int, default=300)
+    ap.add_argument("--build-to", type=int, default=0)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--check", action="store_true", help="also cross-check against game.py")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    eng = BatchEngine(args.games, args.players, seed=args.seed, build_to=args.build_to)
+    eng.run(args.max_turns)
+    dt = time.perf_counter() - t0
+    print(f"batch: {args.games} games in {dt:.2f}s -> {args.games / dt:,.0f} games/s, "
+          f"{eng.turns_played / dt:,.0f} turns/s")
+    for k, v in eng.summary().items():
+        print(f"  {k:14s} {v:10.2f}")
+    if args.check:
+        for k, (b, r) in cross_check(max_turns=args.max_turns, n_players=args.players).items():
+            print(f"  check {k:14s} batch {b:10.3f}   game.py {r:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
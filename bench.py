@@ -0,0 +1,113 @@
+# bench.py
+import argparse, random, time, tracemalloc
+from game import Game, Property, Railroad, Utility, LOG_QUIET
+from ai_mcts import mcts_decide, worker_pool, SearchStats
+
+'''
+python bench.py mcts --decisions 50 --iterations 400 [--workers 16] [--budget-ms 15] [--rollout-turns 24]
+
+Micro-benchmarks for the engine and the AI.
+- mcts   : purchase decisions per second for a given MCTS iteration budget
+           (per worker, with --workers K root-parallel processes; --budget-ms
+           caps each decision's wall-clock time and reports what fit in it;
+           --rollout-turns N scores leaves with N-turn playouts)
+- memory : bytes per live Game, fresh and as search forks (Game.clone)
+- turns  : headless Game.run_game throughput with the default TurnPolicy
+'''
+
+def _purchase_positions(n, seed):
+    """Fresh games where the first AI has just landed on a random unowned title."""
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(n):
+        game = Game(player_names=["AI 1", "AI 2", "AI 3", "AI 4"], verbosity=LOG_QUIET,
+                    seed=rng.getrandbits(32))
+        me = game.players[0]
+        titles = [s for s in game.board.spaces if isinstance(s, (Property, Railroad, Utility))]
+        sp = rng.choice(titles)
+        me.money = rng.randint(sp.cost, 1500)
+        me.position = sp.index
+        sp.land_on(me, game.board)
+        positions.append((game, me))
+    return positions
+
+def bench_mcts(decisions, iterations, seed, workers=1, budget_ms=None, rollout_turns=0):
+    positions = _purchase_positions(decisions, seed)
+    search_rng = random.Random(seed)
+    if workers > 1:
+        worker_pool(workers)  # start the processes outside the timing
+    stats = []
+    t0 = time.perf_counter()
+    for game, me in positions:
+        stats.append(SearchStats())
+        mcts_decide(game, me, iterations=iterations, rng=search_rng, workers=workers,
+                    budget_ms=budget_ms, stats=stats[-1], rollout_turns=rollout_turns)
+    dt = time.perf_counter() - t0
+    total = sum(s.iterations for s in stats)
+    print(f"mcts: {decisions} decisions x {iterations} iterations x {workers} workers in {dt:.2f}s "
+          f"-> {decisions / dt:.1f} decisions/s, {total / dt:.0f} iterations/s")
+    if budget_ms is not None:
+        worst = max(s.elapsed_ms for s in stats)
+        cut = sum(s.timed_out for s in stats)
+        print(f"      budget {budget_ms:g} ms: {total / decisions:.0f} iterations/decision, "
+              f"{sum(s.nodes for s in stats) / decisions:.0f} nodes/tree, worst {worst:.1f} ms, "
+              f"{cut}/{decisions} cut short")
+
+def _bytes_per(make, n):
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    keep = [make() for _ in range(n)]
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del keep
+    return used / n
+
+def bench_memory(games, seed):
+    names = ["AI 1", "AI 2", "AI 3", "AI 4"]
+    per_game = _bytes_per(lambda: Game(names, verbosity=LOG_QUIET, seed=seed), games)
+    root, _ = _purchase_positions(1, seed)[0]
+    per_clone = _bytes_per(root.clone, games)
+    print(f"memory: {per_game:,.0f} bytes per Game, {per_clone:,.0f} bytes per clone "
+          f"({games} live each)")
+
+def bench_turns(games, max_turns, seed):
+    names = ["AI 1", "AI 2", "AI 3", "AI 4"]
+    turns = 0
+    t0 = time.perf_counter()
+    for i in range(games):
+        game = Game(names, verbosity=LOG_QUIET, seed=seed + i)
+        game.run_game(max_turns=max_turns)
+        turns += game.turn_number
+    dt = time.perf_counter() - t0
+    print(f"turns: {games} games in {dt:.2f}s -> {dt / games * 1000:.2f} ms/game, "
+          f"{turns / dt:,.0f} turns/s")
+
+def main():
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    m = sub.add_parser("mcts")
+    m.add_argument("--decisions", type=int, default=50)
+    m.add_argument("--iterations", type=int, default=400)
+    m.add_argument("--seed", type=int, default=0)
+    m.add_argument("--workers", type=int, default=1)
+    m.add_argument("--budget-ms", type=float, default=None)
+    m.add_argument("--rollout-turns", type=int, default=0)
+    mem = sub.add_parser("memory")
+    mem.add_argument("--games", type=int, default=1000)
+    mem.add_argument("--seed", type=int, default=0)
+    t = sub.add_parser("turns")
+    t.add_argument("--games", type=int, default=200)
+    t.add_argument("--max-turns", type=int, default=300)
+    t.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    if args.cmd == "mcts":
+        bench_mcts(args.decisions, args.iterations, args.seed, args.workers, args.budget_ms,
+                   args.rollout_turns)
+    elif args.cmd == "memory":
+        bench_memory(args.games, args.seed)
+    elif args.cmd == "turns":
+        bench_turns(args.games, args.max_turns, args.seed)
+
+if __name__ == "__main__":
+    main()
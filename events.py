@@ -0,0 +1,149 @@
+# events.py
+"""
+Typed event stream from the engine.
+
+Every money- or title-moving action in game.py calls Game.emit(), which does
+nothing unless an EventLog is attached:
+
+    log = game.record_events()          # or game.events = EventLog(...)
+    log.subscribe(fn)                   # fn(turn, kind, player, other, index, amount)
+    for ev in log: ...                  # Event tuples, oldest first
+    log.flush("run.events")             # append one columnar block, then clear
+    cols = read_columns("run.events")   # {"turn": array, "kind": array, ...}
+
+An event is six ints: turn number, kind (EV_*), acting player's seat, the
+counterparty's seat (-1 for the bank), a board/card index (-1 if none) and a
+dollar amount. They are written straight into preallocated int32 columns, so
+recording allocates nothing per event. When the ring is full the oldest event
+is overwritten (counted in `dropped`), or, if the log has a `path`, the ring
+is flushed there first.
+
+File format: repeated blocks of
+    b"MNEV", u16 version, u32 count, then the six columns as count x int32 LE.
+"""
+from __future__ import annotations
+import struct, sys
+from array import array
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional
+
+EV_RENT = 1          # player paid `amount` rent to other on space `index`
+EV_TAX = 2           # player paid `amount` tax on space `index`
+EV_PURCHASE = 3      # player bought space `index` for `amount`
+EV_BUILD_HOUSE = 4
+EV_BUILD_HOTEL = 5
+EV_SELL_HOUSE = 6
+EV_SELL_HOTEL = 7
+EV_MORTGAGE = 8      # amount = cash received
+EV_UNMORTGAGE = 9    # amount = payoff
+EV_TRADE = 10        # player traded with other; amount = net cash player -> other
+EV_TITLE = 11        # player handed space `index` to other (trades)
+EV_CARD = 12         # player drew card_catalog[index]
+EV_JAIL = 13         # player sent to jail
+EV_DEBT = 14         # player owes `amount` to other (or the bank) and can't pay yet
+EV_BANKRUPT = 15     # player went bankrupt to other (or the bank) holding `amount` cash
+EV_AUCTION = 16      # player won space `index` at auction for `amount`
+
+EVENT_NAMES = {v: k[3:].lower() for k, v in globals().items() if k.startswith("EV_")}
+
+COLUMNS = ("turn", "kind", "player", "other", "index", "amount")
+Event = namedtuple("Event", COLUMNS)
+
+MAGIC = b"MNEV"
+VERSION = 1
+_BLOCK = struct.Struct("<4sHI")
+
+
+class EventLog:
+    """Ring buffer of events in struct-of-arrays form, plus subscribers."""
+
+    def __init__(self, capacity: int = 4096, path: Optional[str] = None):
+        self.capacity = capacity
+        self.path = path
+        self.columns = [array("i", bytes(4 * capacity)) for _ in COLUMNS]
+        self.head = 0       # next write slot
+        self.count = 0
+        self.dropped = 0
+        self.subscribers: List[Callable] = []
+
+    def subscribe(self, fn: Callable) -> None:
+        self.subscribers.append(fn)
+
+    def emit(self, turn, kind, player, other, index, amount) -> None:
+        if self.count == self.capacity:
+            if self.path is not None:
+                self.flush(self.path)
+            else:
+                self.dropped += 1
+                self.count -= 1
+        t, k, p, o, i, a = self.columns
+        h = self.head
+        t[h] = turn; k[h] = kind; p[h] = player; o[h] = other; i[h] = index; a[h] = amount
+        self.head = (h + 1) % self.capacity
+        self.count += 1
+        for fn in self.subscribers:
+            fn(turn, kind, player, other, index, amount)
+
+    def _order(self) -> range:
+        start = (self.head - self.count) % self.capacity
+        return range(start, start + self.count)
+
+    def column(self, name: str) -> array:
+        """One column, oldest event first."""
+        col, cap = self.columns[COLUMNS.index(name)], self.capacity
+        return array("i", (col[j % cap] for j in self._order()))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        cols, cap = self.columns, self.capacity
+        for j in self._order():
+            j %= cap
+            yield Event(*(c[j] for c in cols))
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def flush(self, path: str) -> int:
+        """Append the buffered events to `path` as one columnar block and
+        clear the buffer. Returns the number of events written."""
+        n = self.count
+        if n:
+            with open(path, "ab") as f:
+                f.write(_BLOCK.pack(MAGIC, VERSION, n))
+                for name in COLUMNS:
+                    col = self.column(name)
+                    if sys.byteorder == "big":
+                        col.byteswap()
+                    f.write(col.tobytes())
+        self.clear()
+        return n
+
+
+def read_columns(path: str) -> Dict[str, array]:
+    """Load every block of an event file into one int32 array per column."""
+    out = {name: array("i") for name in COLUMNS}
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = 0
+    while pos < len(data):
+        magic, version, n = _BLOCK.unpack_from(data, pos)
+        if magic != MAGIC:
+            raise ValueError(f"not an event file (bad block at byte {pos})")
+        if version > VERSION:
+            raise ValueError(f"event block is format v{version}; this build reads up to v{VERSION}")
+        pos += _BLOCK.size
+        for name in COLUMNS:
+            col = array("i")
+            col.frombytes(data[pos:pos + 4 * n])
+            if sys.byteorder == "big":
+                col.byteswap()
+            out[name].extend(col)
+            pos += 4 * n
+    return out
+
+
+def read_events(path: str) -> List[Event]:
+    cols = read_columns(path)
+    return [Event(*row) for row in zip(*(cols[c] for c in COLUMNS))]
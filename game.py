@@ -1,16 +1,170 @@
 import random
+from collections import namedtuple
+from dataclasses import dataclass, field
+from operator import attrgetter
+
+from events import (EventLog, EV_RENT, EV_TAX, EV_PURCHASE, EV_BUILD_HOUSE, EV_BUILD_HOTEL,
+                    EV_SELL_HOUSE, EV_SELL_HOTEL, EV_MORTGAGE, EV_UNMORTGAGE, EV_TRADE,
+                    EV_TITLE, EV_CARD, EV_JAIL, EV_DEBT, EV_BANKRUPT, EV_AUCTION)
+
+# Game.verbosity levels. Messages above the game's level are dropped before
+# any string formatting happens, so LOG_QUIET costs one comparison per call.
+LOG_QUIET = 0
+LOG_EVENTS = 1   # purchases, rent, builds, mortgages, jail, cards, bankruptcy
+LOG_VERBOSE = 2  # every roll, move and cash movement
+
+# Game.turn_phase, advanced by Game.step()
+TURN_START = 0  # turn not begun: policy hook, then jail check
+TURN_JAIL = 1   # jailed player's choice is being resolved
+TURN_ROLL = 2   # player (still) has a roll to make
+TURN_END = 3    # nothing left to do; next step passes the turn
+
+# Open decisions (Game.next_decision), in the order Game.step() settles them.
+# The first five are bookkeeping the engine resolves itself; the rest are put
+# to the TurnPolicy of the player who owes them.
+D_CARD = 0            # drawn card waiting to be executed
+D_RENT = 1
+D_TAX = 2
+D_JAIL = 3            # "go to jail" notice (queue)
+D_BANKRUPT_NOTICE = 4
+D_DEBT = 5
+D_JAIL_TURN = 6       # jailed player's pay/card/roll choice (queue)
+D_PURCHASE = 7
+D_BUILD = 8
+D_TRADE = 9           # owed by the trade's responder
+
+Decision = namedtuple("Decision", "kind player info")
+
+@dataclass(frozen=True)
+class Action:
+    """One move in Game.legal_actions(): a kind ("BUY", "JAIL_PAY",
+    "MORTGAGE", ...) and its arguments (the title, for most)."""
+    kind: str
+    data: tuple = field(default_factory=tuple)
+
+    def __repr__(self) -> str:
+        if not self.data:
+            return self.kind
+        return f"{self.kind}{self.data!r}"
+
+_NOOP = Action("NOOP")
+
+# kind -> (modal attribute, key of the player who owes it)
+_DECISIONS = (
+    ("pending_card", "player"),
+    ("pending_rent", "player"),
+    ("pending_tax", "player"),
+    ("pending_jail", "player"),
+    ("pending_bankrupt_notice", None),
+    ("pending_debt", "player"),
+    ("pending_jail_turn", "player"),
+    ("pending_purchase", "player"),
+    ("pending_build", "player"),
+    ("pending_trade", "responder"),
+)
+
+def print_sink(level, message):
+    """Default Game.log_sink: echo to stdout like the console game always did."""
+    print(message)
+
+# Zobrist keys for Game.state_hash. Fixed seed, so a position hashes the same
+# in every run and every process.
+MAX_SEATS = 8
+CASH_BUCKET = 50        # cash is hashed in $50 buckets...
+CASH_BUCKETS = 102      # ...from "in debt" up to $5000+
+_zr = random.Random(0x4D4F4E4F)
+Z_OWNER = [[_zr.getrandbits(64) for _ in range(40)] for _ in range(MAX_SEATS)]
+Z_HOUSES = [[0] + [_zr.getrandbits(64) for _ in range(4)] for _ in range(40)]
+Z_HOTEL = [_zr.getrandbits(64) for _ in range(40)]
+Z_MORTGAGED = [_zr.getrandbits(64) for _ in range(40)]
+Z_CASH = [[_zr.getrandbits(64) for _ in range(CASH_BUCKETS)] for _ in range(MAX_SEATS)]
+Z_POSITION = [[_zr.getrandbits(64) for _ in range(40)] for _ in range(MAX_SEATS)]
+Z_JAIL = [[0] + [_zr.getrandbits(64) for _ in range(4)] for _ in range(MAX_SEATS)]
+Z_TURN = [[_zr.getrandbits(64) for _ in range(4)] for _ in range(MAX_SEATS)]
+del _zr
+
+def _cash_bucket(money):
+    return min(max(money // CASH_BUCKET + 1, 0), CASH_BUCKETS - 1)
+
+def _jail_code(in_jail, jail_turns):
+    return min(jail_turns, 3) + 1 if in_jail else 0
+
+def _tracked(field, notify):
+    """Attribute kept in slot "_<field>" whose real changes are passed to
+    notify(obj, field, old, new), so caches and Game.state_hash stay current
+    whichever code path wrote it."""
+    slot = "_" + field
+    fget = attrgetter(slot)
+
+    def fset(self, value):
+        old = fget(self)
+        if old != value:
+            setattr(self, slot, value)
+            notify(self, field, old, value)
+
+    return property(fget, fset)
+
+def _modal(attr, kind):
+    """pending_* attribute stored in "_<attr>" that keeps bit `kind` of
+    Game._pending set while it (or another modal of the same kind) is open.
+    Queues (pending_jail, pending_jail_turn) must be reassigned, not mutated
+    in place, for the bit to follow; see Game.queue_jail."""
+    slot = "_" + attr
+    bit = 1 << kind
+    other = next(("_" + a for a, k in _MODAL_KINDS if k == kind and a != attr), None)
+
+    def fset(self, value):
+        d = self.__dict__
+        d[slot] = value
+        d["version"] += 1
+        if value:
+            d["_pending"] |= bit
+        elif not (other and d.get(other)):
+            d["_pending"] &= ~bit
+
+    return property(attrgetter(slot), fset)
+
+# every pending_* attribute and its decision kind (last_drawn_card shares D_CARD)
+_MODAL_KINDS = tuple((attr, kind) for kind, (attr, _) in enumerate(_DECISIONS)) + \
+    (("last_drawn_card", D_CARD),)
+
+def _space_notify(space, field, old, new):
+    if space.board is not None:
+        space.board.space_changed(space, field, old, new)
+
+def _player_notify(player, field, old, new):
+    if player.board is not None:
+        player.board.game.player_changed(player, field, old, new)
 
 class Player:
+    __slots__ = ("name", "color", "_money", "_position", "properties_owned", "_in_jail",
+                 "_jail_turns", "get_out_of_jail_free_cards", "doubles_rolled_consecutive",
+                 "group_counts", "monopolies", "railroads_owned", "utilities_owned", "board",
+                 "seat")
+
+    money = _tracked("money", _player_notify)
+    position = _tracked("position", _player_notify)
+    in_jail = _tracked("in_jail", _player_notify)
+    jail_turns = _tracked("jail_turns", _player_notify)
+
     def __init__(self, name: str, color=(0,0,0)):
         self.name = name
         self.color = color
-        self.money = 1500
-        self.position = 0
+        self.board = None  # set by Game
+        self.seat = 0      # index in the starting roster, set by Game; keys the state hash
+        self._money = 1500
+        self._position = 0
         self.properties_owned = []
-        self.in_jail = False
-        self.jail_turns = 0
+        self._in_jail = False
+        self._jail_turns = 0
         self.get_out_of_jail_free_cards = 0
         self.doubles_rolled_consecutive = 0 
+        # Ownership index, kept current by Space.owner on every title transfer:
+        # color_group -> titles owned, completed color groups, and rail/utility counts
+        self.group_counts = {}
+        self.monopolies = set()
+        self.railroads_owned = 0
+        self.utilities_owned = 0
         # self.is_ai = False
 
     def move(self, spaces_to_move: int, board):
@@ -18,71 +172,91 @@ class Player:
 
         if old_position + spaces_to_move >= len(board.spaces):
             self.collect_money(200)
-            print(f"{self.name} passed Go and Collected $200.")
+            self.board.game.log(LOG_VERBOSE, "{} passed Go and Collected $200.", self.name)
 
         self.position = (self.position + spaces_to_move) % len(board.spaces)
 
-        print(f"{self.name} moved to {board.spaces[self.position].name}.")
+        self.board.game.log(LOG_VERBOSE, "{} moved to {}.", self.name, board.spaces[self.position].name)
         # Trigger the land_on logic for the space the player landed on
         board.spaces[self.position].land_on(self, board)
 
     def collect_money(self, amount: int):
         self.money += amount
-        print(f"{self.name} collected ${amount}. Current money: ${self.money}")
+        self.board.game.log(LOG_VERBOSE, "{} collected ${}. Current money: ${}", self.name, amount, self.money)
 
     def pay_money(self, amount: int):
         self.money -= amount
-        print(f"{self.name} paid ${amount}. Current money: ${self.money}")
+        self.board.game.log(LOG_VERBOSE, "{} paid ${}. Current money: ${}", self.name, amount, self.money)
         if self.money < 0:
-            print(f"!!! {self.name} is bankrupt! (Game ends for this player in a real game) !!!")
+            self.board.game.log(LOG_EVENTS, "!!! {} is bankrupt! (Game ends for this player in a real game) !!!", self.name)
 
     def add_property(self, property_obj):
         """Adds a property to the player's owned list and sets the property's owner."""
         self.properties_owned.append(property_obj)
         property_obj.owner = self
-        print(f"{self.name} now owns {property_obj.name}.")
+        self.board.game.log(LOG_EVENTS, "{} now owns {}.", self.name, property_obj.name)
+
+    def _title_changed(self, space, delta: int):
+        """Called by Space.owner whenever this player gains (+1) or loses (-1) a title."""
+        t = space.type
+        if t == "Property":
+            cg = space.color_group
+            n = self.group_counts.get(cg, 0) + delta
+            self.group_counts[cg] = n
+            if n == space.group_size:
+                self.monopolies.add(cg)
+            else:
+                self.monopolies.discard(cg)
+        elif t == "Railroad":
+            self.railroads_owned += delta
+        elif t == "Utility":
+            self.utilities_owned += delta
 
     def has_monopoly(self, color_group: str, board):
         """Checks if the player owns all properties in a given color group."""
-        # Get all properties of this color group from the board
-        group_properties = [s for s in board.spaces if isinstance(s, Property) and s.color_group == color_group]
-        
-        # Check if the player owns all of them
-        for prop in group_properties:
-            if prop.owner != self:
-                return False
-        return True
+        return color_group in self.monopolies
     
     def count_railroads(self):
-        return sum(1 for p in self.properties_owned if isinstance(p, Railroad))
+        return self.railroads_owned
 
     def count_utilities(self):
-        return sum(1 for p in self.properties_owned if isinstance(p, Utility))
+        return self.utilities_owned
 
 class Dice:
-    def __init__(self):
+    __slots__ = ("game", "rng", "die1_value", "die2_value")
+
+    def __init__(self, game=None, rng=None):
+        self.game = game
+        self.rng = rng or random.Random()
         self.die1_value = 0
         self.die2_value = 0
 
     def roll(self):
         """Rolls two dice and returns their sum and if it was a double."""
-        self.die1_value = random.randint(1, 6)
-        self.die2_value = random.randint(1, 6)
+        r = self.rng.random  # int(r() * 6) is several times cheaper than randint
+        self.die1_value = int(r() * 6) + 1
+        self.die2_value = int(r() * 6) + 1
         roll_sum = self.die1_value + self.die2_value
         is_double = (self.die1_value == self.die2_value)
-        print(f"Rolled {self.die1_value} and {self.die2_value} (Sum: {roll_sum}). {'DOUBLES!' if is_double else ''}")
+        if self.game is not None:
+            self.game.log(LOG_VERBOSE, "Rolled {} and {} (Sum: {}). {}", self.die1_value, self.die2_value, roll_sum, 'DOUBLES!' if is_double else '')
         return roll_sum, is_double
 
 class Card:
+    __slots__ = ("description", "card_type", "action_type", "value",
+                 "target_space_index", "catalog_index")
+
     def __init__(self, description: str, card_type: str, action_type: str, value: any = None, target_space_index: int = None):
         self.description = description
         self.card_type = card_type
         self.action_type = action_type #move_to, collect_money, pay_money, get_out_of_jail
         self.value = value #amount of money
         self.target_space_index = target_space_index #for move_to actions
+        self.catalog_index = None # position in Game.card_catalog, set by Game
 
     def execute(self, player, game):
-        print(f"Card Drawn ({self.card_type}): {self.description}")
+        game.log(LOG_EVENTS, "Card Drawn ({}): {}", self.card_type, self.description)
+        game.emit(EV_CARD, player, None, self.catalog_index)
         if self.action_type == "collect_money":
             player.collect_money(self.value)
         
@@ -96,34 +270,35 @@ class Card:
             
             if self.target_space_index == -3:
                 player.position = (player.position - 3 + len(game.board.spaces)) % len(game.board.spaces)
-                print(f"{player.name} moved back to {game.board.spaces[player.position].name}.")
+                game.log(LOG_VERBOSE, "{} moved back to {}.", player.name, game.board.spaces[player.position].name)
                 game.board.spaces[player.position].land_on(player, game.board)
                 return
             
             if self.target_space_index == 0:
                 player.position = 0
                 player.collect_money(200)
-                print(f"{player.name} advanced to GO and collected $200.")
+                game.log(LOG_VERBOSE, "{} advanced to GO and collected $200.", player.name)
                 game.board.spaces[player.position].land_on(player, game.board)
                 return
 
             #if passing GO
             if player.position > self.target_space_index: #passing GO unless target is GO 0 index itself
                 player.collect_money(200)
-                print(f"{player.name} passed GO and collected $200.")
+                game.log(LOG_VERBOSE, "{} passed GO and collected $200.", player.name)
             
             player.position = self.target_space_index
-            print(f"{player.name} advanced to {game.board.spaces[player.position].name}.")
+            game.log(LOG_VERBOSE, "{} advanced to {}.", player.name, game.board.spaces[player.position].name)
             game.board.spaces[player.position].land_on(player, game.board)
 
         elif self.action_type == "go_to_jail":
-            game.pending_jail.append({"player": player})
+            game.queue_jail(player)
             player.doubles_rolled_consecutive = 0
-            print(f"{player.name} sent to Jail (via card)!")
+            game.log(LOG_EVENTS, "{} sent to Jail (via card)!", player.name)
+            game.emit(EV_JAIL, player)
 
         elif self.action_type == "get_out_of_jail":
             player.get_out_of_jail_free_cards += 1
-            print(f"{player.name} received a Get Out of Jail Free card.")
+            game.log(LOG_EVENTS, "{} received a Get Out of Jail Free card.", player.name)
 
         elif self.action_type == "it_is_your_birthday":
             # Collect $10 from each other player
@@ -132,7 +307,7 @@ class Card:
                     other_player.pay_money(self.value)
                     player.collect_money(self.value)
 
-            print(f"{player.name} collected ${self.value * (len(game.players) - 1)} from other players.")
+            game.log(LOG_EVENTS, "{} collected ${} from other players.", player.name, self.value * (len(game.players) - 1))
 
         elif self.action_type == "street_repairs":
             house_cost = self.value.get("house", 0)
@@ -144,23 +319,118 @@ class Card:
                     total_cost += (1 if prop.has_hotel else 0) * hotel_cost
             if total_cost > 0:
                 player.pay_money(total_cost)
-                print(f"{player.name} paid ${total_cost} for street repairs.")
+                game.log(LOG_EVENTS, "{} paid ${} for street repairs.", player.name, total_cost)
             else:
-                print(f"{player.name} has no houses or hotels to repair, so pays $0.")
+                game.log(LOG_VERBOSE, "{} has no houses or hotels to repair, so pays $0.", player.name)
         else:
-            print(f"WARNING: Unhandled card action type: {self.action_type}")
+            game.log(LOG_EVENTS, "WARNING: Unhandled card action type: {}", self.action_type)
+
+class Deck:
+    """Chance / Community Chest draw pile.
+
+    The pile is a ring over a tuple of card_catalog indices. draw() advances
+    the head and put_back() writes behind the tail, both O(1). In the normal
+    draw -> execute -> put back cycle the card lands in the slot it was drawn
+    from, so the tuple is never rebuilt and snapshot() is just
+    (ring, head, count): forks share the tuple instead of copying cards."""
+    __slots__ = ("catalog", "capacity", "_ring", "_head", "_count")
+
+    def __init__(self, catalog, order):
+        self.catalog = catalog
+        self.capacity = len(order)
+        self.load(order)
+
+    def load(self, order):
+        """Reset the pile to `order` (catalog indices, top card first)."""
+        order = tuple(order)
+        self._ring = order + (-1,) * (self.capacity - len(order))
+        self._head = 0
+        self._count = len(order)
+
+    def draw(self):
+        """Take the top card, or None if the pile is empty."""
+        if not self._count:
+            return None
+        k = self._ring[self._head]
+        self._head = (self._head + 1) % self.capacity
+        self._count -= 1
+        return self.catalog[k]
+
+    def put_back(self, card):
+        """Return `card` to the bottom of the pile."""
+        if self._count >= self.capacity:
+            raise ValueError("deck is full")
+        tail = (self._head + self._count) % self.capacity
+        k = card.catalog_index
+        if self._ring[tail] != k:
+            ring = list(self._ring)
+            ring[tail] = k
+            self._ring = tuple(ring)
+        self._count += 1
+
+    def order(self):
+        """Catalog indices from the top of the pile down."""
+        ring, head, cap = self._ring, self._head, self.capacity
+        return [ring[(head + i) % cap] for i in range(self._count)]
+
+    def shuffle(self, rng):
+        order = self.order()
+        rng.shuffle(order)
+        self.load(order)
+
+    def snapshot(self):
+        return (self._ring, self._head, self._count)
+
+    def restore(self, snap):
+        self._ring, self._head, self._count = snap
+
+    def fork(self):
+        return _copy_slots(self)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (self.catalog[k] for k in self.order())
 
 class Space:
     #Base Class for Spaces
+    # Slotted (as are Player and Card) so forked games stay small; `type` is
+    # fixed at construction and is always present, so read it directly.
+    __slots__ = ("name", "index", "type", "_owner", "board")
+
     def __init__(self, name: str, index: int, space_type: str):
         self.name = name
         self.index = index
         self.type = space_type
+        self._owner = None
+        self.board = None  # set by Board once the board is built
+
+    @property
+    def owner(self):
+        return self._owner
+
+    @owner.setter
+    def owner(self, player):
+        # Every title transfer goes through here, so the per-player group
+        # counters stay in step no matter which code path moved the title.
+        old = self._owner
+        if old is player:
+            return
+        self._owner = player
+        if old is not None:
+            old._title_changed(self, -1)
+        if player is not None:
+            player._title_changed(self, +1)
+        if self.board is not None:
+            self.board.space_changed(self, "owner", old, player)
 
     def land_on(self, player, board):
-        print(f"  {player.name} landed on {self.name} ({self.type}).")
+        board.game.log(LOG_VERBOSE, "  {} landed on {} ({}).", player.name, self.name, self.type)
 
 class GoSpace(Space):
+    __slots__ = ()
+
     def __init__(self, name: str, index: int):
         super().__init__(name, index, "Go")
 
@@ -170,9 +440,16 @@ class GoSpace(Space):
         #     player.collect_money(200)
         # elif(player.position > 0):
         #     player.collect_money(200)
-        print(f"{self.name} landed on Go and Collected $200.")
+        board.game.log(LOG_VERBOSE, "{} landed on Go and Collected $200.", self.name)
 
 class Property(Space):
+    __slots__ = ("cost", "color_group", "rent_values", "house_cost", "_num_houses",
+                 "_has_hotel", "_is_mortgaged", "mortgage_value", "group_size")
+
+    num_houses = _tracked("num_houses", _space_notify)
+    has_hotel = _tracked("has_hotel", _space_notify)
+    is_mortgaged = _tracked("is_mortgaged", _space_notify)
+
     def __init__(self, name: str, index: int, cost: int, color_group: tuple[int, int, int],
                  rent_values: list, house_cost: int, mortgage_value: int):
         
@@ -182,10 +459,11 @@ class Property(Space):
         self.color_group = color_group
         self.rent_values = rent_values
         self.house_cost = house_cost
-        self.num_houses = 0
-        self.has_hotel = False
-        self.is_mortgaged = False
+        self._num_houses = 0
+        self._has_hotel = False
+        self._is_mortgaged = False
         self.mortgage_value = mortgage_value
+        self.group_size = 0  # filled in by Board once the whole board exists
 
     def calculate_rent(self, player_has_monopoly: bool):
         if self.is_mortgaged:
@@ -204,11 +482,11 @@ class Property(Space):
             affordable = player.money >= self.cost
             board.game.pending_purchase ={"player": player, "property": self, "affordable": affordable}
             # if property is unowned and player can afford it -> we save info in the pending_purchase
+            # declined (or unaffordable) titles are auctioned if Game.auctions is set
             if affordable:
-                print(f"  {player.name} may buy {self.name} for ${self.cost}.")
-                    #In a full game, this would trigger an auction. Simplified for now.
+                board.game.log(LOG_VERBOSE, "  {} may buy {} for ${}.", player.name, self.name, self.cost)
             else:
-                print(f"  {player.name} cannot afford {self.name} (${self.cost}).")
+                board.game.log(LOG_VERBOSE, "  {} cannot afford {} (${}).", player.name, self.name, self.cost)
             return
 
         elif self.owner != player:
@@ -222,13 +500,13 @@ class Property(Space):
                     "property": self,
                     "amount": rent_amount
                 }
-                print(f"  {player.name} landed on {self.name} (owned by {self.owner.name}) and pays ${rent_amount} rent.")
+                board.game.log(LOG_EVENTS, "  {} landed on {} (owned by {}) and pays ${} rent.", player.name, self.name, self.owner.name, rent_amount)
             else:
-                print(f"  {self.name} is mortgaged, no rent due.")
+                board.game.log(LOG_VERBOSE, "  {} is mortgaged, no rent due.", self.name)
             return 
 
         else:
-            print(f"  {player.name} landed on their own property, {self.name}.")
+            board.game.log(LOG_VERBOSE, "  {} landed on their own property, {}.", player.name, self.name)
             # can_house, _ = self.can_build_house(player, board)
             # can_hotel, _ = self.can_build_hotel(player, board)
             # can_sell_house, _ = self.can_sell_house(player, board)
@@ -251,8 +529,7 @@ class Property(Space):
 
     def group_mates(self, board):
         """All properties in my color group (including me)."""
-        return [s for s in board.spaces
-                if isinstance(s, Property) and s.color_group == self.color_group]
+        return [board.spaces[i] for i in board.color_groups[self.color_group]]
     
     def can_build_house(self, owner, board):
         if self.owner != owner: return (False, "Not owner")
@@ -262,10 +539,10 @@ class Property(Space):
         if not owner.has_monopoly(self.color_group, board):
             return(False, "Need monpoly")
     
-        if any(p.is_mortgaged for p in self.group_mates(board)):
+        group = self.group_mates(board)
+        if any(p.is_mortgaged for p in group):
             return (False, "Unmortgage the whole set first")
         
-        group = self.group_mates(board)
         no_hotel = [p for p in group if not p.has_hotel]
         min_houses = min((p.num_houses for p in no_hotel), default=4)
         if self.num_houses > min_houses:
@@ -296,7 +573,8 @@ class Property(Space):
         owner.pay_money(self.house_cost)
         self.num_houses += 1
         owner.board.game.houses_remaining -= 1
-        print(f"{owner.name} built a house on {self.name} (now {self.num_houses}).")
+        owner.board.game.log(LOG_EVENTS, "{} built a house on {} (now {}).", owner.name, self.name, self.num_houses)
+        owner.board.game.emit(EV_BUILD_HOUSE, owner, None, self.index, self.house_cost)
     
     def build_hotel(self, owner):
         owner.pay_money(self.house_cost)
@@ -304,7 +582,8 @@ class Property(Space):
         self.has_hotel = True
         owner.board.game.hotels_remaining -= 1
         owner.board.game.houses_remaining += 4
-        print(f"{owner.name} built a HOTEL on {self.name}.")
+        owner.board.game.log(LOG_EVENTS, "{} built a HOTEL on {}.", owner.name, self.name)
+        owner.board.game.emit(EV_BUILD_HOTEL, owner, None, self.index, self.house_cost)
 
     def can_sell_house(self, owner, board):
         if self.owner != owner:
@@ -335,7 +614,8 @@ class Property(Space):
         owner.collect_money(self.house_cost // 2)
         self.num_houses = max(0, self.num_houses - 1)
         owner.board.game.houses_remaining += 1
-        print(f"{owner.name} sold a house on {self.name} (now {self.num_houses}).")
+        owner.board.game.log(LOG_EVENTS, "{} sold a house on {} (now {}).", owner.name, self.name, self.num_houses)
+        owner.board.game.emit(EV_SELL_HOUSE, owner, None, self.index, self.house_cost // 2)
 
     # bank pays half the hotel price - hotel price equal the house price of color set
     def sell_hotel(self, owner):
@@ -344,7 +624,8 @@ class Property(Space):
         owner.board.game.hotels_remaining += 1
         self.has_hotel = False
         self.num_houses = 4
-        print(f"{owner.name} sold a HOTEL on {self.name} (now 4 houses).")
+        owner.board.game.log(LOG_EVENTS, "{} sold a HOTEL on {} (now 4 houses).", owner.name, self.name)
+        owner.board.game.emit(EV_SELL_HOTEL, owner, None, self.index, self.house_cost // 2)
 
     def can_mortgage(self, owner, board):
         """Owner may mortgage only if this title is unmortgaged, owned by them,
@@ -374,22 +655,28 @@ class Property(Space):
         # we trust UI/Game to check; still keep it safe:
         self.is_mortgaged = True
         owner.collect_money(self.mortgage_value)
-        print(f"{owner.name} mortgaged {self.name} for ${self.mortgage_value}.")
+        owner.board.game.log(LOG_EVENTS, "{} mortgaged {} for ${}.", owner.name, self.name, self.mortgage_value)
+        owner.board.game.emit(EV_MORTGAGE, owner, None, self.index, self.mortgage_value)
 
     def unmortgage(self, owner):
         import math
         payoff = int(math.ceil(self.mortgage_value * 1.10))
         self.is_mortgaged = False
         owner.pay_money(payoff)
-        print(f"{owner.name} unmortgaged {self.name} by paying ${payoff}.")
+        owner.board.game.log(LOG_EVENTS, "{} unmortgaged {} by paying ${}.", owner.name, self.name, payoff)
+        owner.board.game.emit(EV_UNMORTGAGE, owner, None, self.index, payoff)
 
 class Railroad(Space):
     """Represents a Railroad property."""
+    __slots__ = ("cost", "_is_mortgaged", "mortgage_value")
+
+    is_mortgaged = _tracked("is_mortgaged", _space_notify)
+
     def __init__(self, name: str, index: int, cost: int, mortgage_value: int):
         super().__init__(name, index, "Railroad")
         self.cost = cost
         self.owner = None
-        self.is_mortgaged = False # Simplified: not actively used for mortgage logic
+        self._is_mortgaged = False
         self.mortgage_value = mortgage_value
 
     def calculate_rent(self, num_railroads_owned: int):
@@ -405,9 +692,9 @@ class Railroad(Space):
                 affordable = player.money >= self.cost
                 board.game.pending_purchase = {"player": player, "property": self, "affordable": affordable}
                 if affordable:
-                    print(f"  {player.name} may buy {self.name} for ${self.cost}.")
+                    board.game.log(LOG_VERBOSE, "  {} may buy {} for ${}.", player.name, self.name, self.cost)
                 else:
-                    print(f"  {player.name} cannot afford {self.name} (${self.cost}).")
+                    board.game.log(LOG_VERBOSE, "  {} cannot afford {} (${}).", player.name, self.name, self.cost)
                 return
     
         elif self.owner != player:
@@ -421,12 +708,12 @@ class Railroad(Space):
                     "property": self,
                     "amount": rent_amount
                 }
-                print(f"  {player.name} landed on {self.name} (owned by {self.owner.name}) and pays ${rent_amount} rent.")
+                board.game.log(LOG_EVENTS, "  {} landed on {} (owned by {}) and pays ${} rent.", player.name, self.name, self.owner.name, rent_amount)
 
             else:
-                print(f"  {self.name} is mortgaged, no rent due.")
+                board.game.log(LOG_VERBOSE, "  {} is mortgaged, no rent due.", self.name)
         else:
-            print(f"  {player.name} landed on their own railroad, {self.name}.")
+            board.game.log(LOG_VERBOSE, "  {} landed on their own railroad, {}.", player.name, self.name)
 
     def can_mortgage(self, owner, board=None):
         if self.owner != owner: return (False, "Not owner")
@@ -443,20 +730,26 @@ class Railroad(Space):
     def mortgage(self, owner):
         self.is_mortgaged = True
         owner.collect_money(self.mortgage_value)
-        print(f"{owner.name} mortgaged {self.name} for ${self.mortgage_value}.")
+        owner.board.game.log(LOG_EVENTS, "{} mortgaged {} for ${}.", owner.name, self.name, self.mortgage_value)
+        owner.board.game.emit(EV_MORTGAGE, owner, None, self.index, self.mortgage_value)
 
     def unmortgage(self, owner):
         payoff = int(round(self.mortgage_value * 1.10))
         self.is_mortgaged = False
         owner.pay_money(payoff)
-        print(f"{owner.name} unmortgaged {self.name} by paying ${payoff}.")
+        owner.board.game.log(LOG_EVENTS, "{} unmortgaged {} by paying ${}.", owner.name, self.name, payoff)
+        owner.board.game.emit(EV_UNMORTGAGE, owner, None, self.index, payoff)
 
 class Utility(Space):
+    __slots__ = ("cost", "_is_mortgaged", "mortgage_value")
+
+    is_mortgaged = _tracked("is_mortgaged", _space_notify)
+
     def __init__(self, name: str, index: int, cost: int, mortgage_value: int):
         super().__init__(name, index, "Utility")
         self.cost = cost
         self.owner = None
-        self.is_mortgaged = False #not actively used for mortgage logic
+        self._is_mortgaged = False
         self.mortgage_value = mortgage_value
 
     def calculate_rent(self, dice_roll_sum: int, num_utilities_owned: int):
@@ -474,9 +767,9 @@ class Utility(Space):
             affordable = player.money >= self.cost
             board.game.pending_purchase = {"player": player, "property": self, "affordable": affordable}
             if affordable:
-                print(f"  {player.name} may buy {self.name} for ${self.cost}.")
+                board.game.log(LOG_VERBOSE, "  {} may buy {} for ${}.", player.name, self.name, self.cost)
             else:
-                print(f"  {player.name} cannot afford {self.name} (${self.cost}).")
+                board.game.log(LOG_VERBOSE, "  {} cannot afford {} (${}).", player.name, self.name, self.cost)
             return
         elif self.owner != player:
             # Utility is owned by another player, pay rent
@@ -490,13 +783,13 @@ class Utility(Space):
                     "property": self,
                     "amount": rent_amount
                 }
-                print(f"  {player.name} landed on {self.name} (owned by {self.owner.name}) and pays ${rent_amount} rent.")
+                board.game.log(LOG_EVENTS, "  {} landed on {} (owned by {}) and pays ${} rent.", player.name, self.name, self.owner.name, rent_amount)
                 # player.pay_money(rent_amount)
                 # self.owner.collect_money(rent_amount)
             else:
-                print(f"  {self.name} is mortgaged, no rent due.")
+                board.game.log(LOG_VERBOSE, "  {} is mortgaged, no rent due.", self.name)
         else:
-            print(f"  {player.name} landed on their own utility, {self.name}.")
+            board.game.log(LOG_VERBOSE, "  {} landed on their own utility, {}.", player.name, self.name)
 
     def can_mortgage(self, owner, board=None):
         if self.owner != owner: return (False, "Not owner")
@@ -513,15 +806,19 @@ class Utility(Space):
     def mortgage(self, owner):
         self.is_mortgaged = True
         owner.collect_money(self.mortgage_value)
-        print(f"{owner.name} mortgaged {self.name} for ${self.mortgage_value}.")
+        owner.board.game.log(LOG_EVENTS, "{} mortgaged {} for ${}.", owner.name, self.name, self.mortgage_value)
+        owner.board.game.emit(EV_MORTGAGE, owner, None, self.index, self.mortgage_value)
 
     def unmortgage(self, owner):
         payoff = int(round(self.mortgage_value * 1.10))
         self.is_mortgaged = False
         owner.pay_money(payoff)
-        print(f"{owner.name} unmortgaged {self.name} by paying ${payoff}.")
+        owner.board.game.log(LOG_EVENTS, "{} unmortgaged {} by paying ${}.", owner.name, self.name, payoff)
+        owner.board.game.emit(EV_UNMORTGAGE, owner, None, self.index, payoff)
 
 class TaxSpace(Space):
+    __slots__ = ("tax_amount",)
+
     def __init__(self, name: str, index: int, tax_amount: int):
         super().__init__(name, index, "Tax")
         self.tax_amount = tax_amount
@@ -533,17 +830,19 @@ class TaxSpace(Space):
             "amount": self.tax_amount,
             "name": self.name
         }
-        print(f"  {player.name} pays ${self.tax_amount} for {self.name}.")
+        board.game.log(LOG_VERBOSE, "  {} pays ${} for {}.", player.name, self.tax_amount, self.name)
 
 class ChanceSpace(Space):
+    __slots__ = ()
+
     def __init__(self, name: str, index: int):
         super().__init__(name, index, "Chance")
 
     def land_on(self, player, board):
         super().land_on(player, board)
         # Draw and execute a Chance card
-        if board.game.chance_cards:
-            card = board.game.chance_cards.pop(0) # Take card from top
+        card = board.game.chance_cards.draw() # Take card from top
+        if card is not None:
             board.game.last_drawn_card = card
             board.game.pending_card ={
                 "type": "Chance",
@@ -551,17 +850,19 @@ class ChanceSpace(Space):
                 "player": player
             }
         else:
-            print("  Chance deck is empty!")
+            board.game.log(LOG_VERBOSE, "  Chance deck is empty!")
 
 class CommunityChestSpace(Space):
+    __slots__ = ()
+
     def __init__(self, name: str, index: int):
         super().__init__(name, index, "Community Chest")
 
     def land_on(self, player, board):
         super().land_on(player, board)
         # Draw and execute a Community Chest card
-        if board.game.community_chest_cards:
-            card = board.game.community_chest_cards.pop(0) # Take card from top
+        card = board.game.community_chest_cards.draw() # Take card from top
+        if card is not None:
             board.game.last_drawn_card = card
             board.game.pending_card ={
                 "type": "Community Chest",
@@ -569,22 +870,27 @@ class CommunityChestSpace(Space):
                 "player": player
             }        
         else:
-            print("  Community Chest deck is empty!")
+            board.game.log(LOG_VERBOSE, "  Community Chest deck is empty!")
 
 class GoToJailSpace(Space):
+    __slots__ = ()
+
     def __init__(self, name: str, index: int):
         super().__init__(name, index, "GoToJail")
 
     def land_on(self, player, board):
         super().land_on(player, board)
-        print(f"  {player.name} sent to Jail!")
+        board.game.log(LOG_EVENTS, "  {} sent to Jail!", player.name)
+        board.game.emit(EV_JAIL, player)
         # player.in_jail = True
         # player.position = board.jail_space_index # Move to Jail space
         # player.jail_turns = 0 # Reset jail turns for entering via card
-        board.game.pending_jail.append({"player": player})
+        board.game.queue_jail(player)
         player.doubles_rolled_consecutive = 0
 
 class JailSpace(Space):
+    __slots__ = ()
+
     def __init__(self, name: str, index: int):
         super().__init__(name, index, "Jail")
 
@@ -594,12 +900,14 @@ class JailSpace(Space):
         # The 'in_jail' status and related logic is handled by Game.handle_jail_turn
 
 class FreeParkingSpace(Space):
+    __slots__ = ()
+
     def __init__(self, name: str, index: int):
         super().__init__(name, index, "Free Parking")
 
     def land_on(self, player, board):
         super().land_on(player, board)
-        print(f"  {player.name} is just visiting Free Parking.")
+        board.game.log(LOG_VERBOSE, "  {} is just visiting Free Parking.", player.name)
         # Default Monopoly rules: Free Parking does nothing.
 
 class Board:
@@ -683,20 +991,229 @@ class Board:
         self.spaces.append(TaxSpace("Luxury Tax", 38, 100)) # Fixed tax of $100
         self.spaces.append(Property("Boardwalk", 39, 400, (0, 0, 139), [50, 200, 600, 1400, 1700, 2000], 200, 200))
 
+        # Group membership tables (board indices), built once and never mutated.
+        groups = {}
+        for sp in self.spaces:
+            if isinstance(sp, Property):
+                groups.setdefault(sp.color_group, []).append(sp.index)
+        self.color_groups = {cg: tuple(ix) for cg, ix in groups.items()}
+        for cg, ix in self.color_groups.items():
+            for i in ix:
+                self.spaces[i].group_size = len(ix)
+        self.property_indices = tuple(sp.index for sp in self.spaces if isinstance(sp, Property))
+        self.railroad_indices = tuple(sp.index for sp in self.spaces if isinstance(sp, Railroad))
+        self.utility_indices = tuple(sp.index for sp in self.spaces if isinstance(sp, Utility))
+
+        # Bumped on every title transfer, build/sell and (un)mortgage; lets
+        # caches derived from the board (rent tables) know when to rebuild.
+        self.version = 0
+        self._owned_ratio = (-1, 0.0)
+        for sp in self.spaces:
+            sp.board = self
+
+    def owned_ratio(self):
+        """Share of color-group titles that have an owner: how far the game
+        has progressed. Cached until the board changes."""
+        version, ratio = self._owned_ratio
+        if version != self.version:
+            spaces = self.spaces
+            owned = sum(1 for i in self.property_indices if spaces[i]._owner is not None)
+            ratio = owned / (len(self.property_indices) or 1)
+            self._owned_ratio = (self.version, ratio)
+        return ratio
+
+    def space_changed(self, space, field, old, new):
+        """Called by Space whenever owner, houses, hotel or mortgage changes."""
+        self.version += 1
+        game = self.game
+        game.version += 1
+        if game._journal is not None:
+            game._journal.append((space, field, old))
+        i = space.index
+        if field == "owner":
+            z = (Z_OWNER[old.seat][i] if old is not None else 0) ^ \
+                (Z_OWNER[new.seat][i] if new is not None else 0)
+        elif field == "num_houses":
+            z = Z_HOUSES[i][old] ^ Z_HOUSES[i][new]
+        elif field == "has_hotel":
+            z = Z_HOTEL[i]
+        else:
+            z = Z_MORTGAGED[i]
+        game.state_hash ^= z
+
+def _fork_value(value, memo):
+    """Re-point Player/Space references inside pending_* structures (dicts,
+    lists, trade chains) at their copies in a cloned game."""
+    if isinstance(value, (Player, Space)):
+        return memo.get(id(value), value)
+    if isinstance(value, dict):
+        return {k: _fork_value(v, memo) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fork_value(v, memo) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_fork_value(v, memo) for v in value)
+    if isinstance(value, set):
+        return {_fork_value(v, memo) for v in value}
+    return value
+
+def _fork_rng(rng):
+    """Independent generator that continues from `rng`'s current state."""
+    r = random.Random.__new__(random.Random)  # skip the os.urandom seeding
+    r.setstate(rng.getstate())
+    return r
+
+_SLOT_NAMES = {}
+
+def _copy_slots(obj):
+    """Shallow copy of a slotted object (much cheaper than copy.copy)."""
+    cls = type(obj)
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = tuple(n for k in cls.__mro__ for n in k.__dict__.get("__slots__", ()))
+        _SLOT_NAMES[cls] = names
+    c = cls.__new__(cls)
+    for n in names:
+        setattr(c, n, getattr(obj, n))
+    return c
+
+class TurnPolicy:
+    """Decision callbacks for the headless turn engine (Game.step/run_turn).
+
+    Each on_* hook is handed the player who owes the decision and should
+    settle the open modal through the normal Game API. Whatever a hook leaves
+    open is settled with these defaults, so a turn always makes progress:
+    buy when affordable, never build, roll in jail, refuse trades, and go
+    bankrupt over a debt that cash can't cover."""
+
+    def on_turn_start(self, game, player):
+        """Before the roll: trades, building, mortgaging."""
+
+    def on_purchase(self, game, player):
+        game.confirm_purchase(game.pending_purchase.get("affordable", True))
+
+    def on_build(self, game, player):
+        game.confirm_build("skip")
+
+    def on_jail_turn(self, game, player):
+        game.roll_for_doubles_from_jail(player)
+
+    def on_debt(self, game, player):
+        info = game.pending_debt
+        if player.money >= info["amount"]:
+            player.pay_money(info["amount"])
+            if info.get("creditor"):
+                info["creditor"].collect_money(info["amount"])
+            game.clear_debt()
+        else:
+            game.declare_bankruptcy(player, info.get("creditor"))
+            game.clear_debt()
+
+    def on_trade(self, game, player):
+        game.reject_trade()
+
+_DEFAULT_POLICY = TurnPolicy()
+
+class Bidder:
+    """Auction behaviour for one player (see Game.enable_auctions).
+
+    max_bid() is all a sealed-bid auction asks; ascending auctions call
+    accept() at each price, which defaults to the same limit. The default
+    pays list price, half again to complete a set, a fifth more to stop an
+    opponent completing one, and never bids into a cash buffer."""
+    BUFFER = 100
+
+    def max_bid(self, game, player, prop):
+        value = prop.cost
+        group = getattr(prop, "color_group", None)
+        if group is not None:
+            need = prop.group_size - 1
+            if player.group_counts.get(group, 0) == need:
+                value = value * 3 // 2
+            elif any(p.group_counts.get(group, 0) == need for p in game.players if p is not player):
+                value = value * 6 // 5
+        elif prop.type == "Railroad":
+            value += value * player.railroads_owned // 10
+        return max(0, min(value, player.money - self.BUFFER))
+
+    def accept(self, game, player, prop, price):
+        """Ascending auctions: stay in at `price`?"""
+        return price <= self.max_bid(game, player, prop)
+
+_DEFAULT_BIDDER = Bidder()
+
+class Auctions:
+    """Auction rules: `mode` "sealed" (every bidder names a limit once; the
+    highest wins at the runner-up's limit plus `increment`, which is where an
+    open auction between those limits would stop) or "ascending" (bidders
+    are asked in seat order, from the current player, to raise by
+    `increment` until a full round passes). `bidders` maps player name ->
+    Bidder; missing names get the default."""
+
+    def __init__(self, bidders=None, mode="sealed", increment=10):
+        if mode not in ("sealed", "ascending"):
+            raise ValueError(f"unknown auction mode {mode!r}")
+        self.bidders = dict(bidders or {})
+        self.mode = mode
+        self.increment = increment
+
+    def bidder(self, player):
+        return self.bidders.get(player.name, _DEFAULT_BIDDER)
+
+# decision kind -> TurnPolicy hook
+_HOOKS = {D_DEBT: "on_debt", D_JAIL_TURN: "on_jail_turn", D_PURCHASE: "on_purchase",
+          D_BUILD: "on_build", D_TRADE: "on_trade"}
+
 class Game:
-    def __init__(self, player_names: list):
+    pending_card = _modal("pending_card", D_CARD)
+    last_drawn_card = _modal("last_drawn_card", D_CARD)
+    pending_rent = _modal("pending_rent", D_RENT)
+    pending_tax = _modal("pending_tax", D_TAX)
+    pending_jail = _modal("pending_jail", D_JAIL)
+    pending_bankrupt_notice = _modal("pending_bankrupt_notice", D_BANKRUPT_NOTICE)
+    pending_debt = _modal("pending_debt", D_DEBT)
+    pending_jail_turn = _modal("pending_jail_turn", D_JAIL_TURN)
+    pending_purchase = _modal("pending_purchase", D_PURCHASE)
+    pending_build = _modal("pending_build", D_BUILD)
+    pending_trade = _modal("pending_trade", D_TRADE)
+
+    def __init__(self, player_names: list, verbosity: int = LOG_VERBOSE, log_sink=None, seed=None):
+        # Logging: messages at or below `verbosity` go to log_sink(level, message).
+        # Headless runs pass verbosity=LOG_QUIET.
+        self.verbosity = verbosity
+        self.log_sink = log_sink or print_sink
+        # Randomness: `seed` fans out into independent streams for the dice,
+        # the decks and (via spawn_rng) any bot playing this game, so search
+        # never shifts the dice and concurrent games never share state.
+        self.seed = seed
+        self._seed_stream = random.Random(seed)
         self.board = Board(self)
+        if len(player_names) > MAX_SEATS:
+            raise ValueError(f"at most {MAX_SEATS} players")
         self.players = [Player(name) for name in player_names]
-        for p in self.players:
+        for seat, p in enumerate(self.players):
             p.board = self.board
+            p.seat = seat
         
         self.current_player_index = 0
         self.turn_number = 0
         self.game_over = False
         self.winner = None
-        self.dice = Dice()
-        self.chance_cards = self._initialize_cards("Chance")
-        self.community_chest_cards = self._initialize_cards("Community Chest")
+        self.dice = Dice(self, rng=self.spawn_rng())
+        chance = self._initialize_cards("Chance")
+        chest = self._initialize_cards("Community Chest")
+        # Every card in printed order; decks and snapshots refer to cards by index
+        self.card_catalog = tuple(chance + chest)
+        for k, card in enumerate(self.card_catalog):
+            card.catalog_index = k
+        self.chance_cards = Deck(self.card_catalog, range(len(chance)))
+        self.community_chest_cards = Deck(self.card_catalog, range(len(chance), len(self.card_catalog)))
+        # Bumped on every change to a player, space or modal; keys the
+        # legal_actions cache
+        self.version = 0
+        self._legal = {}
+        # Bit k set <=> a decision of kind k (D_*) is open; kept by the
+        # pending_* setters
+        self._pending = 0
         self.pending_purchase = None
         self.last_drawn_card = None
         self.pending_card = None
@@ -708,12 +1225,24 @@ class Game:
         self.pending_debt = None
         self.pending_bankrupt_notice = None
         self.pending_trade = None
+        # Typed event stream (events.EventLog); None records nothing
+        self.events = None
+        # Auction rules for declined titles (see enable_auctions); None keeps
+        # them with the bank
+        self.auctions = None
         self.houses_remaining = 32
         self.hotels_remaining = 12
+        self.turn_phase = TURN_START
+        # Undo journal (see push/pop): tracked-field writes are logged while
+        # any frame is open
+        self._journal = None
+        self._frames = []
+        self.rehash()
 
         # Shuffle cards
-        random.shuffle(self.chance_cards)
-        random.shuffle(self.community_chest_cards)
+        self.deck_rng = self.spawn_rng()
+        self.chance_cards.shuffle(self.deck_rng)
+        self.community_chest_cards.shuffle(self.deck_rng)
 
     def _initialize_cards(self, card_type: str):
         cards = []
@@ -749,6 +1278,368 @@ class Game:
 
         return cards
 
+    def spawn_rng(self):
+        """A new generator derived from this game's seed."""
+        return random.Random(self._seed_stream.getrandbits(64))
+
+    def log(self, level, message, *args):
+        """Send `message.format(*args)` to the sink if `level` is enabled."""
+        if level <= self.verbosity:
+            self.log_sink(level, message.format(*args) if args else message)
+
+    def emit(self, kind, player, other=None, index=-1, amount=0):
+        """Record an engine event (see events.py) if a log is attached."""
+        ev = self.events
+        if ev is not None:
+            ev.emit(self.turn_number, kind, player.seat,
+                    other.seat if other is not None else -1, index, amount)
+
+    def record_events(self, capacity=4096, path=None):
+        """Attach (and return) an EventLog that records this game's events."""
+        self.events = EventLog(capacity, path)
+        return self.events
+
+    def enable_auctions(self, bidders=None, mode="sealed", increment=10):
+        """Auction every title a player declines or can't afford. Returns
+        the Auctions rules; game.auctions = None turns them off again."""
+        self.auctions = Auctions(bidders, mode, increment)
+        return self.auctions
+
+    def auction(self, prop):
+        """Sell unowned `prop` to the highest bidder under self.auctions.
+        Returns (winner, price), or (None, 0) if nobody bids."""
+        rules = self.auctions
+        if rules is None or prop.owner is not None or not self.players:
+            return None, 0
+        n = len(self.players)
+        start = self.current_player_index % n
+        order = self.players[start:] + self.players[:start]
+        step = rules.increment
+        leader, price = None, 0
+        if rules.mode == "sealed":
+            limits = [min(rules.bidder(p).max_bid(self, p, prop), p.money) for p in order]
+            top = max(limits)
+            if top >= step:
+                leader = order[limits.index(top)]   # ties go to the earliest seat
+                runner_up = max((b for p, b in zip(order, limits) if p is not leader), default=0)
+                price = min(top, max(runner_up + step, step))
+        else:
+            active = list(order)
+            raised = True
+            while raised and len(active) > (leader is not None):
+                raised = False
+                for p in list(active):
+                    if p is leader:
+                        continue
+                    bid = price + step
+                    if p.money >= bid and rules.bidder(p).accept(self, p, prop, bid):
+                        leader, price, raised = p, bid, True
+                    else:
+                        active.remove(p)
+        if leader is None:
+            self.log(LOG_EVENTS, "Nobody bid for {}; it stays with the bank.", prop.name)
+            return None, 0
+        leader.pay_money(price)
+        leader.add_property(prop)
+        self.log(LOG_EVENTS, "{} won {} at auction for ${}.", leader.name, prop.name, price)
+        self.emit(EV_AUCTION, leader, None, prop.index, price)
+        return leader, price
+
+    def set_logging(self, verbosity, log_sink=None):
+        self.verbosity = verbosity
+        if log_sink is not None:
+            self.log_sink = log_sink
+
+    def clone(self):
+        """Fork an independent copy of this game for search/lookahead.
+        Board spaces, players, decks and every pending_* modal are copied and
+        re-pointed at the fork, so mutating the clone never touches this game.
+        Cards are shared (they are never mutated); decks share their order
+        tuple until one side puts a card back out of order."""
+        g = Game.__new__(Game)
+        memo = {}
+
+        board = Board.__new__(Board)
+        board.__dict__.update(self.board.__dict__)
+        board.game = g
+        board.spaces = []
+        for sp in self.board.spaces:
+            c = _copy_slots(sp)
+            c.board = board
+            memo[id(sp)] = c
+            board.spaces.append(c)
+
+        players = []
+        for p in self.players:
+            c = _copy_slots(p)
+            c.board = board
+            c.group_counts = dict(p.group_counts)
+            c.monopolies = set(p.monopolies)
+            memo[id(p)] = c
+            players.append(c)
+        for c in players:
+            c.properties_owned = [memo[id(s)] for s in c.properties_owned]
+        for c in board.spaces:
+            # assign the slot directly: the copied counters are already right
+            owner = c._owner
+            if owner is not None:
+                c._owner = memo.get(id(owner), owner)
+
+        for k, v in self.__dict__.items():
+            g.__dict__[k] = _fork_value(v, memo)
+        g.board = board
+        g.players = players
+        g.dice = _copy_slots(self.dice)
+        g.dice.game = g
+        g.dice.rng = _fork_rng(self.dice.rng)
+        g.chance_cards = self.chance_cards.fork()
+        g.community_chest_cards = self.community_chest_cards.fork()
+        g.deck_rng = _fork_rng(self.deck_rng)
+        g._seed_stream = _fork_rng(self._seed_stream)
+        g._journal = None
+        g._frames = []
+        g._legal = {}
+        g.events = None  # lookahead on a fork is not part of the record
+        return g
+
+    # ---------- state hash ----------
+    def rehash(self):
+        """Recompute state_hash from scratch. The engine keeps it current
+        incrementally; this is for construction and wholesale rewrites
+        (packed restore, a seat leaving)."""
+        h = 0
+        live = 0
+        for p in self.players:
+            s = p.seat
+            live |= 1 << s
+            h ^= Z_CASH[s][_cash_bucket(p._money)] ^ Z_POSITION[s][p._position] \
+                ^ Z_JAIL[s][_jail_code(p._in_jail, p._jail_turns)]
+        for sp in self.board.spaces:
+            i = sp.index
+            if sp._owner is not None:
+                h ^= Z_OWNER[sp._owner.seat][i]
+            if isinstance(sp, Property):
+                h ^= Z_HOUSES[i][sp._num_houses]
+                if sp._has_hotel:
+                    h ^= Z_HOTEL[i]
+            if getattr(sp, "_is_mortgaged", False):
+                h ^= Z_MORTGAGED[i]
+        self.state_hash = h
+        self._live_seats = live
+        self.version += 1
+        return h
+
+    def player_changed(self, player, field, old, new):
+        """Called by Player whenever money, position or jail status changes."""
+        self.version += 1
+        if self._journal is not None:
+            self._journal.append((player, field, old))
+        s = player.seat
+        if not self._live_seats >> s & 1:
+            return  # off the board: not part of the hash
+        if field == "money":
+            keys = Z_CASH[s]
+            a = old // CASH_BUCKET + 1
+            b = new // CASH_BUCKET + 1
+            if a == b:
+                return
+            z = keys[min(max(a, 0), CASH_BUCKETS - 1)] ^ keys[min(max(b, 0), CASH_BUCKETS - 1)]
+        elif field == "position":
+            z = Z_POSITION[s][old] ^ Z_POSITION[s][new]
+        elif field == "in_jail":
+            t = player._jail_turns
+            z = Z_JAIL[s][_jail_code(old, t)] ^ Z_JAIL[s][_jail_code(new, t)]
+        else:
+            j = player._in_jail
+            z = Z_JAIL[s][_jail_code(j, old)] ^ Z_JAIL[s][_jail_code(j, new)]
+        self.state_hash ^= z
+
+    def fingerprint(self):
+        """64-bit Zobrist key of the position: owners, houses, hotels and
+        mortgages; each seated player's cash (in $50 buckets), square and jail
+        status; whose turn it is and the turn phase. Equal positions give equal
+        keys across games, clones and processes. Open pending_* modals, decks,
+        GOJF cards and the turn counter are not part of it."""
+        cur = self.players[self.current_player_index % len(self.players)] if self.players else None
+        return self.state_hash ^ (Z_TURN[cur.seat][self.turn_phase] if cur is not None else 0)
+
+    # ---------- decisions ----------
+    def decision_pending(self):
+        """True while any pending_* modal is open."""
+        return self._pending != 0
+
+    def next_decision(self):
+        """The decision step() will settle next, as Decision(kind, player,
+        info), or None when the turn can simply move on. `player` owes the
+        decision (None for a bankruptcy notice); `info` is the modal dict
+        (the head entry for the jail queues)."""
+        m = self._pending
+        if not m:
+            return None
+        kind = (m & -m).bit_length() - 1
+        attr, key = _DECISIONS[kind]
+        info = getattr(self, attr)
+        if kind == D_JAIL or kind == D_JAIL_TURN:
+            info = info[0]
+        player = info.get(key) if info and key else None
+        return Decision(kind, player, info)
+
+    def queue_jail(self, player):
+        """Queue the "go to jail" notice for `player`."""
+        self.pending_jail = self.pending_jail + [{"player": player}]
+
+    # ---------- legal actions ----------
+    def legal_actions(self, player, manage=True):
+        """Every move open to `player` right now, as a tuple of Actions.
+
+        If `player` owes a decision (the first open one in D_* order that is
+        theirs), only its answers are legal. Otherwise, on their own turn with
+        nothing open, manage=True adds each BUILD_HOUSE/BUILD_HOTEL/SELL_HOUSE/
+        SELL_HOTEL/MORTGAGE/UNMORTGAGE the rules allow on their titles. NOOP
+        (carry on with the turn) comes last. Results are cached until the
+        game next changes."""
+        stamp = (self.version, player.get_out_of_jail_free_cards,
+                 self.current_player_index, self.turn_phase)
+        key = (player.seat, manage)
+        hit = self._legal.get(key)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+        acts = self._enumerate_actions(player, manage)
+        self._legal[key] = (stamp, acts)
+        return acts
+
+    def _enumerate_actions(self, player, manage):
+        m = self._pending
+        while m:
+            low = m & -m
+            m ^= low
+            kind = low.bit_length() - 1
+            if kind == D_CARD or kind == D_BANKRUPT_NOTICE:
+                continue  # settled by the engine, nobody chooses
+            attr, key = _DECISIONS[kind]
+            info = getattr(self, attr)
+            if kind == D_JAIL or kind == D_JAIL_TURN:
+                info = next((j for j in info if j.get("player") is player), None)
+            elif info.get(key) is not player:
+                info = None
+            if info is not None:
+                return self._decision_actions(kind, player, info)
+        if manage and not self._pending and self._is_current_player(player):
+            return self._manage_actions(player) + (_NOOP,)
+        return (_NOOP,)
+
+    def _decision_actions(self, kind, player, info):
+        if kind == D_RENT:
+            return (Action("PAY_RENT"),)
+        if kind == D_TAX:
+            return (Action("PAY_TAX"),)
+        if kind == D_JAIL:
+            return (Action("ACK_GO_TO_JAIL"),)
+        acts = []
+        if kind == D_DEBT:
+            if player.money >= info["amount"]:
+                acts.append(Action("PAY_DEBT"))
+            acts += (Action("RAISE_CASH"), Action("BANKRUPT"))
+        elif kind == D_JAIL_TURN:
+            if player.get_out_of_jail_free_cards > 0:
+                acts.append(Action("JAIL_USE_GOJF"))
+            if player.money >= 50:
+                acts.append(Action("JAIL_PAY"))
+            acts.append(Action("JAIL_ROLL"))
+        elif kind == D_PURCHASE:
+            prop = (info["property"],)
+            if info.get("affordable", True):
+                acts.append(Action("BUY", prop))
+            acts.append(Action("SKIP_PURCHASE", prop))
+        elif kind == D_BUILD:
+            prop = (info["property"],)
+            for flag, name in (("can_house", "BUILD_HOUSE"), ("can_hotel", "BUILD_HOTEL"),
+                               ("can_sell_house", "SELL_HOUSE"), ("can_sell_hotel", "SELL_HOTEL"),
+                               ("can_mortgage", "MORTGAGE"), ("can_unmortgage", "UNMORTGAGE")):
+                if info.get(flag):
+                    acts.append(Action(name, prop))
+            acts.append(Action("SKIP_BUILD"))
+        else:
+            acts += (Action("ACCEPT_TRADE"), Action("REJECT_TRADE"))
+        return tuple(acts)
+
+    def _manage_actions(self, player):
+        board = self.board
+        acts = []
+        for sp in player.properties_owned:
+            t = (sp,)
+            if isinstance(sp, Property):
+                if sp.can_build_house(player, board)[0]:
+                    acts.append(Action("BUILD_HOUSE", t))
+                if sp.can_build_hotel(player, board)[0]:
+                    acts.append(Action("BUILD_HOTEL", t))
+                if sp.can_sell_house(player, board)[0]:
+                    acts.append(Action("SELL_HOUSE", t))
+                if sp.can_sell_hotel(player, board)[0]:
+                    acts.append(Action("SELL_HOTEL", t))
+            if sp.can_mortgage(player, board)[0]:
+                acts.append(Action("MORTGAGE", t))
+            if sp.can_unmortgage(player)[0]:
+                acts.append(Action("UNMORTGAGE", t))
+        return tuple(acts)
+
+    # ---------- undo journal ----------
+    _UNDO_ATTRS = ("current_player_index", "turn_number", "game_over", "winner",
+                   "houses_remaining", "hotels_remaining", "turn_phase",
+                   "state_hash", "_live_seats", "_pending", "_pending_purchase",
+                   "_last_drawn_card", "_pending_card", "_pending_build", "_pending_rent",
+                   "_pending_tax", "_pending_debt", "_pending_bankrupt_notice",
+                   "_pending_trade")
+
+    def push(self, restore_rng=True):
+        """Open an undo frame; pop() puts the game back exactly as it is now.
+        Frames nest. Space and player fields are journalled as they change, so
+        a pop costs only what happened since the push; the rest (turn state,
+        modals, decks, title lists) is a shallow snapshot taken here.
+        restore_rng=False leaves the dice and deck generators running on, so
+        repeated push/pop lines see fresh rolls (sampling search)."""
+        d = self.__dict__
+        roster = tuple((p, p.properties_owned[:], p.get_out_of_jail_free_cards,
+                        p.doubles_rolled_consecutive) for p in self.players)
+        rng = (self.dice.rng.getstate(), self.deck_rng.getstate()) if restore_rng else None
+        if self._journal is None:
+            self._journal = []
+        self._frames.append((
+            len(self._journal), tuple(d[a] for a in self._UNDO_ATTRS),
+            list(self.players), roster, self.pending_jail[:], self.pending_jail_turn[:],
+            self.chance_cards.snapshot(), self.community_chest_cards.snapshot(),
+            self.dice.die1_value, self.dice.die2_value, rng))
+        return len(self._frames)
+
+    def pop(self):
+        """Revert everything since the matching push() and close that frame."""
+        if not self._frames:
+            raise IndexError("pop without a matching push")
+        (mark, values, players, roster, jail, jail_turn, chance, chest,
+         die1, die2, rng) = self._frames.pop()
+        journal = self._journal
+        self._journal = None  # the setters below must not log themselves
+        for obj, field, old in reversed(journal[mark:]):
+            setattr(obj, field, old)
+        del journal[mark:]
+        if self._frames:
+            self._journal = journal
+        self.__dict__.update(zip(self._UNDO_ATTRS, values))
+        self.players = players
+        for p, owned, gojf, doubles in roster:
+            p.properties_owned = owned
+            p.get_out_of_jail_free_cards = gojf
+            p.doubles_rolled_consecutive = doubles
+        self.pending_jail = jail
+        self.pending_jail_turn = jail_turn
+        self.chance_cards.restore(chance)
+        self.community_chest_cards.restore(chest)
+        self.dice.die1_value, self.dice.die2_value = die1, die2
+        if rng is not None:
+            self.dice.rng.setstate(rng[0])
+            self.deck_rng.setstate(rng[1])
+        self.version += 1  # the modals came back without their setters
+
     def _check_for_winner(self):
         """If only one player remains (hasn't been removed via bankruptcy), end the game."""
         active = [p for p in self.players if p is not None]
@@ -772,6 +1663,7 @@ class Game:
 
     def declare_bankruptcy(self, debtor, creditor=None):
         """Remove debtor from the game, transfer assets to creditor (or bank)."""
+        self.emit(EV_BANKRUPT, debtor, creditor, -1, debtor.money)
         # 1) Liquidate improvements to the BANK at half price (Monopoly-style),
         #    add proceeds to debtor (they're about to be zeroed out anyway).
         proceeds = 0
@@ -823,15 +1715,23 @@ class Game:
         if self.pending_debt and self.pending_debt.get("player") is debtor:
             self.pending_debt = None
 
-        # 5) Remove player from the roster
-        if debtor in self.players:
-            self.players.remove(debtor)
-        else:
+        # 5) Remove player from the roster, keeping the turn with whoever has it
+        seated = debtor
+        if seated not in self.players:
             # Fallback by name if object identity differs
-            for p in list(self.players):
-                if getattr(p, "name", None) == getattr(debtor, "name", None):
-                    self.players.remove(p)
-                    break
+            seated = next((p for p in self.players
+                           if getattr(p, "name", None) == getattr(debtor, "name", None)), None)
+        if seated is not None:
+            seat = self.players.index(seated)
+            self.players.remove(seated)
+            if seat < self.current_player_index:
+                self.current_player_index -= 1
+            elif seat == self.current_player_index:
+                # the turn passes straight to whoever now sits in this seat
+                self.turn_phase = TURN_START
+            if self.players:
+                self.current_player_index %= len(self.players)
+            self.rehash()
 
         # 6) UI notice
         self.pending_bankrupt_notice = {
@@ -843,10 +1743,11 @@ class Game:
         if len(self.players) == 1:
             self.game_over = True
             self.winner = self.players[0]
-            print(f"\n--- Game Over! {self.players[0].name} is the winner! ---")
+            self.log(LOG_EVENTS, "\n--- Game Over! {} is the winner! ---", self.players[0].name)
 
     def start_debt(self, player, amount, creditor=None, reason=""):
         self.pending_debt = {"player": player, "amount": amount, "creditor": creditor, "reason": reason}
+        self.emit(EV_DEBT, player, creditor, -1, amount)
     
     def clear_debt(self):
         self.pending_debt = None
@@ -895,10 +1796,13 @@ class Game:
             p_left.get_out_of_jail_free_cards  += offer_right["gojf"]
 
         # Properties
+        self.emit(EV_TRADE, p_left, p_right, -1, offer_left["cash"] - offer_right["cash"])
         for sp in list(offer_left["props"]):
             self._transfer_property(sp, p_left, p_right)
+            self.emit(EV_TITLE, p_left, p_right, sp.index)
         for sp in list(offer_right["props"]):
             self._transfer_property(sp, p_right, p_left)
+            self.emit(EV_TITLE, p_right, p_left, sp.index)
 
         return True, "Trade complete."
 
@@ -913,9 +1817,13 @@ class Game:
         if accept and getattr(prop, "owner", None) is None and hasattr(prop, "cost") and player.money >= prop.cost:
             player.pay_money(prop.cost)
             player.add_property(prop)
-            print(f"{player.name} bought {prop.name} for ${prop.cost}.")
+            self.log(LOG_EVENTS, "{} bought {} for ${}.", player.name, prop.name, prop.cost)
+            self.emit(EV_PURCHASE, player, None, prop.index, prop.cost)
         else:
-            print(f"{player.name} skipped buying {prop.name}.")
+            self.log(LOG_EVENTS, "{} skipped buying {}.", player.name, prop.name)
+            self.pending_purchase = None
+            self.auction(prop)
+            return
 
         self.pending_purchase = None
 
@@ -940,7 +1848,7 @@ class Game:
             prop.unmortgage(player)
 
         else:
-            print(f"{player.name} skipped building on {prop.name}.")
+            self.log(LOG_EVENTS, "{} skipped building on {}.", player.name, prop.name)
         self.pending_build = None
 
     def confirm_tax(self):
@@ -949,6 +1857,7 @@ class Game:
         p = info["player"]; amt = info["amount"]
         if p.money >= amt:
             p.pay_money(amt)
+            self.emit(EV_TAX, p, None, p.position, amt)
         else:
             self.start_debt(p, amt, creditor=None, reason="Tax")
         self.pending_tax = None
@@ -960,13 +1869,140 @@ class Game:
         if p.money >= amt:
             p.pay_money(amt)
             o.collect_money(amt)
+            self.emit(EV_RENT, p, o, info["property"].index, amt)
         else:
             self.start_debt(p, amt, creditor=o, reason=f"Rent: {info['property'].name}")
         self.pending_rent = None
 
+    # ---------- headless turn engine ----------
+    def roll_and_move(self, player):
+        """One roll of a normal turn: roll, apply the doubles rule and move.
+        Returns (roll_sum, is_double, jailed); `jailed` means this was the third
+        double in a row, so the player is queued for jail without moving."""
+        roll_sum, is_double = self.dice.roll()
+        if is_double:
+            player.doubles_rolled_consecutive += 1
+            self.log(LOG_VERBOSE, "  {} rolled DOUBLES! ({} consecutive)", player.name, player.doubles_rolled_consecutive)
+            if player.doubles_rolled_consecutive >= 3:
+                self.log(LOG_EVENTS, "  {} rolled 3 doubles in a row! Go to Jail!", player.name)
+                self.emit(EV_JAIL, player)
+                self.queue_jail(player)
+                player.doubles_rolled_consecutive = 0
+                return roll_sum, True, True
+        else:
+            player.doubles_rolled_consecutive = 0
+        player.move(roll_sum, self.board)
+        return roll_sum, is_double, False
+
+    def end_turn(self):
+        """Pass the turn to the next seat."""
+        if self.players:
+            self.players[self.current_player_index].doubles_rolled_consecutive = 0
+            self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        self.turn_number += 1
+        self.turn_phase = TURN_START
+        tried = getattr(self, "_trade_attempted_this_turn", None)
+        if tried:
+            tried.clear()
+
+    def step(self, policies=None):
+        """Advance the game by one event without any UI.
+
+        Open modals are settled first: cards, rent, tax, jail notices and
+        bankruptcy notices automatically, everything else through the
+        TurnPolicy of the player who owes the decision (`policies` maps player
+        name -> TurnPolicy; missing names get the defaults). With no modal
+        open, the current turn moves one phase along (see TURN_*).
+        Returns False once the game is over."""
+        if self.game_over or not self.players:
+            return False
+        policies = policies or {}
+
+        if self._pending:
+            d = self.next_decision()
+            kind = d.kind
+            if kind == D_CARD:
+                pending = self.pending_card
+                self.last_drawn_card = None
+                self.pending_card = None
+                if pending:
+                    card = pending["card"]
+                    card.execute(pending["player"], self)
+                    deck = self.chance_cards if pending["type"] == "Chance" else self.community_chest_cards
+                    deck.put_back(card)
+            elif kind == D_RENT:
+                self.settle_rent()
+            elif kind == D_TAX:
+                self.confirm_tax()
+            elif kind == D_JAIL:
+                self.pending_jail = self.pending_jail[1:]
+                p = d.player
+                p.in_jail = True
+                p.position = self.board.jail_space_index
+                p.jail_turns = 0
+                p.doubles_rolled_consecutive = 0
+            elif kind == D_BANKRUPT_NOTICE:
+                self.pending_bankrupt_notice = None
+            else:
+                return self._decide(policies, _HOOKS[kind], d.player, _DECISIONS[kind][0])
+            return True
+
+        player = self.players[self.current_player_index % len(self.players)]
+        phase = self.turn_phase
+        if phase == TURN_START:
+            policies.get(player.name, _DEFAULT_POLICY).on_turn_start(self, player)
+            if player not in self.players:
+                return True
+            if player.in_jail:
+                self.start_jail_turn(player)
+                self.turn_phase = TURN_JAIL
+            else:
+                self.turn_phase = TURN_ROLL
+        elif phase == TURN_JAIL:
+            # Paid or used a card: roll as usual. Rolled out (and moved) or
+            # stayed in: the turn is over.
+            if player.in_jail or player.position != self.board.jail_space_index:
+                self.turn_phase = TURN_END
+            else:
+                self.turn_phase = TURN_ROLL
+        elif phase == TURN_ROLL:
+            if player.in_jail:
+                self.turn_phase = TURN_END
+            else:
+                _, is_double, jailed = self.roll_and_move(player)
+                self.turn_phase = TURN_ROLL if is_double and not jailed else TURN_END
+        else:
+            self.end_turn()
+        return True
+
+    def _decide(self, policies, hook, player, attr):
+        """Hand the modal in `attr` to `player`'s policy; settle it with the
+        default if the policy left it open."""
+        before = getattr(self, attr)
+        getattr(policies.get(player.name, _DEFAULT_POLICY), hook)(self, player)
+        if getattr(self, attr) is before and not self.game_over:
+            getattr(_DEFAULT_POLICY, hook)(self, player)
+        return True
+
+    def run_turn(self, policies=None):
+        """Play out the current player's turn (every roll and decision in it)."""
+        if not self.players:
+            return
+        player = self.players[self.current_player_index % len(self.players)]
+        turn = self.turn_number
+        while self.turn_number == turn and player in self.players and self.step(policies):
+            pass
+
+    def run_game(self, policies=None, max_turns=None):
+        """Step until someone wins or `max_turns` turns have been played."""
+        while not self.game_over and (max_turns is None or self.turn_number < max_turns):
+            if not self.step(policies):
+                break
+        return self.winner
+
     def start_game(self):
-        print("--- Monopoly Game Started! ---")
-        print(f"Players: {[p.name for p in self.players]}")
+        self.log(LOG_EVENTS, "--- Monopoly Game Started! ---")
+        self.log(LOG_EVENTS, "Players: {}", [p.name for p in self.players])
 
         self._determine_first_player()
 
@@ -974,19 +2010,19 @@ class Game:
             self.turn_number += 1
             current_player = self.players[self.current_player_index]
             
-            print(f"\n--- Turn {self.turn_number}: {current_player.name}'s Turn ---")
-            print(f"  Current money: ${current_player.money}")
-            print(f"  Properties owned: {[p.name for p in current_player.properties_owned]}")
-            print(f"  Current position: {self.board.spaces[current_player.position].name}")
+            self.log(LOG_EVENTS, "\n--- Turn {}: {}'s Turn ---", self.turn_number, current_player.name)
+            self.log(LOG_VERBOSE, "  Current money: ${}", current_player.money)
+            self.log(LOG_VERBOSE, "  Properties owned: {}", [p.name for p in current_player.properties_owned])
+            self.log(LOG_VERBOSE, "  Current position: {}", self.board.spaces[current_player.position].name)
 
             self.take_turn(current_player)
 
             # For this basic version, we'll just have a turn limit
             if self.turn_number >= 30: #ends after 30 turns
                 self.game_over = True
-                print("\n--- Game Over (Turn Limit Reached)! ---")
+                self.log(LOG_EVENTS, "\n--- Game Over (Turn Limit Reached)! ---")
                 for player in self.players:
-                    print(f"{player.name} finished with ${player.money}")
+                    self.log(LOG_EVENTS, "{} finished with ${}", player.name, player.money)
                 break # Exit the game loop
 
             # Move to the next player
@@ -994,7 +2030,7 @@ class Game:
             input("\nPress Enter to continue to next player's turn...") # Pause for user
 
     def _determine_first_player(self):
-        print("\n--- Determining First Player ---")
+        self.log(LOG_EVENTS, "\n--- Determining First Player ---")
         highest_roll = -1
         first_player_candidates = []
 
@@ -1003,12 +2039,12 @@ class Game:
         
         while True:
             current_rolls = {}
-            print("\nPlayers rolling for turn order:")
+            self.log(LOG_EVENTS, "\nPlayers rolling for turn order:")
             for player in active_players_for_roll:
                 input(f"  {player.name}, press Enter to roll for turn order...")
                 roll_sum, _ = self.dice.roll()
                 current_rolls[player] = roll_sum
-                print(f"  {player.name} rolled a {roll_sum}.")
+                self.log(LOG_EVENTS, "  {} rolled a {}.", player.name, roll_sum)
 
             max_roll_this_round = max(current_rolls.values())
             tied_players = [player for player, roll_sum in current_rolls.items() if roll_sum == max_roll_this_round]
@@ -1016,10 +2052,10 @@ class Game:
             if len(tied_players) == 1:
                 first_player = tied_players[0]
                 self.current_player_index = self.players.index(first_player)
-                print(f"\n--- {first_player.name} rolled the highest ({max_roll_this_round}) and goes first! ---")
+                self.log(LOG_EVENTS, "\n--- {} rolled the highest ({}) and goes first! ---", first_player.name, max_roll_this_round)
                 break # Exit the loop, first player determined
             else:
-                print(f"\nTie! Players {[p.name for p in tied_players]} all rolled {max_roll_this_round}. They will re-roll.")
+                self.log(LOG_EVENTS, "\nTie! Players {} all rolled {}. They will re-roll.", [p.name for p in tied_players], max_roll_this_round)
                 active_players_for_roll = tied_players # Only tied players re-roll
 
     def take_turn(self, player):
@@ -1029,33 +2065,19 @@ class Game:
             if player.in_jail: # If still in jail after handling, turn ends
                 return 
 
-        doubles_count = 0
         while True: # Loop for rolling doubles
-            roll_sum, is_double = self.dice.roll()
-            
-            if is_double:
-                doubles_count += 1
-                player.doubles_rolled_consecutive += 1
-                print(f"  {player.name} rolled DOUBLES! ({player.doubles_rolled_consecutive} consecutive)")
-                if player.doubles_rolled_consecutive == 3:
-                    print(f"  {player.name} rolled 3 doubles in a row! Go to Jail!")
-                    # enqueue consistent jail notice so UI handles it like other jail events
-                    self.pending_jail.append({"player": player})
-                    player.doubles_rolled_consecutive = 0
-                    return # Turn ends after going to jail
-            else:
-                player.doubles_rolled_consecutive = 0 # Reset if no doubles
-
-            player.move(roll_sum, self.board)
+            roll_sum, is_double, jailed = self.roll_and_move(player)
+            if jailed:
+                return # Turn ends after going to jail
 
             if not is_double:
                 break # End turn if no doubles
 
-            print(f"  {player.name} gets another roll for rolling doubles!")
+            self.log(LOG_VERBOSE, "  {} gets another roll for rolling doubles!", player.name)
 
     def handle_jail_turn(self, player):
         """Handles a player's turn while they are in Jail."""
-        print(f"  {player.name} is in Jail. Turn {player.jail_turns + 1} of 3.")
+        self.log(LOG_EVENTS, "  {} is in Jail. Turn {} of 3.", player.name, player.jail_turns + 1)
         player.jail_turns += 1
 
         #Use Get Out of Jail Free Card
@@ -1065,7 +2087,7 @@ class Game:
                 player.get_out_of_jail_free_cards -= 1
                 player.in_jail = False
                 player.jail_turns = 0
-                print(f"  {player.name} used a Get Out of Jail Free card and is now out of Jail.")
+                self.log(LOG_EVENTS, "  {} used a Get Out of Jail Free card and is now out of Jail.", player.name)
                 roll_sum, is_double = self.dice.roll()
                 player.move(roll_sum, self.board)
                 return
@@ -1083,40 +2105,40 @@ class Game:
         #             player.move(roll_sum, self.board)
         #             return 
         #     else:
-            print(f"  {player.name} does not have enough money to pay $50 fine.")
+            self.log(LOG_EVENTS, "  {} does not have enough money to pay $50 fine.", player.name)
 
         #Roll for Doubles
-        print(f"  {player.name} attempts to roll for doubles to get out of Jail...")
+        self.log(LOG_EVENTS, "  {} attempts to roll for doubles to get out of Jail...", player.name)
         roll_sum, is_double = self.dice.roll()
         if is_double:
             player.in_jail = False
             player.jail_turns = 0
-            print(f"  {player.name} rolled doubles and is now out of Jail!")
+            self.log(LOG_EVENTS, "  {} rolled doubles and is now out of Jail!", player.name)
             player.move(roll_sum, self.board)
         elif player.jail_turns >= 3:
             # If on 3rd turn and no doubles, must pay $50 (if able) or declare bankruptcy
-            print(f"  {player.name} could not roll doubles on 3rd attempt. Must pay $50.")
+            self.log(LOG_EVENTS, "  {} could not roll doubles on 3rd attempt. Must pay $50.", player.name)
             if player.money >= 50:
                 player.pay_money(50)
                 player.in_jail = False
                 player.jail_turns = 0
-                print(f"  {player.name} paid $50 and is now out of Jail.")
+                self.log(LOG_EVENTS, "  {} paid $50 and is now out of Jail.", player.name)
                 player.move(roll_sum, self.board)
             else:
-                print(f"  {player.name} cannot pay $50 and is bankrupt! Game Over for {player.name}.")
+                self.log(LOG_EVENTS, "  {} cannot pay $50 and is bankrupt! Game Over for {}.", player.name, player.name)
                 self.declare_bankruptcy(player, creditor=None)
                 if len(self.players) == 1:
                     self.game_over = True
-                    print(f"\n--- Game Over! {self.players[0].name} is the winner! ---")
+                    self.log(LOG_EVENTS, "\n--- Game Over! {} is the winner! ---", self.players[0].name)
         else:
-            print(f"  {player.name} could not roll doubles and remains in Jail.")
+            self.log(LOG_EVENTS, "  {} could not roll doubles and remains in Jail.", player.name)
 
     def start_jail_turn(self, player):
         if not getattr(player, "in_jail", False):
             return
         if not any(j.get("player") is player for j in self.pending_jail_turn):
-            self.pending_jail_turn.append({"player": player})
-            print(f"  {player.name} attempts to roll for doubles to get out of Jail...")
+            self.pending_jail_turn = self.pending_jail_turn + [{"player": player}]
+            self.log(LOG_EVENTS, "  {} attempts to roll for doubles to get out of Jail...", player.name)
 
     def _clear_player_jail_turn(self, player):
         """Remove this player's jail-turn modal item if present."""
@@ -1128,7 +2150,7 @@ class Game:
             player.get_out_of_jail_free_cards -= 1
             player.in_jail = False
             player.jail_turns = 0
-            print(f"{player.name} used a Get Out of Jail Free card and is released from Jail.")
+            self.log(LOG_EVENTS, "{} used a Get Out of Jail Free card and is released from Jail.", player.name)
         self._clear_player_jail_turn(player)
 
     def pay_fine_and_exit(self, player):
@@ -1142,7 +2164,7 @@ class Game:
                 self.start_debt(player, fine, creditor=None, reason="Jail Fine")
             player.in_jail = False
             player.jail_turns = 0
-            print(f"{player.name} paid $50 and is released from Jail.")
+            self.log(LOG_EVENTS, "{} paid $50 and is released from Jail.", player.name)
         self._clear_player_jail_turn(player)
 
     def roll_for_doubles_from_jail(self, player):
@@ -1163,7 +2185,7 @@ class Game:
             # Exit and move normally
             player.in_jail = False
             player.jail_turns = 0
-            print(f"  {player.name} rolled doubles and is released from Jail.")
+            self.log(LOG_EVENTS, "  {} rolled doubles and is released from Jail.", player.name)
             # Move per the roll that freed them
             player.move(roll_sum, self.board)
         else:
@@ -1176,12 +2198,12 @@ class Game:
                     self.start_debt(player, fine, creditor=None, reason="Jail Fine (forced)")
                 player.in_jail = False
                 player.jail_turns = 0
-                print(f"  {player.name} failed to roll doubles on the 3rd attempt, pays $50 and is released.")
+                self.log(LOG_EVENTS, "  {} failed to roll doubles on the 3rd attempt, pays $50 and is released.", player.name)
                 player.move(roll_sum, self.board)
             else:
                 # Stay in jail; increase counter
                 player.jail_turns += 1
-                print(f"  {player.name} could not roll doubles and remains in Jail.")
+                self.log(LOG_EVENTS, "  {} could not roll doubles and remains in Jail.", player.name)
 
         # Always clear the modal entry after resolving this click/choice
         self._clear_player_jail_turn(player)
@@ -1192,12 +2214,12 @@ class Game:
         """
         # Restrict initiating to the current player’s turn
         if left is not self.players[self.current_player_index]:
-            print(f"Invalid trade: {left.name} tried to start a trade outside their turn.")
+            self.log(LOG_EVENTS, "Invalid trade: {} tried to start a trade outside their turn.", left.name)
             return False
 
         # Prevent trades with yourself
         if left is right:
-            print("Invalid trade: cannot trade with yourself.")
+            self.log(LOG_EVENTS, "Invalid trade: cannot trade with yourself.")
             return False
 
         self.pending_trade = {
@@ -1287,28 +2309,19 @@ class Game:
         Return True if, after applying (get/give) for 'who', they would own
         *all* properties of any color group.
         """
-        # Start from current owned set (properties only)
-        owned_after = {sp for sp in who.properties_owned if getattr(sp, "type", "") == "Property"}
-
-        # Remove what 'who' would give
-        for sp in offer_give.get("props", []):
-            if getattr(sp, "type", "") == "Property" and sp in owned_after:
-                owned_after.remove(sp)
-
-        # Add what 'who' would receive
-        for sp in offer_get.get("props", []):
-            if getattr(sp, "type", "") == "Property":
-                owned_after.add(sp)
-
-        # Build color groups on the board
-        groups = {}
-        for sp in self.board.spaces:
-            if getattr(sp, "type", "") == "Property":
-                groups.setdefault(getattr(sp, "color_group", None), []).append(sp)
-
-        # If any color group (size >=2) is fully in owned_after, it's a monopoly
-        for color, group in groups.items():
-            if len(group) >= 2 and all(sp in owned_after for sp in group):
+        give = {sp for sp in offer_give.get("props", []) if sp.type == "Property"}
+        get = {sp for sp in offer_get.get("props", []) if sp.type == "Property"}
+        gained = {}
+        for sp in get:
+            gained[sp.color_group] = gained.get(sp.color_group, 0) + 1
+
+        # If any color group (size >=2) is fully owned afterwards, it's a monopoly.
+        # The counters rule out most groups before looking at individual titles.
+        spaces = self.board.spaces
+        for color, idx in self.board.color_groups.items():
+            if len(idx) < 2 or who.group_counts.get(color, 0) + gained.get(color, 0) < len(idx):
+                continue
+            if all(spaces[i] in get or (spaces[i].owner is who and spaces[i] not in give) for i in idx):
                 return True
         return False
 
@@ -1317,21 +2330,14 @@ class Game:
         Return True if, after applying (get/give) for 'who', they would break a 2-of-a-color
         pair they currently hold, AND they do not gain any monopoly from this deal.
         """
-        # Count current color ownership
-        cur_counts = {}
-        for sp in who.properties_owned:
-            if getattr(sp, "type", "") == "Property":
-                col = getattr(sp, "color_group", None)
-                cur_counts[col] = cur_counts.get(col, 0) + 1
-
         # Which colors are currently pairs (== 2)
-        current_pairs = {c for c, n in cur_counts.items() if n == 2}
+        current_pairs = {c for c, n in who.group_counts.items() if n == 2}
 
         # If we wouldn’t gain a monopoly, breaking a pair is bad
         if not self.would_grant_monopoly(who, offer_get, offer_give):
             # Are we giving away anything from a current pair?
             for sp in offer_give.get("props", []):
-                if getattr(sp, "type", "") == "Property":
+                if sp.type == "Property":
                     if getattr(sp, "color_group", None) in current_pairs:
                         return True
         return False
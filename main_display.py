@@ -46,10 +46,12 @@ board_center = (board_size//2, board_size//2)
 
 # --- Global popup delay (ms). You can override at runtime via env or by passing a param to running_display ---
 DEFAULT_POPUP_DELAY_MS = int(os.getenv("POPUP_DELAY_MS", "800"))  # set to "0" for instant
+# Wall-clock cap per AI search, so a decision never stalls a frame for long
+AI_THINK_MS = float(os.getenv("AI_THINK_MS", "15"))
 
 def running_display(player_names: list[str], popup_delay_ms: int | None = None):
     game = Game(player_names=player_names)
-    bot = MCTSMonopolyBot(name_prefix="AI")  # instantiate once
+    bot = MCTSMonopolyBot(name_prefix="AI", rng=game.spawn_rng())  # instantiate once
     game._trade_attempted_this_turn = set()
 
     def _same_player(a, b):
@@ -207,10 +209,7 @@ def running_display(player_names: list[str], popup_delay_ms: int | None = None):
                     ai_jail_turn_started_at = now
                 elif now - ai_jail_turn_started_at >= AUTO_DELAY_MS:
                     # --- Phase detection by board saturation ---
-                    props = [s for s in game.board.spaces if getattr(s, "type", "") == "Property"]
-                    total_props = len(props) or 1
-                    owned_props = sum(1 for s in props if getattr(s, "owner", None) is not None)
-                    owned_ratio = owned_props / total_props
+                    owned_ratio = game.board.owned_ratio()
                     EARLY = owned_ratio < 0.50
                     forced_third = (cur.jail_turns >= 2)
 
@@ -369,9 +368,9 @@ def running_display(player_names: list[str], popup_delay_ms: int | None = None):
                         continue
 
                     if pending_card["type"] == "Chance":
-                        game.chance_cards.append(card)
+                        game.chance_cards.put_back(card)
                     else:
-                        game.community_chest_cards.append(card)
+                        game.community_chest_cards.put_back(card)
 
             # 3) Rent
             if game.pending_rent and ai_rent_started_at is not None and elapsed(ai_rent_started_at):
@@ -390,10 +389,7 @@ def running_display(player_names: list[str], popup_delay_ms: int | None = None):
                     ai_jail_turn_started_at = now
                 elif now - ai_jail_turn_started_at >= AUTO_DELAY_MS:
                     # Phase detection
-                    props = [s for s in game.board.spaces if getattr(s, "type", "") == "Property"]
-                    total_props = len(props) or 1
-                    owned_props = sum(1 for s in props if getattr(s, "owner", None) is not None)
-                    EARLY = (owned_props / total_props) < 0.50
+                    EARLY = game.board.owned_ratio() < 0.50
                     forced_third = (cur.jail_turns >= 2)
 
                     acted = False
@@ -557,9 +553,9 @@ def running_display(player_names: list[str], popup_delay_ms: int | None = None):
                             player_card = pending_card["player"]
                             card.execute(player_card, game)
                             if pending_card["type"] == "Chance":
-                                game.chance_cards.append(card)
+                                game.chance_cards.put_back(card)
                             else:
-                                game.community_chest_cards.append(card)
+                                game.community_chest_cards.put_back(card)
                     continue  # block other clicks this frame
 
                 # Rent
@@ -1008,23 +1004,15 @@ def running_display(player_names: list[str], popup_delay_ms: int | None = None):
 
                 # If you haven't rolled yet or you have doubles, you can roll again
                 if (not has_rolled or is_doubles) and not player.in_jail:
-                    roll_total, is_doubles = game.dice.roll()
+                    roll_total, is_doubles, jailed = game.roll_and_move(player)
                     has_rolled = True
                     rolled = (game.dice.die1_value, game.dice.die2_value)
-                    player.move(roll_total, game.board)
-
-                # What to do if there are doubles
-                if is_doubles:
-                    player.doubles_rolled_consecutive += 1
-                    if player.doubles_rolled_consecutive == 3:
-                        print(f"{player.name} rolled 3 doubles! Go to jail.")
-                        game.pending_jail.append({"player": player})
-                        player.doubles_rolled_consecutive = 0
+
+                    # Third double in a row: straight to jail
+                    if jailed:
                         rolled = None
                         is_doubles = False
                         has_rolled = False
-                else:
-                    player.doubles_rolled_consecutive = 0
 
         # Draw the Board
         space_rects = board_game(screen, text_font, board_size, corner_size, space_size)
@@ -1057,12 +1045,15 @@ def running_display(player_names: list[str], popup_delay_ms: int | None = None):
                 game.pending_bankrupt_notice or game.pending_trade
             )
             if not modals_open:
-                intent = bot.step(game, current_player, iterations=600)
+                intent = bot.step(game, current_player, iterations=600, budget_ms=AI_THINK_MS)
                 if intent.get("want_roll") and enable_dice:
-                    roll_total, is_doubles = game.dice.roll()
+                    roll_total, is_doubles, jailed = game.roll_and_move(current_player)
                     has_rolled = True
                     rolled = (game.dice.die1_value, game.dice.die2_value)
-                    current_player.move(roll_total, game.board)
+                    if jailed:
+                        rolled = None
+                        is_doubles = False
+                        has_rolled = False
 
             # End turn automatically if allowed
             if (has_rolled and (not is_doubles) and not (
@@ -1123,9 +1114,9 @@ def running_display(player_names: list[str], popup_delay_ms: int | None = None):
                         c = pending["card"]; pl = pending["player"]
                         c.execute(pl, game)
                         if pending["type"] == "Chance":
-                            game.chance_cards.append(c)
+                            game.chance_cards.put_back(c)
                         else:
-                            game.community_chest_cards.append(c)
+                            game.community_chest_cards.put_back(c)
             else:
                 # Human: click to continue (mouse handler already enforces delay via ready(human_card_started_at))
                 if human_card_started_at is None:
@@ -1224,10 +1215,7 @@ def running_display(player_names: list[str], popup_delay_ms: int | None = None):
                         f"jail_turns={cur.jail_turns}, money={cur.money}, "
                         f"GOJF={cur.get_out_of_jail_free_cards}, in_jail={cur.in_jail}")
                     # --- Phase detection: early vs late game
-                    props = [s for s in game.board.spaces if getattr(s, "type", "") == "Property"]
-                    total_props = len(props) or 1
-                    owned_props = sum(1 for s in props if getattr(s, "owner", None) is not None)
-                    owned_ratio = owned_props / total_props
+                    owned_ratio = game.board.owned_ratio()
                     EARLY = owned_ratio < 0.50
                     forced_third = (cur.jail_turns >= 2)
 
@@ -0,0 +1,224 @@
+# markov.py
+"""
+Exact landing probabilities for the 40-space board.
+
+The chain runs over roll events. A state is either (position, doubles rolled
+so far this turn) or "in jail after k failed attempts". Every roll covers:
+- the 36 dice outcomes, with a third double sending the player straight to jail
+- GoToJail
+- the real Chance / Community Chest cards from Game._initialize_cards, drawn
+  uniformly. "Go back 3" can land on Community Chest and draw again.
+- a jail policy:
+  - "short" pays out at once and rolls normally
+  - "long" rolls for doubles and pays on the third miss, like
+    Game.roll_for_doubles_from_jail
+
+landing_table() gives, per space, the expected number of landings per turn
+(card moves count as landings on their destination). Tables are cached in
+memory and on disk (.cache/ next to this file). The cache key covers the board
+and card definitions, so editing either rebuilds the table.
+
+    python markov.py            # print the table for both jail policies
+"""
+from __future__ import annotations
+import hashlib, json, os
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from game import Game, LOG_QUIET
+
+N = 40
+JAIL_POLICIES = ("short", "long")
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+_JAILED = -1  # resolved destination meaning "sent to jail"
+
+
+def _reference_game() -> Game:
+    return Game(["A", "B"], verbosity=LOG_QUIET, seed=0)
+
+
+def _fingerprint(game: Game) -> str:
+    spec = [(sp.index, sp.type) for sp in game.board.spaces]
+    spec += [(c.card_type, c.action_type, c.target_space_index) for c in game.card_catalog]
+    return hashlib.sha1(repr(spec).encode()).hexdigest()[:12]
+
+
+def _card_moves(game: Game) -> Dict[str, List[object]]:
+    """Per deck: one entry per card, the move_to target (int), _JAILED, or None."""
+    decks: Dict[str, List[object]] = {"Chance": [], "Community Chest": []}
+    for c in game.card_catalog:
+        if c.action_type == "move_to":
+            decks[c.card_type].append(c.target_space_index)
+        elif c.action_type == "go_to_jail":
+            decks[c.card_type].append(_JAILED)
+        else:
+            decks[c.card_type].append(None)
+    return decks
+
+
+def _resolve(pos: int, kinds: List[str], cards: Dict[str, List[object]]
+             ) -> List[Tuple[float, int, Tuple[int, ...]]]:
+    """Where a player who lands on `pos` ends up: [(prob, final, landings)].
+    `final` is _JAILED for anything that sends them to jail."""
+    kind = kinds[pos]
+    if kind == "GoToJail":
+        return [(1.0, _JAILED, (pos,))]
+    if kind not in cards:
+        return [(1.0, pos, (pos,))]
+    deck = cards[kind]
+    p = 1.0 / len(deck)
+    out = []
+    for move in deck:
+        if move is None:
+            out.append((p, pos, (pos,)))
+        elif move == _JAILED:
+            out.append((p, _JAILED, (pos,)))
+        else:
+            dest = (pos - 3) % N if move == -3 else move
+            for q, final, landed in _resolve(dest, kinds, cards):
+                out.append((p * q, final, (pos,) + landed))
+    return out
+
+
+def _solve(game: Game, jail_policy: str) -> List[float]:
+    if jail_policy not in JAIL_POLICIES:
+        raise ValueError(f"jail_policy must be one of {JAIL_POLICIES}")
+    kinds = [sp.type for sp in game.board.spaces]
+    cards = _card_moves(game)
+    jail = game.board.jail_space_index
+    resolved = [_resolve(pos, kinds, cards) for pos in range(N)]
+
+    # states 0..3N-1: pos * 3 + doubles so far; 3N + k: in jail, k misses
+    n_states = 3 * N + 3
+    J0 = 3 * N
+    trans: List[List[Tuple[float, int, Tuple[int, ...]]]] = [[] for _ in range(n_states)]
+
+    def roll_from(pos, doubles):
+        for d1 in range(1, 7):
+            for d2 in range(1, 7):
+                is_double = d1 == d2
+                if is_double and doubles == 2:
+                    yield 1 / 36, J0, ()
+                    continue
+                for q, final, landed in resolved[(pos + d1 + d2) % N]:
+                    if final == _JAILED:
+                        nxt = J0
+                    elif is_double:
+                        nxt = final * 3 + doubles + 1
+                    else:
+                        nxt = final * 3
+                    yield q / 36, nxt, landed
+
+    for pos in range(N):
+        for d in range(3):
+            trans[pos * 3 + d] = list(roll_from(pos, d))
+    for k in range(3):
+        if jail_policy == "short":
+            trans[J0 + k] = list(roll_from(jail, 0))
+            continue
+        # doubles release and move (no extra roll); a third miss pays and moves
+        rows = []
+        for d1 in range(1, 7):
+            for d2 in range(1, 7):
+                if d1 == d2 or k == 2:
+                    for q, final, landed in resolved[(jail + d1 + d2) % N]:
+                        rows.append((q / 36, J0 if final == _JAILED else final * 3, landed))
+                else:
+                    rows.append((1 / 36, J0 + k + 1, ()))
+        trans[J0 + k] = rows
+
+    # power iteration to the stationary distribution over roll events
+    pi = [1.0 / n_states] * n_states
+    for _ in range(2000):
+        nxt = [0.0] * n_states
+        for s, row in enumerate(trans):
+            w = pi[s]
+            if w:
+                for p, t, _ in row:
+                    nxt[t] += w * p
+        delta = max(abs(a - b) for a, b in zip(nxt, pi))
+        pi = nxt
+        if delta < 1e-13:
+            break
+
+    landings = [0.0] * N
+    for s, row in enumerate(trans):
+        for p, _, landed in row:
+            for i in landed:
+                landings[i] += pi[s] * p
+    # a turn starts in every no-doubles-yet state and every jail state
+    turns = sum(pi[pos * 3] for pos in range(N)) + sum(pi[J0:])
+    return [x / turns for x in landings]
+
+
+@lru_cache(maxsize=None)
+def landing_table(jail_policy: str = "long") -> Tuple[float, ...]:
+    """Expected landings per turn on each space (index = board index)."""
+    game = _reference_game()
+    key = _fingerprint(game)
+    path = os.path.join(CACHE_DIR, f"landing_{jail_policy}_{key}.json")
+    try:
+        with open(path) as f:
+            return tuple(json.load(f))
+    except (OSError, ValueError):
+        pass
+    table = _solve(game, jail_policy)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(table, f)
+    except OSError:
+        pass  # read-only checkout: just keep it in memory
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def roll_landings(pos: int) -> Tuple[Tuple[float, int, int], ...]:
+    """Every landing the next roll from `pos` can cause, as
+    (probability, space index, dice sum). Card moves are followed, so one
+    roll can land twice; a third double is not modelled."""
+    game = _reference_game()
+    kinds = [sp.type for sp in game.board.spaces]
+    cards = _card_moves(game)
+    acc: Dict[Tuple[int, int], float] = {}
+    for d1 in range(1, 7):
+        for d2 in range(1, 7):
+            roll = d1 + d2
+            for q, _, landed in _resolve((pos + roll) % N, kinds, cards):
+                for i in landed:
+                    acc[(i, roll)] = acc.get((i, roll), 0.0) + q / 36
+    return tuple((p, i, roll) for (i, roll), p in sorted(acc.items()))
+
+
+def landing_probability(index: int, jail_policy: str = "long") -> float:
+    return landing_table(jail_policy)[index]
+
+
+def expected_rent_per_turn(space, rent: float, jail_policy: str = "long") -> float:
+    """What `rent` on `space` is worth per opponent turn."""
+    return landing_table(jail_policy)[space.index] * rent
+
+
+@lru_cache(maxsize=None)
+def color_weights(jail_policy: str = "long") -> Dict[tuple, float]:
+    """Payback speed of each color group built to three houses (expected rent
+    per turn over title + house outlay), scaled so the average group is 1.0."""
+    board = _reference_game().board
+    table = landing_table(jail_policy)
+    roi = {}
+    for color, idx in board.color_groups.items():
+        group = [board.spaces[i] for i in idx]
+        earn = sum(table[sp.index] * sp.rent_values[3] for sp in group)
+        outlay = sum(sp.cost + 3 * sp.house_cost for sp in group)
+        roi[color] = earn / outlay
+    mean = sum(roi.values()) / len(roi)
+    return {color: round(r / mean, 3) for color, r in roi.items()}
+
+
+if __name__ == "__main__":
+    game = _reference_game()
+    short, long_ = landing_table("short"), landing_table("long")
+    print(f"{'space':28s} {'short':>7s} {'long':>7s}")
+    for sp in game.board.spaces:
+        print(f"{sp.name:28s} {short[sp.index]:7.4f} {long_[sp.index]:7.4f}")
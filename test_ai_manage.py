@@ -1,5 +1,5 @@
 # test_ai_manage.py
-from ai_manage import AIMonopolyPropertyManager
+from ai_manage import AIMonopolyPropertyManager, rent_table
 from game import Game, Property, Railroad, Utility
 
 def find_props(game, names):
@@ -145,9 +145,37 @@ def test_4_avoid_actions_when_modals_open():
     assert all(p.num_houses == 0 for p in (orient, vermont, connect)), "Should not act while modal is open"
     print("✅ Passed: manager does nothing while modals are open.")
 
+def test_5_rent_table_tracks_board_changes():
+    print("\n=== Test 5: Rent table is reused until houses/mortgages/owners change ===")
+    game = Game(["AI 1", "HUMAN"])
+    ai, hu = game.players
+    orient, vermont, connect = find_props(game, ["Oriental Avenue", "Vermont Avenue", "Connecticut Avenue"])
+    mark_owner(hu, orient, vermont, connect)
+
+    table = rent_table(game)
+    assert table.threat(ai) == 16 and table.threat(hu) == 0   # unimproved monopoly doubles
+    assert rent_table(game) is table and table.version == game.board.version
+
+    connect.num_houses = 3
+    assert rent_table(game).threat(ai) == 300
+    connect.is_mortgaged = True
+    assert rent_table(game).threat(ai) == 12
+
+    # From Reading Railroad (5), a 1..7 roll can hit the three light blues
+    ai.position = 5
+    exp = rent_table(game).expected_next_roll(ai)
+    assert 0 < exp < 12
+
+    sim = game.clone()
+    sim.board.spaces[8].num_houses = 4
+    assert rent_table(sim).threat(sim.players[0]) == 400
+    assert rent_table(game).threat(ai) == 12
+    print("✅ Passed: rent table invalidates on board changes only.")
+
 if __name__ == "__main__":
     test_1_build_even_to_three()
     test_2_respect_buffer_no_build()
     test_3_mortgage_non_core_first()
     test_4_avoid_actions_when_modals_open()
+    test_5_rent_table_tracks_board_changes()
     print("\nAll tests ran.\n")